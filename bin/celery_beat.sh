@@ -4,6 +4,9 @@ set -e
 
 LOGLEVEL=${CELERY_LOGLEVEL:-INFO}
 
+# Configure the connection pool for the beat process
+export DB_POOL_ROLE="${DB_POOL_ROLE:-beat}"
+
 # Set defaults for OTEL
 export OTEL_SERVICE_NAME="${OTEL_SERVICE_NAME:-openvtb-scheduler}"
 
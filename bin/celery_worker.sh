@@ -8,6 +8,9 @@ CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-1}
 QUEUE=${CELERY_WORKER_QUEUE:=celery}
 WORKER_NAME=${CELERY_WORKER_NAME:="${QUEUE}"@%n}
 
+# Configure the connection pool for a worker process
+export DB_POOL_ROLE="${DB_POOL_ROLE:-worker}"
+
 # Set defaults for OTEL
 export OTEL_SERVICE_NAME="${OTEL_SERVICE_NAME:-openvtb-worker-"${QUEUE}"}"
 
@@ -27,6 +27,9 @@ done
 
 >&2 echo "Database is up."
 
+# Configure the connection pool for a web process
+export DB_POOL_ROLE="${DB_POOL_ROLE:-web}"
+
 # Set defaults for OTEL
 export OTEL_SERVICE_NAME="${OTEL_SERVICE_NAME:-openvtb}"
 
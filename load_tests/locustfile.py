@@ -0,0 +1,269 @@
+"""
+Load test scenarios for Open VTB.
+
+The scenarios expect a database filled with the ``generate_load_test_data``
+management command and an API token, for example::
+
+    src/manage.py generate_load_test_data --seed 1
+    OPENVTB_LOAD_TEST_TOKEN=<token> locust -f load_tests/locustfile.py \\
+        --host http://localhost:8000
+
+Scenarios:
+
+* ``PortalUser``: citizens polling their taken and berichten in a portal.
+* ``IntakeUser``: bursts of newly submitted verzoeken, formuliertaken and
+  berichten.
+* ``SchedulerUser``: the periodic tasks that send the taken and berichten
+  events. These run in-process, so they need the Django settings of the
+  environment under test (``DJANGO_SETTINGS_MODULE`` and the database
+  configuration).
+
+At the end of a run the p50/p95/p99 response times per request are printed.
+"""
+
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+from locust import HttpUser, User, between, events, task
+
+TOKEN = os.getenv("OPENVTB_LOAD_TEST_TOKEN", "")
+# must match ``--ontvangers`` of the ``generate_load_test_data`` command
+ONTVANGERS = int(os.getenv("OPENVTB_LOAD_TEST_ONTVANGERS", "50000"))
+ONTVANGER_URN = "urn:nld:brp:bsn:{:09d}"
+LOAD_TEST_VERZOEKTYPE = "load-test"
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def pick_ontvanger() -> str:
+    # skewed towards the "busy" ontvangers, like the generated data set
+    index = min(int(random.paretovariate(1.2)) - 1, ONTVANGERS - 1)
+    return ONTVANGER_URN.format(index)
+
+
+class OpenVTBUser(HttpUser):
+    abstract = True
+
+    def on_start(self):
+        self.client.headers["Authorization"] = f"Token {TOKEN}"
+
+
+class PortalUser(OpenVTBUser):
+    weight = 10
+    wait_time = between(2, 10)
+
+    def on_start(self):
+        super().on_start()
+        self.ontvanger = pick_ontvanger()
+
+    @task(5)
+    def open_taken(self):
+        response = self.client.get(
+            "/taken/api/v1/externetaken",
+            params={"isToegewezenAan": self.ontvanger, "status": "open"},
+            name="/taken/api/v1/externetaken?isToegewezenAan&status",
+        )
+        if response.ok and (results := response.json()["results"]):
+            self.client.get(results[0]["url"], name="/taken/api/v1/externetaken/{uuid}")
+
+    @task(3)
+    def ongelezen_berichten(self):
+        self.client.get(
+            "/berichten/api/v1/berichten",
+            params={"ontvanger": self.ontvanger, "geopendOp__isnull": True},
+            name="/berichten/api/v1/berichten?ontvanger&geopendOp__isnull",
+        )
+
+    @task(1)
+    def alle_berichten(self):
+        response = self.client.get(
+            "/berichten/api/v1/berichten",
+            params={"ontvanger": self.ontvanger},
+            name="/berichten/api/v1/berichten?ontvanger",
+        )
+        if response.ok and (results := response.json()["results"]):
+            self.client.get(
+                results[0]["url"], name="/berichten/api/v1/berichten/{uuid}"
+            )
+
+    @task(1)
+    def verzoeken(self):
+        self.client.get(
+            "/verzoeken/api/v1/verzoeken",
+            params={"initiator": self.ontvanger},
+            name="/verzoeken/api/v1/verzoeken?initiator",
+        )
+
+
+class IntakeUser(OpenVTBUser):
+    """
+    Submits a burst of requests and then goes quiet for a while, like form
+    submissions after a mailing.
+    """
+
+    weight = 2
+    wait_time = between(30, 120)
+    burst_size = 20
+
+    def on_start(self):
+        super().on_start()
+        response = self.client.get(
+            "/verzoeken/api/v1/verzoektypen",
+            params={"naam": LOAD_TEST_VERZOEKTYPE},
+            name="/verzoeken/api/v1/verzoektypen?naam",
+        )
+        self.verzoek_type = response.json()["results"][0]["url"]
+
+    @task
+    def burst(self):
+        for _ in range(self.burst_size):
+            self.create_verzoek()
+            self.create_formuliertaak()
+            self.create_bericht()
+
+    def create_verzoek(self):
+        self.client.post(
+            "/verzoeken/api/v1/verzoeken",
+            json={
+                "verzoekType": self.verzoek_type,
+                "geometrie": {
+                    "type": "Point",
+                    "coordinates": [random.uniform(4, 7), random.uniform(51, 53.3)],
+                },
+                "aanvraagGegevens": {
+                    "omschrijving": "Melding openbare ruimte",
+                    "regels": [
+                        {"volgnummer": index, "code": f"CODE-{index:04d}"}
+                        for index in range(50)
+                    ],
+                },
+                "initiator": pick_ontvanger(),
+                "kanaal": "webformulier",
+            },
+        )
+
+    def create_formuliertaak(self):
+        self.client.post(
+            "/taken/api/v1/formuliertaken",
+            json={
+                "titel": "Aanvullende gegevens",
+                "einddatumHandelingsTermijn": (
+                    date.today() + timedelta(days=14)
+                ).isoformat(),
+                "isToegewezenAan": pick_ontvanger(),
+                "details": {
+                    "formulierDefinitie": {
+                        "display": "form",
+                        "components": [
+                            {
+                                "type": "textfield",
+                                "label": f"Veld {index}",
+                                "key": f"veld{index}",
+                                "input": True,
+                            }
+                            for index in range(25)
+                        ],
+                    },
+                    "voorinvullenGegevens": {"veld0": "Test"},
+                },
+            },
+        )
+
+    def create_bericht(self):
+        with self.client.post(
+            "/berichten/api/v1/berichten",
+            json={
+                "onderwerp": "Uw aanvraag",
+                "berichtTekst": "Lorem ipsum dolor sit amet.",
+                "ontvanger": pick_ontvanger(),
+                "handelingsPerspectief": "informatie_krijgen",
+                "mijnOverheidBerichtenbox": False,
+                "referentie": uuid.uuid4().hex[:25],
+            },
+            catch_response=True,
+        ) as response:
+            if response.status_code != 201:
+                response.failure(
+                    f"Expected 201, got {response.status_code}: {response.text[:200]}"
+                )
+
+
+class SchedulerUser(User):
+    """
+    Runs the periodic tasks in-process and reports their duration, so the
+    effect of the concurrent API load on the scheduler runs is visible. The jobs
+    for the due planned events run about every minute, the full scans about every
+    ten minutes.
+    """
+
+    weight = 1
+    fixed_count = 1
+    wait_time = between(30, 30)
+
+    def on_start(self):
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "openvtb.conf.dev")
+
+        import django
+
+        django.setup()
+
+    def run_task(self, name: str, func) -> None:
+        start = time.perf_counter()
+        exception = None
+        try:
+            func()
+        except Exception as exc:  # noqa: BLE001 - reported as a failed request
+            exception = exc
+        self.environment.events.request.fire(
+            request_type="task",
+            name=name,
+            response_time=(time.perf_counter() - start) * 1000,
+            response_length=0,
+            exception=exception,
+            context={},
+        )
+
+    @task(1)
+    def send_taak_events(self):
+        from openvtb.components.taken.tasks import send_taak_events
+
+        self.run_task("send_taak_events", send_taak_events)
+
+    @task(1)
+    def send_berichten_events(self):
+        from openvtb.components.berichten.tasks import send_berichten_events
+
+        self.run_task("send_berichten_events", send_berichten_events)
+
+    @task(10)
+    def send_due_taak_events(self):
+        from openvtb.components.taken.tasks import send_due_taak_events
+
+        self.run_task("send_due_taak_events", send_due_taak_events)
+
+    @task(10)
+    def send_due_berichten_events(self):
+        from openvtb.components.berichten.tasks import send_due_berichten_events
+
+        self.run_task("send_due_berichten_events", send_due_berichten_events)
+
+
+@events.quitting.add_listener
+def report_percentiles(environment, **kwargs):
+    stats = environment.runner.stats
+    lines = [f"{'Type':<8} {'Name':<70} {'#':>8} {'p50':>8} {'p95':>8} {'p99':>8}"]
+    for entry in sorted(stats.entries.values(), key=lambda e: (e.method, e.name)):
+        percentiles = " ".join(
+            f"{entry.get_response_time_percentile(percentile):>8.0f}"
+            for percentile in PERCENTILES
+        )
+        lines.append(
+            f"{entry.method:<8} {entry.name:<70} {entry.num_requests:>8} {percentiles}"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
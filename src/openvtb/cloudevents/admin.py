@@ -0,0 +1,36 @@
+from django.contrib import admin, messages
+from django.utils.translation import gettext_lazy as _, ngettext
+
+from .models import DeadLetterCloudEvent
+from .tasks import replay_dead_letter_cloudevents
+
+
+@admin.register(DeadLetterCloudEvent)
+class DeadLetterCloudEventAdmin(admin.ModelAdmin):
+    list_display = ("type", "subject", "failed_at", "reason")
+    list_filter = ("type", "failed_at")
+    search_fields = ("subject", "uuid")
+    date_hierarchy = "failed_at"
+    readonly_fields = ("uuid", "cloudevent", "type", "subject", "reason", "failed_at")
+    actions = ["replay"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.action(description=_("Replay the selected CloudEvents"))
+    def replay(self, request, queryset):
+        pks = list(queryset.values_list("pk", flat=True))
+        replay_dead_letter_cloudevents.delay({"pk__in": pks})
+
+        self.message_user(
+            request,
+            ngettext(
+                "{count} CloudEvent is scheduled to be sent again.",
+                "{count} CloudEvents are scheduled to be sent again.",
+                len(pks),
+            ).format(count=len(pks)),
+            level=messages.SUCCESS,
+        )
@@ -0,0 +1,29 @@
+from vng_api_common.filtersets import FilterSet
+
+from ..models import DeadLetterCloudEvent
+
+
+class DeadLetterCloudEventFilter(FilterSet):
+    class Meta:
+        model = DeadLetterCloudEvent
+        fields = {
+            "type": ["exact"],
+            "subject": ["exact"],
+            "failed_at": ["gte", "lte"],
+        }
+
+    def get_lookups(self) -> dict[str, str]:
+        """
+        The model lookups of the applied filters, with JSON serializable values to
+        pass them to a Celery task.
+        """
+        lookups = {}
+        for name, value in self.form.cleaned_data.items():
+            if value in (None, ""):
+                continue
+            model_filter = self.filters[name]
+            lookup = f"{model_filter.field_name}__{model_filter.lookup_expr}"
+            lookups[lookup] = (
+                value.isoformat() if hasattr(value, "isoformat") else value
+            )
+        return lookups
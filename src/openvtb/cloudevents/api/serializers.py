@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from ..models import DeadLetterCloudEvent
+
+
+class DeadLetterCloudEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DeadLetterCloudEvent
+        fields = (
+            "uuid",
+            "type",
+            "subject",
+            "reason",
+            "failed_at",
+            "cloudevent",
+        )
+
+
+class ReplaySerializer(serializers.Serializer):
+    count = serializers.IntegerField(
+        help_text="Number of CloudEvents which are scheduled to be sent again."
+    )
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openvtb.accounts.tests.factories import TokenFactory
+
+from ...models import DeadLetterCloudEvent
+
+EVENT_TYPE = "nl.overheid.taken.externetaak-herinnerd"
+
+
+def create_dead_letter(
+    subject: str, event_type: str = EVENT_TYPE
+) -> DeadLetterCloudEvent:
+    return DeadLetterCloudEvent.objects.create(
+        cloudevent={"id": subject, "type": event_type, "subject": subject},
+        type=event_type,
+        subject=subject,
+        reason="HTTP 503",
+    )
+
+
+class DeadLetterCloudEventApiTestCase(APITestCase):
+    list_url = reverse("cloudevents:deadlettercloudevent-list")
+    replay_url = reverse("cloudevents:deadlettercloudevent-replay")
+
+    def setUp(self):
+        super().setUp()
+        token = TokenFactory.create(user__staff=True)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
+
+    def test_list(self):
+        dead_letter = create_dead_letter("1")
+
+        response = self.client.get(self.list_url, {"type": EVENT_TYPE})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["uuid"], str(dead_letter.uuid))
+
+    def test_no_staff(self):
+        token = TokenFactory.create()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("openvtb.cloudevents.api.viewsets.replay_dead_letter_cloudevents.delay")
+    def test_replay(self, mock_replay):
+        create_dead_letter("1")
+        last = create_dead_letter("2")
+        create_dead_letter("3", event_type="nl.overheid.berichten.bericht-gepubliceerd")
+
+        response = self.client.post(f"{self.replay_url}?type={EVENT_TYPE}")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["count"], 2)
+        mock_replay.assert_called_once_with(
+            {"type__exact": EVENT_TYPE, "pk__lte": last.pk}
+        )
+
+    @patch("openvtb.cloudevents.api.viewsets.replay_dead_letter_cloudevents.delay")
+    def test_replay_nothing(self, mock_replay):
+        response = self.client.post(self.replay_url)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["count"], 0)
+        mock_replay.assert_not_called()
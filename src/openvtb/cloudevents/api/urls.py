@@ -0,0 +1,15 @@
+from django.urls import include, re_path
+
+from vng_api_common import routers
+
+from .viewsets import DeadLetterCloudEventViewSet
+
+app_name = "cloudevents"
+
+router = routers.DefaultRouter()
+router.register("dead-letters", DeadLetterCloudEventViewSet)
+
+
+urlpatterns = [
+    re_path(r"^v(?P<version>\d+)/", include(router.urls)),
+]
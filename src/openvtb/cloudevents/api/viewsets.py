@@ -0,0 +1,69 @@
+from django.utils.translation import gettext_lazy as _
+
+import structlog
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from vng_api_common.pagination import DynamicPageSizePagination
+
+from ..models import DeadLetterCloudEvent
+from ..tasks import replay_dead_letter_cloudevents
+from .filters import DeadLetterCloudEventFilter
+from .serializers import DeadLetterCloudEventSerializer, ReplaySerializer
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@extend_schema_view(
+    list=extend_schema(
+        summary=_("Vraag alle niet verstuurde CloudEvents aan."),
+        description=_("Vraag alle niet verstuurde CloudEvents aan."),
+    ),
+    retrieve=extend_schema(
+        summary=_("Een specifiek niet verstuurd CloudEvent opvragen."),
+        description=_("Een specifiek niet verstuurd CloudEvent opvragen."),
+    ),
+    destroy=extend_schema(
+        summary=_("Een niet verstuurd CloudEvent verwijderen."),
+        description=_("Een niet verstuurd CloudEvent verwijderen."),
+    ),
+)
+class DeadLetterCloudEventViewSet(
+    mixins.DestroyModelMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
+    queryset = DeadLetterCloudEvent.objects.order_by("pk")
+    serializer_class = DeadLetterCloudEventSerializer
+    pagination_class = DynamicPageSizePagination
+    permission_classes = (IsAdminUser,)
+    lookup_field = "uuid"
+    filterset_class = DeadLetterCloudEventFilter
+
+    @extend_schema(
+        summary=_("Verstuur de niet verstuurde CloudEvents opnieuw."),
+        description=_(
+            "Verstuur de (gefilterde) niet verstuurde CloudEvents opnieuw, met ten "
+            "hoogste `CLOUDEVENTS_REPLAY_RATE` CloudEvents per seconde."
+        ),
+        request=None,
+        responses={status.HTTP_202_ACCEPTED: ReplaySerializer},
+    )
+    @action(detail=False, methods=["post"])
+    def replay(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        last_pk = queryset.order_by("-pk").values_list("pk", flat=True).first()
+        count = queryset.count()
+
+        if last_pk is not None:
+            filterset = self.filterset_class(request.query_params, queryset=queryset)
+            filterset.is_valid()
+            lookups = filterset.get_lookups()
+            # the events which fail in the meantime are not replayed
+            replay_dead_letter_cloudevents.delay({**lookups, "pk__lte": last_pk})
+            logger.info("cloudevent_dead_letters_replay_scheduled", count=count)
+
+        return Response(
+            ReplaySerializer({"count": count}).data, status=status.HTTP_202_ACCEPTED
+        )
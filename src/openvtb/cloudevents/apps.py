@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class CloudEventsConfig(AppConfig):
+    name = "openvtb.cloudevents"
+    verbose_name = _("CloudEvents")
+
+    def ready(self):
+        from . import signals  # noqa
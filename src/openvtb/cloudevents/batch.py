@@ -0,0 +1,165 @@
+"""
+Batched delivery of CloudEvents, using the batched content mode
+(``application/cloudevents-batch+json``).
+
+Events are buffered in the :class:`BufferedCloudEvent` table and sent in batches of
+at most ``CLOUDEVENTS_BATCH_SIZE`` events, at most ``CLOUDEVENTS_BATCH_LINGER``
+seconds after the first buffered event. If the receiver does not accept a batch,
+the events of the batch are sent one by one, as without batching.
+
+If ``CLOUDEVENTS_DELIVERY_WORKER`` is enabled, the buffered events are sent by the
+delivery worker instead, see :mod:`openvtb.cloudevents.delivery`.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+import requests
+import structlog
+from notifications_api_common.cloudevents import construct_cloudevent
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+from notifications_api_common.tasks import send_cloudevent
+
+from .models import BufferedCloudEvent
+
+logger = structlog.stdlib.get_logger(__name__)
+
+BATCH_CONTENT_TYPE = "application/cloudevents-batch+json"
+
+# responses of a receiver which does not support the batched content mode
+UNSUPPORTED_STATUS_CODES = {404, 405, 415, 501}
+UNSUPPORTED_TIMEOUT = 60 * 60
+
+FLUSH_SCHEDULED_CACHE_KEY = "cloudevents:batch:flush-scheduled"
+UNSUPPORTED_CACHE_KEY = "cloudevents:batch:unsupported"
+
+
+def is_batching_enabled() -> bool:
+    return settings.CLOUDEVENTS_BATCH_SIZE > 1 and not cache.get(UNSUPPORTED_CACHE_KEY)
+
+
+def is_buffering_enabled() -> bool:
+    """
+    Whether CloudEvents are buffered, to be sent in batches or by the delivery
+    worker.
+    """
+    return settings.CLOUDEVENTS_DELIVERY_WORKER or is_batching_enabled()
+
+
+def buffer_cloudevent(
+    type_event: str,
+    subject: str | None = None,
+    dataref: str | None = None,
+    data: dict | None = None,
+) -> None:
+    """
+    Buffer a CloudEvent, and schedule the sending of the buffered events.
+    """
+    if not get_setting("NOTIFICATIONS_SOURCE"):
+        logger.warning("cloudevent_not_sent", reason="NOTIFICATIONS_SOURCE is not set")
+        return
+
+    buffer_cloudevents([construct_cloudevent(type_event, subject, dataref, data)])
+
+
+def buffer_cloudevents(cloudevents: list[dict]) -> None:
+    """
+    Buffer constructed CloudEvents, and schedule the sending of the buffered events.
+    """
+    BufferedCloudEvent.objects.bulk_create(
+        BufferedCloudEvent(cloudevent=cloudevent) for cloudevent in cloudevents
+    )
+
+    if settings.CLOUDEVENTS_DELIVERY_WORKER:
+        return
+
+    linger = settings.CLOUDEVENTS_BATCH_LINGER
+    # only the first event within the linger time schedules the sending, the
+    # periodic flush sends the events if the cache is unavailable
+    if cache.add(FLUSH_SCHEDULED_CACHE_KEY, True, timeout=max(linger, 1)):
+        from .tasks import send_cloudevent_batches
+
+        send_cloudevent_batches.apply_async(countdown=linger)
+
+
+def send_individually(cloudevents: list[dict]) -> None:
+    from .dead_letters import store_dead_letters
+
+    for cloudevent in cloudevents:
+        try:
+            send_cloudevent.delay(cloudevent)
+        except Exception as exc:
+            # e.g. the broker is unavailable, keep the event to replay it later
+            store_dead_letters([cloudevent], f"{type(exc).__name__}: {exc}")
+
+
+def send_batch(cloudevents: list[dict]) -> None:
+    """
+    Send the CloudEvents in one request, or one by one if that fails.
+    """
+    client = NotificationsConfig.get_client()
+    if client is None:
+        logger.warning(
+            "cloudevent_not_sent", reason="no client for the Notifications API"
+        )
+        return
+
+    try:
+        response = client.post(
+            "cloudevents",
+            json=cloudevents,
+            headers={"Content-Type": BATCH_CONTENT_TYPE},
+        )
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        status_code = exc.response.status_code if exc.response is not None else None
+        if status_code in UNSUPPORTED_STATUS_CODES:
+            cache.set(UNSUPPORTED_CACHE_KEY, True, timeout=UNSUPPORTED_TIMEOUT)
+
+        # the single event delivery retries the events that fail
+        logger.warning(
+            "cloudevent_batch_failed",
+            status_code=status_code,
+            size=len(cloudevents),
+            exc_info=exc,
+        )
+        send_individually(cloudevents)
+    else:
+        logger.info("cloudevent_batch_sent", size=len(cloudevents))
+
+
+def send_buffered_batch() -> int:
+    """
+    Send a batch of buffered CloudEvents, in the order they were buffered.
+
+    The events stay locked in the buffer while they are sent, and are only removed
+    once they are sent or stored as dead letters, so a failure does not lose them.
+
+    Returns the number of sent events.
+    """
+    from .dead_letters import store_dead_letters
+
+    batch_size = max(settings.CLOUDEVENTS_BATCH_SIZE, 1)
+    with transaction.atomic():
+        batch = list(
+            BufferedCloudEvent.objects.order_by("pk")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", "cloudevent")[:batch_size]
+        )
+        if not batch:
+            return 0
+
+        cloudevents = [cloudevent for _pk, cloudevent in batch]
+        try:
+            if cache.get(UNSUPPORTED_CACHE_KEY) or len(cloudevents) == 1:
+                send_individually(cloudevents)
+            else:
+                send_batch(cloudevents)
+        except Exception as exc:
+            logger.exception("cloudevent_batch_not_sent", size=len(cloudevents))
+            store_dead_letters(cloudevents, f"{type(exc).__name__}: {exc}")
+
+        BufferedCloudEvent.objects.filter(pk__in=[pk for pk, _event in batch]).delete()
+    return len(batch)
@@ -0,0 +1,121 @@
+"""
+Dead letters: the CloudEvents which could not be sent.
+
+A CloudEvent ends up in the :class:`DeadLetterCloudEvent` table when
+
+* the Celery task which sends it fails after its last retry,
+* the delivery worker gives up on it after ``CLOUDEVENTS_DELIVERY_MAX_ATTEMPTS``
+  attempts, or
+* it could not be handed over to Celery or the buffer at all, e.g. because the
+  broker was unavailable.
+
+After an outage of the receiver the dead letters are sent again, with their
+original ``id`` so the receiver can recognize the events it did receive, at most
+``CLOUDEVENTS_REPLAY_RATE`` events per second.
+"""
+
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import QuerySet
+
+import structlog
+from notifications_api_common.tasks import send_cloudevent
+
+from .batch import buffer_cloudevents, is_buffering_enabled
+from .models import DeadLetterCloudEvent
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+def store_dead_letters(cloudevents: Iterable[dict], reason: str) -> None:
+    """
+    Keep CloudEvents which could not be sent, to replay them later.
+    """
+    dead_letters = [
+        DeadLetterCloudEvent(
+            cloudevent=cloudevent,
+            type=cloudevent.get("type") or "",
+            subject=(cloudevent.get("subject") or "")[:255],
+            reason=reason,
+        )
+        for cloudevent in cloudevents
+    ]
+    try:
+        with transaction.atomic():
+            DeadLetterCloudEvent.objects.bulk_create(dead_letters)
+    except DatabaseError:
+        # the events are lost, keep them in the logs at least
+        logger.exception(
+            "cloudevent_dead_letter_not_stored",
+            cloudevents=[dead_letter.cloudevent for dead_letter in dead_letters],
+            reason=reason,
+        )
+        return
+
+    for dead_letter in dead_letters:
+        logger.error(
+            "cloudevent_dead_lettered",
+            id=dead_letter.cloudevent.get("id"),
+            type=dead_letter.type,
+            subject=dead_letter.subject,
+            reason=reason,
+        )
+
+
+def resend_cloudevents(cloudevents: list[dict]) -> None:
+    """
+    Send constructed CloudEvents again, along the configured delivery path.
+    """
+    if is_buffering_enabled():
+        buffer_cloudevents(cloudevents)
+        return
+
+    for cloudevent in cloudevents:
+        send_cloudevent.delay(cloudevent)
+
+
+def replay_dead_letters(
+    queryset: QuerySet[DeadLetterCloudEvent], rate: float | None = None
+) -> int:
+    """
+    Send the dead letters of the queryset again, in the order they failed, at most
+    ``rate`` events per second. The replayed dead letters are removed, an event
+    which fails again becomes a new dead letter.
+
+    Returns the number of replayed events.
+    """
+    rate = rate if rate is not None else settings.CLOUDEVENTS_REPLAY_RATE
+    # send the events of every second together
+    chunk_size = max(int(rate), 1) if rate > 0 else 100
+    # the events which fail again during the replay are not replayed again
+    last_pk = queryset.order_by("-pk").values_list("pk", flat=True).first()
+    if last_pk is None:
+        return 0
+
+    replayed = 0
+    after_pk = 0
+    while True:
+        started_at = time.monotonic()
+        chunk = list(
+            queryset.filter(pk__gt=after_pk, pk__lte=last_pk)
+            .order_by("pk")
+            .values_list("pk", "cloudevent")[:chunk_size]
+        )
+        if not chunk:
+            break
+
+        after_pk = chunk[-1][0]
+        resend_cloudevents([cloudevent for _pk, cloudevent in chunk])
+        DeadLetterCloudEvent.objects.filter(
+            pk__in=[pk for pk, _event in chunk]
+        ).delete()
+        replayed += len(chunk)
+        logger.info("cloudevent_dead_letters_replayed", count=len(chunk))
+
+        if rate > 0:
+            time.sleep(max(len(chunk) / rate - (time.monotonic() - started_at), 0))
+
+    return replayed
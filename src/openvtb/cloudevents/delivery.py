@@ -0,0 +1,383 @@
+"""
+Asynchronous delivery of the buffered CloudEvents.
+
+The delivery worker (``manage.py deliver_cloudevents``) claims the buffered events
+and sends them concurrently, over a pool of keep-alive connections (HTTP/2 if the
+``h2`` package is installed). Per receiver, the number of concurrent requests and
+the request rate are limited, and a receiver which keeps failing is not called for
+a while (circuit breaker).
+
+Claimed events are locked for ``LEASE_SECONDS``, so the events of a worker which
+stops unexpectedly are sent again by another worker.
+"""
+
+import asyncio
+import importlib.util
+import json
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+import httpx
+import requests
+import structlog
+from asgiref.sync import sync_to_async
+from notifications_api_common.models import NotificationsConfig
+
+from .batch import BATCH_CONTENT_TYPE, UNSUPPORTED_STATUS_CODES
+from .dead_letters import store_dead_letters
+from .models import BufferedCloudEvent
+
+logger = structlog.stdlib.get_logger(__name__)
+
+CONTENT_TYPE = "application/cloudevents+json"
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+LEASE_SECONDS = 5 * 60
+MAX_RETRY_DELAY = 5 * 60
+# the authentication headers of the receiver are refreshed after this period
+SUBSCRIBER_REFRESH_SECONDS = 5 * 60
+
+# (pk, cloudevent, attempts)
+ClaimedEvent = tuple[int, dict, int]
+
+
+class TokenBucket:
+    """
+    Limit the number of requests per second, allowing bursts of ``capacity``
+    requests. A rate of ``0`` means no limit.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Stop calling a receiver for ``cooldown`` seconds after ``threshold``
+    consecutive failures. After the cooldown the receiver is called again, and a
+    single failure opens the circuit again.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def retry_after(self) -> float:
+        """
+        Seconds until the receiver may be called again, ``0`` if the circuit is
+        closed.
+        """
+        if self.opened_at is None:
+            return 0
+        return max(self.opened_at + self.cooldown - time.monotonic(), 0)
+
+    @property
+    def is_half_open(self) -> bool:
+        return self.failures >= self.threshold and not self.retry_after
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.threshold and not self.retry_after:
+            self.opened_at = time.monotonic()
+            logger.warning(
+                "cloudevent_circuit_opened",
+                failures=self.failures,
+                cooldown=self.cooldown,
+            )
+
+
+@dataclass
+class Subscriber:
+    """
+    A receiver of CloudEvents, with its delivery limits.
+    """
+
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+    concurrency: int = 10
+    rate_limit: float = 0
+    batch_supported: bool = True
+    refreshed_at: float = field(default_factory=time.monotonic)
+    rate_limiter: TokenBucket = field(init=False)
+    circuit_breaker: CircuitBreaker = field(init=False)
+
+    def __post_init__(self):
+        self.rate_limiter = TokenBucket(self.rate_limit)
+        self.circuit_breaker = CircuitBreaker(
+            threshold=settings.CLOUDEVENTS_CIRCUIT_BREAKER_THRESHOLD,
+            cooldown=settings.CLOUDEVENTS_CIRCUIT_BREAKER_COOLDOWN,
+        )
+
+
+def get_subscriber() -> Subscriber | None:
+    """
+    Return the configured Notifications API as subscriber, with the headers to
+    authenticate with it.
+    """
+    client = NotificationsConfig.get_client()
+    if client is None:
+        return None
+
+    # let the client add the authentication, as for the other requests
+    prepared = client.prepare_request(
+        requests.Request("POST", client.to_absolute_url("cloudevents"))
+    )
+    return Subscriber(
+        url=prepared.url,
+        headers={
+            key: value
+            for key, value in prepared.headers.items()
+            if key.lower() not in ("content-length", "content-type")
+        },
+        concurrency=settings.CLOUDEVENTS_DELIVERY_CONCURRENCY,
+        rate_limit=settings.CLOUDEVENTS_DELIVERY_RATE_LIMIT,
+    )
+
+
+def claim_cloudevents(limit: int) -> list[ClaimedEvent]:
+    """
+    Lock a number of buffered CloudEvents for this worker, in the order they were
+    buffered.
+    """
+    close_old_connections()
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = list(
+            BufferedCloudEvent.objects.filter(
+                Q(locked_until__isnull=True) | Q(locked_until__lte=now)
+            )
+            .order_by("pk")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", "cloudevent", "attempts")[:limit]
+        )
+        BufferedCloudEvent.objects.filter(pk__in=[pk for pk, *_ in claimed]).update(
+            locked_until=now + timedelta(seconds=LEASE_SECONDS)
+        )
+    return claimed
+
+
+def complete_cloudevents(events: list[ClaimedEvent]) -> None:
+    BufferedCloudEvent.objects.filter(pk__in=[pk for pk, *_ in events]).delete()
+
+
+def release_cloudevents(events: list[ClaimedEvent]) -> None:
+    """
+    Make the CloudEvents available again, without counting an attempt.
+    """
+    BufferedCloudEvent.objects.filter(pk__in=[pk for pk, *_ in events]).update(
+        locked_until=None
+    )
+
+
+def retry_cloudevents(events: list[ClaimedEvent], reason: str) -> None:
+    """
+    Retry the CloudEvents later, with an exponential backoff, or move them to the
+    dead letters after ``CLOUDEVENTS_DELIVERY_MAX_ATTEMPTS`` attempts.
+    """
+    now = timezone.now()
+    given_up = []
+    retried = defaultdict(list)
+    for pk, cloudevent, attempts in events:
+        if attempts + 1 < settings.CLOUDEVENTS_DELIVERY_MAX_ATTEMPTS:
+            retried[attempts].append(pk)
+        else:
+            given_up.append((pk, cloudevent))
+
+    for attempts, pks in retried.items():
+        BufferedCloudEvent.objects.filter(pk__in=pks).update(
+            attempts=attempts + 1,
+            locked_until=now + timedelta(seconds=min(2**attempts, MAX_RETRY_DELAY)),
+        )
+
+    if given_up:
+        with transaction.atomic():
+            store_dead_letters(
+                [cloudevent for _pk, cloudevent in given_up],
+                f"{reason} (after {settings.CLOUDEVENTS_DELIVERY_MAX_ATTEMPTS} attempts)",
+            )
+            BufferedCloudEvent.objects.filter(
+                pk__in=[pk for pk, _cloudevent in given_up]
+            ).delete()
+
+
+def _chunks(events: list[ClaimedEvent], size: int) -> Iterator[list[ClaimedEvent]]:
+    for index in range(0, len(events), size):
+        yield events[index : index + size]
+
+
+class DeliveryWorker:
+    def __init__(
+        self,
+        subscriber_factory: Callable[[], Subscriber | None] = get_subscriber,
+        batch_size: int | None = None,
+        poll_interval: float = 0.5,
+        exit_when_empty: bool = False,
+    ):
+        self.subscriber_factory = subscriber_factory
+        self.batch_size = max(
+            batch_size if batch_size is not None else settings.CLOUDEVENTS_BATCH_SIZE,
+            1,
+        )
+        self.poll_interval = poll_interval
+        self.exit_when_empty = exit_when_empty
+        self.subscriber: Subscriber | None = None
+        self.delivered = 0
+        self.failed = 0
+
+    def _http_client(self, subscriber: Subscriber) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(settings.CLOUDEVENTS_DELIVERY_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=subscriber.concurrency,
+                max_keepalive_connections=subscriber.concurrency,
+            ),
+        )
+
+    async def _refresh_subscriber(self) -> Subscriber | None:
+        subscriber = self.subscriber
+        if (
+            subscriber is None
+            or time.monotonic() - subscriber.refreshed_at > SUBSCRIBER_REFRESH_SECONDS
+        ):
+            refreshed = await sync_to_async(self.subscriber_factory)()
+            if subscriber is None:
+                self.subscriber = refreshed
+            elif refreshed is not None:
+                # keep the state of the limits and the circuit breaker
+                subscriber.headers = refreshed.headers
+                subscriber.refreshed_at = refreshed.refreshed_at
+        return self.subscriber
+
+    async def _wait(self, stop: asyncio.Event, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(stop.wait(), timeout)
+        except TimeoutError:
+            pass
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        stop = stop or asyncio.Event()
+        subscriber = await self._refresh_subscriber()
+        if subscriber is None:
+            logger.warning(
+                "cloudevent_delivery_not_started",
+                reason="no client for the Notifications API",
+            )
+            return
+
+        in_flight: set[asyncio.Task] = set()
+        async with self._http_client(subscriber) as client:
+            while not stop.is_set():
+                subscriber = await self._refresh_subscriber()
+                if retry_after := subscriber.circuit_breaker.retry_after:
+                    await self._wait(stop, retry_after)
+                    continue
+
+                # a single request checks whether a failing receiver has recovered
+                concurrency = (
+                    1
+                    if subscriber.circuit_breaker.is_half_open
+                    else subscriber.concurrency
+                )
+                free = concurrency - len(in_flight)
+                if free <= 0:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                batch_size = self.batch_size if subscriber.batch_supported else 1
+                events = await sync_to_async(claim_cloudevents)(free * batch_size)
+                if not events:
+                    if self.exit_when_empty and not in_flight:
+                        break
+                    await self._wait(stop, self.poll_interval)
+                    continue
+
+                for chunk in _chunks(events, batch_size):
+                    task = asyncio.create_task(self.deliver(client, subscriber, chunk))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+            if in_flight:
+                await asyncio.wait(in_flight)
+
+    async def deliver(
+        self,
+        client: httpx.AsyncClient,
+        subscriber: Subscriber,
+        events: list[ClaimedEvent],
+    ) -> None:
+        """
+        Send a chunk of CloudEvents in one request.
+        """
+        is_batch = len(events) > 1
+        cloudevents = [cloudevent for _pk, cloudevent, _attempts in events]
+
+        await subscriber.rate_limiter.acquire()
+        try:
+            response = await client.post(
+                subscriber.url,
+                content=json.dumps(
+                    cloudevents if is_batch else cloudevents[0], cls=DjangoJSONEncoder
+                ),
+                headers={
+                    **subscriber.headers,
+                    "Content-Type": BATCH_CONTENT_TYPE if is_batch else CONTENT_TYPE,
+                },
+            )
+        except httpx.HTTPError as exc:
+            reason = f"{type(exc).__name__}: {exc}"
+        else:
+            if response.is_success:
+                subscriber.circuit_breaker.record_success()
+                await sync_to_async(complete_cloudevents)(events)
+                self.delivered += len(events)
+                return
+
+            if is_batch and response.status_code in UNSUPPORTED_STATUS_CODES:
+                logger.warning(
+                    "cloudevent_batch_not_supported",
+                    status_code=response.status_code,
+                )
+                subscriber.batch_supported = False
+                await sync_to_async(release_cloudevents)(events)
+                return
+
+            reason = f"HTTP {response.status_code}"
+
+        subscriber.circuit_breaker.record_failure()
+        self.failed += len(events)
+        await sync_to_async(retry_cloudevents)(events, reason)
@@ -0,0 +1,52 @@
+import asyncio
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from openvtb.cloudevents.delivery import DeliveryWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the delivery worker, which sends the buffered cloud events. "
+        "Requires CLOUDEVENTS_DELIVERY_WORKER to be enabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=0.5,
+            help="Number of seconds to wait for new cloud events when the buffer is empty.",
+        )
+        parser.add_argument(
+            "--exit-when-empty",
+            action="store_true",
+            help="Stop when all buffered cloud events are sent.",
+        )
+
+    def handle(self, **options):
+        if not settings.CLOUDEVENTS_DELIVERY_WORKER:
+            self.stderr.write(
+                "CLOUDEVENTS_DELIVERY_WORKER is disabled, the cloud events are not "
+                "buffered for the delivery worker."
+            )
+
+        worker = DeliveryWorker(
+            poll_interval=options["poll_interval"],
+            exit_when_empty=options["exit_when_empty"],
+        )
+        asyncio.run(self.run(worker))
+        self.stdout.write(
+            f"Delivered {worker.delivered} cloud events, {worker.failed} failed attempts."
+        )
+
+    async def run(self, worker: DeliveryWorker) -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        # finish the requests in flight before stopping
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+
+        await worker.run(stop)
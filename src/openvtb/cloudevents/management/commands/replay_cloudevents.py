@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from openvtb.cloudevents.dead_letters import replay_dead_letters
+from openvtb.cloudevents.models import DeadLetterCloudEvent
+
+
+def datetime_argument(value: str):
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(value)
+    return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the cloud events which could not be sent (the dead letters) again, "
+        "throttled to CLOUDEVENTS_REPLAY_RATE events per second."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--type", help="Only replay cloud events of this type.")
+        parser.add_argument(
+            "--subject", help="Only replay cloud events with this subject."
+        )
+        parser.add_argument(
+            "--failed-after",
+            type=datetime_argument,
+            help="Only replay cloud events which failed at or after this ISO 8601 datetime.",
+        )
+        parser.add_argument(
+            "--failed-before",
+            type=datetime_argument,
+            help="Only replay cloud events which failed at or before this ISO 8601 datetime.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=settings.CLOUDEVENTS_REPLAY_RATE,
+            help="Maximum number of cloud events per second, 0 for no limit.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only show the number of cloud events that would be replayed.",
+        )
+
+    def handle(self, **options):
+        if options["rate"] < 0:
+            raise CommandError("--rate can not be negative.")
+
+        queryset = DeadLetterCloudEvent.objects.all()
+        if options["type"]:
+            queryset = queryset.filter(type=options["type"])
+        if options["subject"]:
+            queryset = queryset.filter(subject=options["subject"])
+        if options["failed_after"]:
+            queryset = queryset.filter(failed_at__gte=options["failed_after"])
+        if options["failed_before"]:
+            queryset = queryset.filter(failed_at__lte=options["failed_before"])
+
+        if options["dry_run"]:
+            self.stdout.write(f"{queryset.count()} cloud events would be replayed.")
+            return
+
+        replayed = replay_dead_letters(queryset, rate=options["rate"])
+        self.stdout.write(self.style.SUCCESS(f"Replayed {replayed} cloud events."))
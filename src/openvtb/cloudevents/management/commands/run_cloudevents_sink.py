@@ -0,0 +1,67 @@
+import threading
+
+from django.core.management.base import BaseCommand
+
+from openvtb.cloudevents.sink import CloudEventSink
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local receiver of cloud events, which reports the throughput, "
+        "latency, duplicates and ordering of the received events. Use its URL as "
+        "API root of the Notifications API service."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument(
+            "--status-code",
+            type=int,
+            default=202,
+            help="Status code of the responses, e.g. 503 to test the retries.",
+        )
+        parser.add_argument(
+            "--report-interval",
+            type=float,
+            default=10,
+            help="Number of seconds between the reports.",
+        )
+
+    def handle(self, **options):
+        sink = CloudEventSink(
+            host=options["host"],
+            port=options["port"],
+            status_code=options["status_code"],
+        )
+        self.stdout.write(f"Receiving cloud events on {sink.url}cloudevents")
+
+        stop = threading.Event()
+        reporter = threading.Thread(
+            target=self.report_periodically,
+            args=(sink, stop, options["report_interval"]),
+            daemon=True,
+        )
+        reporter.start()
+        try:
+            sink.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            sink.server_close()
+            self.report(sink)
+
+    def report_periodically(
+        self, sink: CloudEventSink, stop: threading.Event, interval: float
+    ) -> None:
+        received = 0
+        while not stop.wait(interval):
+            if len(sink.events) != received:
+                received = len(sink.events)
+                self.report(sink)
+
+    def report(self, sink: CloudEventSink) -> None:
+        self.stdout.write(
+            ", ".join(f"{key}={value}" for key, value in sink.get_report().items())
+        )
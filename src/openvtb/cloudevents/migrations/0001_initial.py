@@ -0,0 +1,45 @@
+# Generated by Django 5.2.15 on 2026-10-19 12:05
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="BufferedCloudEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "cloudevent",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The CloudEvent, in the structured content mode.",
+                        verbose_name="cloudevent",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="created at"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "buffered CloudEvent",
+                "verbose_name_plural": "buffered CloudEvents",
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.15 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cloudevents", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bufferedcloudevent",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="Number of failed attempts to send the CloudEvent.",
+                verbose_name="attempts",
+            ),
+        ),
+        migrations.AddField(
+            model_name="bufferedcloudevent",
+            name="locked_until",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="The CloudEvent is being sent by the delivery worker, or waits for a retry, until this moment.",
+                null=True,
+                verbose_name="locked until",
+            ),
+        ),
+    ]
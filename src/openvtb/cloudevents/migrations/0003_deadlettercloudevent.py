@@ -0,0 +1,78 @@
+# Generated by Django 5.2.15 on 2026-10-19 14:05
+
+import uuid
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cloudevents", "0002_bufferedcloudevent_attempts_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeadLetterCloudEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4, unique=True, verbose_name="UUID"
+                    ),
+                ),
+                (
+                    "cloudevent",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The CloudEvent, in the structured content mode.",
+                        verbose_name="cloudevent",
+                    ),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        db_index=True, max_length=255, verbose_name="type"
+                    ),
+                ),
+                (
+                    "subject",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        max_length=255,
+                        verbose_name="subject",
+                    ),
+                ),
+                (
+                    "reason",
+                    models.TextField(
+                        help_text="Why the CloudEvent could not be sent.",
+                        verbose_name="reason",
+                    ),
+                ),
+                (
+                    "failed_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="failed at",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "dead letter CloudEvent",
+                "verbose_name_plural": "dead letter CloudEvents",
+            },
+        ),
+    ]
@@ -0,0 +1,88 @@
+import uuid
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class BufferedCloudEvent(models.Model):
+    """
+    A CloudEvent waiting to be sent, in a batch or by the delivery worker.
+    """
+
+    cloudevent = models.JSONField(
+        _("cloudevent"),
+        help_text=_("The CloudEvent, in the structured content mode."),
+        encoder=DjangoJSONEncoder,
+    )
+    created_at = models.DateTimeField(
+        _("created at"),
+        auto_now_add=True,
+        db_index=True,
+    )
+    locked_until = models.DateTimeField(
+        _("locked until"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "The CloudEvent is being sent by the delivery worker, or waits for a retry, "
+            "until this moment."
+        ),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        _("attempts"),
+        default=0,
+        help_text=_("Number of failed attempts to send the CloudEvent."),
+    )
+
+    class Meta:
+        verbose_name = _("buffered CloudEvent")
+        verbose_name_plural = _("buffered CloudEvents")
+
+    def __str__(self):
+        return f"{self.cloudevent.get('type')} ({self.cloudevent.get('id')})"
+
+
+class DeadLetterCloudEvent(models.Model):
+    """
+    A CloudEvent which could not be sent, kept to be replayed.
+    """
+
+    uuid = models.UUIDField(
+        _("UUID"),
+        default=uuid.uuid4,
+        unique=True,
+    )
+    cloudevent = models.JSONField(
+        _("cloudevent"),
+        help_text=_("The CloudEvent, in the structured content mode."),
+        encoder=DjangoJSONEncoder,
+    )
+    type = models.CharField(
+        _("type"),
+        max_length=255,
+        db_index=True,
+    )
+    subject = models.CharField(
+        _("subject"),
+        max_length=255,
+        blank=True,
+        db_index=True,
+    )
+    reason = models.TextField(
+        _("reason"),
+        help_text=_("Why the CloudEvent could not be sent."),
+    )
+    failed_at = models.DateTimeField(
+        _("failed at"),
+        default=timezone.now,
+        db_index=True,
+    )
+
+    class Meta:
+        verbose_name = _("dead letter CloudEvent")
+        verbose_name_plural = _("dead letter CloudEvents")
+
+    def __str__(self):
+        return f"{self.type} ({self.cloudevent.get('id')})"
@@ -0,0 +1,18 @@
+from celery.signals import task_failure
+from notifications_api_common.tasks import send_cloudevent
+
+from .dead_letters import store_dead_letters
+
+
+@task_failure.connect
+def store_failed_cloudevent(sender=None, exception=None, args=None, kwargs=None, **_):
+    """
+    Keep the CloudEvents which are not sent after the last retry of the Celery
+    task.
+    """
+    if sender is None or sender.name != send_cloudevent.name:
+        return
+
+    cloudevent = args[0] if args else (kwargs or {}).get("message")
+    if cloudevent:
+        store_dead_letters([cloudevent], f"{type(exception).__name__}: {exception}")
@@ -0,0 +1,184 @@
+"""
+A local receiver of CloudEvents, to measure the delivery of the events.
+
+The sink accepts single (``application/cloudevents+json``) and batched
+(``application/cloudevents-batch+json``) events and records, per event, when it was
+received. From this it reports the throughput, the latency (from the ``time`` of the
+event), the duplicates and the events received out of order.
+
+Run it with ``manage.py run_cloudevents_sink`` and point the Notifications API
+service to it, or start it in a benchmark, see
+:mod:`openvtb.cloudevents.tests.test_benchmarks`.
+"""
+
+import json
+import statistics
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@dataclass
+class ReceivedCloudEvent:
+    id: str
+    type: str
+    # the ``time`` of the event, as timestamp
+    time: float | None
+    received_at: float
+
+
+def parse_time(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def percentile(values: list[float], percent: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class CloudEventSinkHandler(BaseHTTPRequestHandler):
+    # keep the connections alive between requests, like the Notifications API
+    protocol_version = "HTTP/1.1"
+    server: "CloudEventSink"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.server.status_code < 300:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                self._respond(400)
+                return
+            self.server.record(payload if isinstance(payload, list) else [payload])
+        self._respond(self.server.status_code)
+
+    def _respond(self, status_code: int) -> None:
+        self.send_response(status_code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+class CloudEventSink(ThreadingHTTPServer):
+    """
+    Receive CloudEvents on ``host:port`` (``port=0`` picks a free port) and
+    respond with ``status_code``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, status_code=202):
+        super().__init__((host, port), CloudEventSinkHandler)
+        self.status_code = status_code
+        self.events: list[ReceivedCloudEvent] = []
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def record(self, cloudevents: list[dict]) -> None:
+        received_at = time.time()
+        with self._lock:
+            self.requests += 1
+            self.events.extend(
+                ReceivedCloudEvent(
+                    id=cloudevent.get("id", ""),
+                    type=cloudevent.get("type", ""),
+                    time=parse_time(cloudevent.get("time")),
+                    received_at=received_at,
+                )
+                for cloudevent in cloudevents
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self.events = []
+            self.requests = 0
+
+    def start(self) -> None:
+        """
+        Serve the requests in a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def wait_for(self, count: int, timeout: float) -> bool:
+        """
+        Wait until ``count`` events are received, return whether they are.
+        """
+        deadline = time.monotonic() + timeout
+        while len(self.events) < count:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def get_report(self, since: float | None = None) -> dict[str, float]:
+        """
+        Summarize the received events. The latency is measured from ``since`` (a
+        timestamp) if given, otherwise from the ``time`` of each event, which has a
+        resolution of a second.
+        """
+        with self._lock:
+            events = list(self.events)
+            requests = self.requests
+
+        report = {
+            "requests": requests,
+            "received": len(events),
+            "duplicates": sum(
+                count - 1 for count in Counter(e.id for e in events).values()
+            ),
+            "out_of_order": 0,
+            "events_per_second": 0,
+            "latency_p50": 0,
+            "latency_p95": 0,
+            "latency_max": 0,
+        }
+        if not events:
+            return report
+
+        latest = None
+        for event in events:
+            if event.time is None:
+                continue
+            if latest is not None and event.time < latest:
+                report["out_of_order"] += 1
+            latest = max(event.time, latest or event.time)
+
+        start = since if since is not None else events[0].received_at
+        duration = events[-1].received_at - start
+        if duration > 0:
+            report["events_per_second"] = round(len(events) / duration, 1)
+
+        latencies = sorted(
+            event.received_at - (since if since is not None else event.time)
+            for event in events
+            if since is not None or event.time is not None
+        )
+        if latencies:
+            report["latency_p50"] = round(percentile(latencies, 50), 3)
+            report["latency_p95"] = round(percentile(latencies, 95), 3)
+            report["latency_max"] = round(latencies[-1], 3)
+        return report
@@ -0,0 +1,30 @@
+from django.conf import settings
+
+from openvtb.celery import app
+
+from .batch import send_buffered_batch
+from .dead_letters import replay_dead_letters
+from .models import DeadLetterCloudEvent
+
+
+@app.task(ignore_result=True)
+def send_cloudevent_batches() -> None:
+    """
+    Sends the buffered CloudEvents in batches.
+    """
+    if settings.CLOUDEVENTS_DELIVERY_WORKER:
+        # the buffered events are sent by the delivery worker
+        return
+
+    batch_size = max(settings.CLOUDEVENTS_BATCH_SIZE, 1)
+    while send_buffered_batch() >= batch_size:
+        pass
+
+
+@app.task(ignore_result=True)
+def replay_dead_letter_cloudevents(filters: dict) -> None:
+    """
+    Sends the dead letter CloudEvents matching the lookups in ``filters`` again,
+    throttled by ``CLOUDEVENTS_REPLAY_RATE``.
+    """
+    replay_dead_letters(DeadLetterCloudEvent.objects.filter(**filters))
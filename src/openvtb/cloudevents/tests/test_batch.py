@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+import requests_mock
+
+from openvtb.tests.cloudevents import CloudEventSettingMixin
+from openvtb.utils.cloudevents import process_cloudevent
+
+from ..batch import BATCH_CONTENT_TYPE, UNSUPPORTED_CACHE_KEY
+from ..models import BufferedCloudEvent, DeadLetterCloudEvent
+from ..tasks import send_cloudevent_batches
+
+EVENT_TYPE = "nl.overheid.taken.externetaak-herinnerd"
+
+
+@requests_mock.Mocker()
+@patch("notifications_api_common.tasks.send_cloudevent.delay")
+@patch("openvtb.cloudevents.tasks.send_cloudevent_batches.apply_async")
+@override_settings(CLOUDEVENTS_BATCH_SIZE=2, CLOUDEVENTS_BATCH_LINGER=5)
+class CloudEventBatchTestCase(CloudEventSettingMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _process_cloudevents(self, count: int):
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(count):
+                process_cloudevent(EVENT_TYPE, subject=str(index))
+
+    def test_buffer_cloudevents(self, m, mock_apply_async, mock_send):
+        self._process_cloudevents(3)
+
+        self.assertEqual(BufferedCloudEvent.objects.count(), 3)
+        # only the first event schedules the sending
+        mock_apply_async.assert_called_once_with(countdown=5)
+        mock_send.assert_not_called()
+        self.assertEqual(m.call_count, 0)
+
+    @override_settings(CLOUDEVENTS_BATCH_SIZE=0)
+    def test_batching_disabled(self, m, mock_apply_async, mock_send):
+        self._process_cloudevents(2)
+
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+        self.assertEqual(mock_send.call_count, 2)
+
+    @override_settings(CLOUDEVENTS_BATCH_SIZE=0, CLOUDEVENTS_DELIVERY_WORKER=True)
+    def test_buffer_for_delivery_worker(self, m, mock_apply_async, mock_send):
+        self._process_cloudevents(2)
+
+        # the delivery worker sends the events, not a celery task
+        self.assertEqual(BufferedCloudEvent.objects.count(), 2)
+        mock_apply_async.assert_not_called()
+        mock_send.assert_not_called()
+
+    def test_send_batches(self, m, mock_apply_async, mock_send):
+        m.post("http://webhook.local/cloudevents", status_code=202)
+        self._process_cloudevents(3)
+
+        send_cloudevent_batches()
+
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+        self.assertEqual(m.call_count, 1)
+        request = m.request_history[0]
+        self.assertEqual(request.headers["Content-Type"], BATCH_CONTENT_TYPE)
+        self.assertEqual(
+            [cloudevent["subject"] for cloudevent in request.json()], ["0", "1"]
+        )
+        # the last event is not sent in a batch of one
+        mock_send.assert_called_once()
+        self.assertEqual(mock_send.call_args[0][0]["subject"], "2")
+
+    def test_batch_not_supported(self, m, mock_apply_async, mock_send):
+        m.post("http://webhook.local/cloudevents", status_code=415)
+        self._process_cloudevents(2)
+
+        send_cloudevent_batches()
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(
+            [call[0][0]["subject"] for call in mock_send.call_args_list], ["0", "1"]
+        )
+        self.assertTrue(cache.get(UNSUPPORTED_CACHE_KEY))
+
+        with self.subTest("events are no longer buffered"):
+            mock_send.reset_mock()
+            self._process_cloudevents(1)
+
+            self.assertFalse(BufferedCloudEvent.objects.exists())
+            mock_send.assert_called_once()
+
+    def test_batch_failed(self, m, mock_apply_async, mock_send):
+        m.post("http://webhook.local/cloudevents", status_code=503)
+        self._process_cloudevents(2)
+
+        send_cloudevent_batches()
+
+        # the events are sent one by one, with the retries of the single delivery
+        self.assertEqual(mock_send.call_count, 2)
+        self.assertIsNone(cache.get(UNSUPPORTED_CACHE_KEY))
+
+    def test_batch_error(self, m, mock_apply_async, mock_send):
+        m.post("http://webhook.local/cloudevents", exc=ValueError("invalid"))
+        self._process_cloudevents(2)
+
+        send_cloudevent_batches()
+
+        # the events are not lost, but kept to be replayed
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+        self.assertEqual(
+            list(
+                DeadLetterCloudEvent.objects.order_by("pk").values_list(
+                    "subject", "reason"
+                )
+            ),
+            [("0", "ValueError: invalid"), ("1", "ValueError: invalid")],
+        )
+        mock_send.assert_not_called()
+
+    def test_broker_unavailable(self, m, mock_apply_async, mock_send):
+        m.post("http://webhook.local/cloudevents", status_code=503)
+        mock_send.side_effect = [None, OSError("broker unavailable")]
+        self._process_cloudevents(2)
+
+        send_cloudevent_batches()
+
+        # only the event which was not accepted by the broker is kept
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+        dead_letter = DeadLetterCloudEvent.objects.get()
+        self.assertEqual(dead_letter.subject, "1")
+        self.assertEqual(dead_letter.reason, "OSError: broker unavailable")
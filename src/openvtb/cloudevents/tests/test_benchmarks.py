@@ -0,0 +1,134 @@
+"""
+Throughput benchmarks of the CloudEvents delivery, against the local
+:class:`~openvtb.cloudevents.sink.CloudEventSink`.
+
+The benchmarks are skipped in the regular test run. Run them with::
+
+    RUN_BENCHMARKS=1 python src/manage.py test openvtb.cloudevents.tests.test_benchmarks
+
+The number of delivered events per second is compared with the results recorded
+in ``benchmark_results.json``, see :mod:`openvtb.tests.benchmarks`.
+The other figures of the sink (latency, duplicates, ordering) are recorded as well,
+so a change of the delivery path shows up in review.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import skipUnless
+
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from openvtb.components.berichten.tasks import send_due_berichten_events
+from openvtb.components.berichten.tests.factories import BerichtFactory
+from openvtb.components.taken.tasks import send_due_taak_events
+from openvtb.components.taken.tests.factories import ExterneTaakFactory
+from openvtb.tests.benchmarks import RUN_BENCHMARKS, BenchmarkMixin
+
+from ..delivery import DeliveryWorker, Subscriber
+from ..models import BufferedCloudEvent
+from ..sink import CloudEventSink
+
+NUMBER_OF_EVENTS = 2000
+# the number of taken and of berichten in the end-to-end benchmark
+NUMBER_OF_OBJECTS = 250
+
+
+@skipUnless(RUN_BENCHMARKS, "Set RUN_BENCHMARKS=1 to run the benchmarks")
+class DeliveryBenchmarks(BenchmarkMixin, TransactionTestCase):
+    benchmark_file = Path(__file__).parent / "benchmark_results.json"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.sink = CloudEventSink()
+        cls.sink.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sink.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.sink.reset()
+
+    def run_worker(self, concurrency: int, batch_size: int) -> None:
+        worker = DeliveryWorker(
+            subscriber_factory=lambda: Subscriber(
+                url=f"{self.sink.url}cloudevents", concurrency=concurrency
+            ),
+            batch_size=batch_size,
+            poll_interval=0,
+            exit_when_empty=True,
+        )
+        asyncio.run(worker.run())
+
+    def assertBenchmark(self, name: str, expected: int, start: float) -> None:
+        self.assertTrue(self.sink.wait_for(expected, timeout=10))
+        result = self.sink.get_report(since=start)
+        self.assertEqual(result["received"], expected)
+        self.assertEqual(result["duplicates"], 0)
+        self.assertRecordedResult(
+            name, result, "events_per_second", higher_is_better=True
+        )
+
+    def assertThroughput(self, name: str, concurrency: int, batch_size: int) -> None:
+        # distinct times, so the sink can tell whether the events arrive in order
+        now = timezone.now()
+        BufferedCloudEvent.objects.bulk_create(
+            BufferedCloudEvent(
+                cloudevent={
+                    "id": str(index),
+                    "type": "benchmark",
+                    "time": (now + timedelta(milliseconds=index)).isoformat(),
+                }
+            )
+            for index in range(NUMBER_OF_EVENTS)
+        )
+
+        start = time.time()
+        self.run_worker(concurrency, batch_size)
+
+        self.assertBenchmark(name, NUMBER_OF_EVENTS, start)
+
+    def test_sequential(self):
+        self.assertThroughput("delivery.sequential", concurrency=1, batch_size=1)
+
+    def test_concurrent(self):
+        self.assertThroughput("delivery.concurrent", concurrency=10, batch_size=1)
+
+    def test_concurrent_batches(self):
+        self.assertThroughput(
+            "delivery.concurrent_batches", concurrency=10, batch_size=50
+        )
+
+    @override_settings(
+        ENABLE_CLOUD_EVENTS=True,
+        NOTIFICATIONS_SOURCE="openvtb-benchmark",
+        CLOUDEVENTS_DELIVERY_WORKER=True,
+        CELERY_TASK_ALWAYS_EAGER=True,
+    )
+    def test_scheduled_events(self):
+        """
+        Time from running the schedulers until the reminders of the taken and the
+        publications of the berichten are received.
+        """
+        ExterneTaakFactory.create_batch(
+            NUMBER_OF_OBJECTS,
+            datum_herinnering=timezone.localdate() - timedelta(days=1),
+            einddatum_handelings_termijn=timezone.localdate() + timedelta(days=7),
+        )
+        BerichtFactory.create_batch(
+            NUMBER_OF_OBJECTS,
+            publicatiedatum=timezone.now() - timedelta(minutes=1),
+        )
+
+        start = time.time()
+        send_due_taak_events()
+        send_due_berichten_events()
+        self.run_worker(concurrency=10, batch_size=1)
+
+        self.assertBenchmark("delivery.scheduled_events", 2 * NUMBER_OF_OBJECTS, start)
@@ -0,0 +1,150 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from celery.signals import task_failure
+from kombu.exceptions import OperationalError
+from notifications_api_common.tasks import (
+    CloudEventException,
+    send_cloudevent,
+    send_notification,
+)
+
+from openvtb.tests.cloudevents import CloudEventSettingMixin
+from openvtb.utils.cloudevents import process_cloudevent
+
+from ..dead_letters import replay_dead_letters
+from ..models import BufferedCloudEvent, DeadLetterCloudEvent
+
+EVENT_TYPE = "nl.overheid.taken.externetaak-herinnerd"
+
+
+def create_dead_letter(subject: str, **kwargs) -> DeadLetterCloudEvent:
+    return DeadLetterCloudEvent.objects.create(
+        cloudevent={"id": subject, "type": EVENT_TYPE, "subject": subject},
+        type=EVENT_TYPE,
+        subject=subject,
+        reason="HTTP 503",
+        **kwargs,
+    )
+
+
+@requests_mock.Mocker()
+class StoreDeadLettersTestCase(CloudEventSettingMixin, TestCase):
+    @patch(
+        "notifications_api_common.tasks.send_cloudevent.delay",
+        side_effect=OperationalError("broker unavailable"),
+    )
+    def test_broker_unavailable(self, m, mock_send):
+        with self.captureOnCommitCallbacks(execute=True):
+            process_cloudevent(EVENT_TYPE, subject="123")
+
+        dead_letter = DeadLetterCloudEvent.objects.get()
+        self.assertEqual(dead_letter.type, EVENT_TYPE)
+        self.assertEqual(dead_letter.subject, "123")
+        self.assertEqual(dead_letter.cloudevent["subject"], "123")
+        self.assertEqual(dead_letter.reason, "OperationalError: broker unavailable")
+
+    def test_celery_task_failed(self, m):
+        # sent by celery when the task fails after the last retry
+        task_failure.send(
+            sender=send_cloudevent,
+            task_id="1",
+            exception=CloudEventException("503 Server Error"),
+            args=({"id": "1", "type": EVENT_TYPE, "subject": "123"},),
+            kwargs={},
+            traceback=None,
+            einfo=None,
+        )
+
+        dead_letter = DeadLetterCloudEvent.objects.get()
+        self.assertEqual(dead_letter.cloudevent["id"], "1")
+        self.assertEqual(dead_letter.reason, "CloudEventException: 503 Server Error")
+
+    def test_other_task_failed(self, m):
+        task_failure.send(
+            sender=send_notification,
+            task_id="1",
+            exception=Exception(),
+            args=({"kanaal": "taken"},),
+            kwargs={},
+            traceback=None,
+            einfo=None,
+        )
+
+        self.assertFalse(DeadLetterCloudEvent.objects.exists())
+
+
+@patch("notifications_api_common.tasks.send_cloudevent.delay")
+class ReplayDeadLettersTestCase(TestCase):
+    def test_replay(self, mock_send):
+        create_dead_letter("1")
+        create_dead_letter("2")
+
+        replayed = replay_dead_letters(DeadLetterCloudEvent.objects.all(), rate=0)
+
+        self.assertEqual(replayed, 2)
+        self.assertEqual(
+            [call[0][0]["subject"] for call in mock_send.call_args_list], ["1", "2"]
+        )
+        self.assertFalse(DeadLetterCloudEvent.objects.exists())
+
+    @override_settings(CLOUDEVENTS_DELIVERY_WORKER=True)
+    def test_replay_to_buffer(self, mock_send):
+        create_dead_letter("1")
+
+        replay_dead_letters(DeadLetterCloudEvent.objects.all(), rate=0)
+
+        mock_send.assert_not_called()
+        self.assertEqual(BufferedCloudEvent.objects.get().cloudevent["id"], "1")
+
+    @patch("openvtb.cloudevents.dead_letters.time.sleep")
+    def test_throttle(self, mock_sleep, mock_send):
+        for index in range(5):
+            create_dead_letter(str(index))
+
+        replay_dead_letters(DeadLetterCloudEvent.objects.all(), rate=2)
+
+        self.assertEqual(mock_send.call_count, 5)
+        # in chunks of 2 events per second
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertAlmostEqual(mock_sleep.call_args_list[0][0][0], 1, places=1)
+
+    def test_command(self, mock_send):
+        create_dead_letter("1", failed_at=timezone.now() - timedelta(days=2))
+        create_dead_letter("2")
+        create_dead_letter("3")
+
+        stdout = StringIO()
+        call_command(
+            "replay_cloudevents",
+            "--subject=2",
+            "--rate=0",
+            stdout=stdout,
+        )
+        call_command(
+            "replay_cloudevents",
+            f"--failed-before={(timezone.now() - timedelta(days=1)).isoformat()}",
+            "--rate=0",
+            stdout=stdout,
+        )
+
+        self.assertEqual(
+            [call[0][0]["subject"] for call in mock_send.call_args_list], ["2", "1"]
+        )
+        self.assertEqual(DeadLetterCloudEvent.objects.get().subject, "3")
+
+    def test_command_dry_run(self, mock_send):
+        create_dead_letter("1")
+
+        stdout = StringIO()
+        call_command("replay_cloudevents", "--dry-run", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), "1 cloud events would be replayed.")
+        mock_send.assert_not_called()
+        self.assertTrue(DeadLetterCloudEvent.objects.exists())
@@ -0,0 +1,157 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from django.test import TransactionTestCase, override_settings
+
+import httpx
+
+from ..batch import BATCH_CONTENT_TYPE
+from ..delivery import CONTENT_TYPE, DeliveryWorker, Subscriber
+from ..models import BufferedCloudEvent, DeadLetterCloudEvent
+
+RECEIVER_URL = "http://receiver.local/cloudevents"
+
+
+def buffer_cloudevents(count: int) -> None:
+    BufferedCloudEvent.objects.bulk_create(
+        BufferedCloudEvent(cloudevent={"id": str(index), "type": "test"})
+        for index in range(count)
+    )
+
+
+@override_settings(
+    CLOUDEVENTS_DELIVERY_MAX_ATTEMPTS=3,
+    CLOUDEVENTS_CIRCUIT_BREAKER_THRESHOLD=5,
+    CLOUDEVENTS_CIRCUIT_BREAKER_COOLDOWN=30,
+)
+class DeliveryWorkerTestCase(TransactionTestCase):
+    def run_worker(self, responses: list[int], batch_size: int = 1):
+        """
+        Run the worker until the buffer is empty, with a receiver which answers
+        with the given status codes (the last one is repeated).
+        """
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(responses[min(len(requests), len(responses)) - 1])
+
+        worker = DeliveryWorker(
+            subscriber_factory=lambda: Subscriber(url=RECEIVER_URL, concurrency=2),
+            batch_size=batch_size,
+            poll_interval=0,
+            exit_when_empty=True,
+        )
+        with patch.object(
+            DeliveryWorker,
+            "_http_client",
+            lambda self, subscriber: httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ),
+        ):
+            asyncio.run(worker.run())
+        return worker, requests
+
+    def test_deliver(self):
+        buffer_cloudevents(3)
+
+        worker, requests = self.run_worker([202])
+
+        self.assertEqual(worker.delivered, 3)
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(requests[0].headers["Content-Type"], CONTENT_TYPE)
+        self.assertEqual(
+            sorted(json.loads(request.content)["id"] for request in requests),
+            ["0", "1", "2"],
+        )
+
+    def test_deliver_batches(self):
+        buffer_cloudevents(3)
+
+        worker, requests = self.run_worker([202], batch_size=2)
+
+        self.assertEqual(worker.delivered, 3)
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+        self.assertEqual(len(requests), 2)
+        batches = [
+            json.loads(request.content)
+            for request in requests
+            if request.headers["Content-Type"] == BATCH_CONTENT_TYPE
+        ]
+        self.assertEqual([len(batch) for batch in batches], [2])
+
+    def test_batch_not_supported(self):
+        buffer_cloudevents(2)
+
+        worker, requests = self.run_worker([415, 202], batch_size=2)
+
+        # the batch is sent again as single events
+        self.assertEqual(worker.delivered, 2)
+        self.assertEqual(worker.failed, 0)
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(requests[0].headers["Content-Type"], BATCH_CONTENT_TYPE)
+        self.assertEqual(requests[1].headers["Content-Type"], CONTENT_TYPE)
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+
+    def test_retry_failed(self):
+        buffer_cloudevents(1)
+
+        worker, requests = self.run_worker([503])
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(worker.failed, 1)
+        # the event is retried later
+        cloudevent = BufferedCloudEvent.objects.get()
+        self.assertEqual(cloudevent.attempts, 1)
+        self.assertIsNotNone(cloudevent.locked_until)
+
+    def test_give_up_after_max_attempts(self):
+        BufferedCloudEvent.objects.create(
+            cloudevent={"id": "0", "type": "test"}, attempts=2
+        )
+
+        worker, _requests = self.run_worker([503])
+
+        self.assertEqual(worker.failed, 1)
+        self.assertFalse(BufferedCloudEvent.objects.exists())
+        dead_letter = DeadLetterCloudEvent.objects.get()
+        self.assertEqual(dead_letter.cloudevent["id"], "0")
+        self.assertEqual(dead_letter.reason, "HTTP 503 (after 3 attempts)")
+
+    @override_settings(CLOUDEVENTS_CIRCUIT_BREAKER_THRESHOLD=1)
+    def test_circuit_breaker(self):
+        buffer_cloudevents(5)
+
+        worker = DeliveryWorker(
+            subscriber_factory=lambda: Subscriber(url=RECEIVER_URL, concurrency=1),
+            poll_interval=0,
+        )
+        requests = []
+
+        async def run():
+            stop = asyncio.Event()
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                requests.append(request)
+                return httpx.Response(503)
+
+            with patch.object(
+                DeliveryWorker,
+                "_http_client",
+                lambda self, subscriber: httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                ),
+            ):
+                task = asyncio.create_task(worker.run(stop))
+                await asyncio.sleep(0.5)
+                stop.set()
+                await task
+
+        asyncio.run(run())
+
+        # the receiver is not called again while the circuit is open
+        self.assertEqual(len(requests), 1)
+        self.assertGreater(worker.subscriber.circuit_breaker.retry_after, 0)
+        self.assertEqual(BufferedCloudEvent.objects.count(), 5)
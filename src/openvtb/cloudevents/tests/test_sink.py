@@ -0,0 +1,55 @@
+import json
+from unittest import TestCase
+
+import requests
+
+from ..batch import BATCH_CONTENT_TYPE
+from ..sink import CloudEventSink
+
+
+class CloudEventSinkTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sink = CloudEventSink()
+        self.sink.start()
+        self.addCleanup(self.sink.stop)
+
+    def post(self, payload, content_type="application/cloudevents+json"):
+        return requests.post(
+            f"{self.sink.url}cloudevents",
+            data=json.dumps(payload),
+            headers={"Content-Type": content_type},
+            timeout=5,
+        )
+
+    def test_report(self):
+        self.post({"id": "1", "type": "test", "time": "2026-01-01T00:00:02Z"})
+        self.post(
+            [
+                {"id": "2", "type": "test", "time": "2026-01-01T00:00:01Z"},
+                {"id": "1", "type": "test", "time": "2026-01-01T00:00:02Z"},
+            ],
+            content_type=BATCH_CONTENT_TYPE,
+        )
+
+        report = self.sink.get_report()
+
+        self.assertEqual(report["requests"], 2)
+        self.assertEqual(report["received"], 3)
+        self.assertEqual(report["duplicates"], 1)
+        self.assertEqual(report["out_of_order"], 1)
+
+    def test_report_since(self):
+        response = self.post({"id": "1", "type": "test"})
+
+        self.assertEqual(response.status_code, 202)
+        report = self.sink.get_report(since=self.sink.events[0].received_at - 1)
+        self.assertAlmostEqual(report["latency_max"], 1, places=2)
+
+    def test_status_code(self):
+        self.sink.status_code = 503
+
+        response = self.post({"id": "1", "type": "test"})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.sink.get_report()["received"], 0)
@@ -20,5 +20,6 @@ class BerichtAdmin(admin.ModelAdmin):
         "is_gerelateerd_aan",
     )
     readonly_fields = ("uuid",)
+    list_filter = ("gearchiveerd",)
     search_fields = ("uuid", "onderwerp")
     inlines = [BijlageInline]
@@ -58,6 +58,8 @@ class BerichtSerializer(URNModelSerializer, serializers.ModelSerializer):
         help_text=get_help_text("berichten.Bericht", "is_gerelateerd_aan"),
     )
 
+    deferrable_fields = ("bericht_tekst",)
+
     class Meta:
         model = Bericht
         fields = (
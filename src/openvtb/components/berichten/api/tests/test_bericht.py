@@ -1,5 +1,7 @@
 import datetime
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from freezegun import freeze_time
@@ -300,3 +302,20 @@ class BerichtTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         self.assertEqual(response.data["code"], "method_not_allowed")
         self.assertEqual(response.data["detail"], 'Methode "DELETE" niet toegestaan.')
+
+
+class BerichtSparseFieldsTests(APITestCase):
+    list_url = reverse("berichten:bericht-list")
+
+    def test_exclude_bericht_tekst(self):
+        bericht = BerichtFactory.create()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.list_url, {"exclude": "berichtTekst"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"][0]
+        self.assertNotIn("berichtTekst", data)
+        self.assertEqual(data["onderwerp"], bericht.onderwerp)
+        for query in queries:
+            self.assertNotIn('"bericht_tekst"', query["sql"])
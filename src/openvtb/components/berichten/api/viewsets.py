@@ -7,6 +7,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from vng_api_common.pagination import DynamicPageSizePagination
 
+from openvtb.utils.api_mixins import SparseFieldsViewSetMixin
+
 from ..cloudevents import BERICHT_GEREGISTREERD, send_bericht_cloudevent
 from ..models import Bericht
 from .filters import BerichtFilter
@@ -35,7 +37,11 @@ logger = structlog.stdlib.get_logger(__name__)
         responses=BerichtSerializer,
     ),
 )
-class BerichtViewset(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+class BerichtViewset(
+    SparseFieldsViewSetMixin,
+    mixins.CreateModelMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     queryset = Bericht.objects.prefetch_related("bijlagen")
     serializer_class = BerichtSerializer
     pagination_class = DynamicPageSizePagination
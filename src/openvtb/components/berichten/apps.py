@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BerichtenConfig(AppConfig):
     name = "openvtb.components.berichten"
+
+    def ready(self):
+        from . import signals  # noqa
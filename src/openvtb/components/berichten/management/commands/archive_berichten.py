@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from openvtb.components.berichten.models import Bericht
+from openvtb.utils.archive import BaseArchiveCommand
+
+
+class Command(BaseArchiveCommand):
+    help = (
+        "Move the published berichten which are older than BERICHTEN_ARCHIVE_AFTER_DAYS "
+        "days to the archive partition. The archived berichten remain available in the API."
+    )
+    name_plural = "berichten"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.BERICHTEN_ARCHIVE_AFTER_DAYS,
+            help="Archive the berichten published more than this number of days ago.",
+        )
+
+    def get_queryset(self, **options):
+        if options["days"] < 0:
+            raise CommandError("--days can not be negative.")
+
+        return Bericht.objects.filter(
+            is_gepubliceerd=True,
+            publicatiedatum__lt=timezone.now() - timedelta(days=options["days"]),
+        )
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.15 on 2026-10-19 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def plan_unpublished_berichten(apps, schema_editor):
+    Bericht = apps.get_model("berichten", "Bericht")
+    GeplandePublicatie = apps.get_model("berichten", "GeplandePublicatie")
+
+    unpublished = Bericht.objects.filter(
+        is_gepubliceerd=False, publicatiedatum__isnull=False
+    ).values_list("id", "publicatiedatum")
+    GeplandePublicatie.objects.bulk_create(
+        (
+            GeplandePublicatie(bericht_id=bericht_id, gepland_op=publicatiedatum)
+            for bericht_id, publicatiedatum in unpublished.iterator(chunk_size=2000)
+        ),
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("berichten", "0003_alter_bericht_is_gerelateerd_aan"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GeplandePublicatie",
+            fields=[
+                (
+                    "bericht",
+                    models.OneToOneField(
+                        help_text="Het bericht waarvan de publicatie gepland is.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="geplande_publicatie",
+                        serialize=False,
+                        to="berichten.bericht",
+                    ),
+                ),
+                (
+                    "gepland_op",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="Datum/tijd waarop het bericht gepubliceerd moet worden.",
+                        verbose_name="gepland op",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Geplande publicatie",
+                "verbose_name_plural": "Geplande publicaties",
+            },
+        ),
+        migrations.RunPython(plan_unpublished_berichten, migrations.RunPython.noop),
+    ]
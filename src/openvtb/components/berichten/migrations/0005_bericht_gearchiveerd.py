@@ -0,0 +1,66 @@
+# Generated by Django 5.2.15 on 2026-10-19 15:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The partition of the berichten which are not archived is attached to the partitioned
+# table with this constraint, so Postgres does not have to scan the table for the
+# partition bound while the table is locked. The constraint is validated in a
+# separate transaction, which does not block reads and writes.
+CHECK_CONSTRAINT = "berichten_bericht_niet_gearchiveerd"
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("berichten", "0004_geplandepublicatie"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bericht",
+            name="gearchiveerd",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Geeft aan of het bericht gepubliceerd is en naar het archief is verplaatst.",
+                verbose_name="gearchiveerd",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="bijlage",
+            name="bericht",
+            field=models.ForeignKey(
+                db_constraint=False,
+                help_text="Bijlagen gekoppeld aan het bericht.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="bijlagen",
+                to="berichten.bericht",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="geplandepublicatie",
+            name="bericht",
+            field=models.OneToOneField(
+                db_constraint=False,
+                help_text="Het bericht waarvan de publicatie gepland is.",
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="geplande_publicatie",
+                serialize=False,
+                to="berichten.bericht",
+            ),
+        ),
+        migrations.RunSQL(
+            f"""
+            ALTER TABLE berichten_bericht
+            ADD CONSTRAINT {CHECK_CONSTRAINT} CHECK (gearchiveerd = false) NOT VALID
+            """,
+            f"ALTER TABLE berichten_bericht DROP CONSTRAINT {CHECK_CONSTRAINT}",
+        ),
+        migrations.RunSQL(
+            f"ALTER TABLE berichten_bericht VALIDATE CONSTRAINT {CHECK_CONSTRAINT}",
+            migrations.RunSQL.noop,
+        ),
+    ]
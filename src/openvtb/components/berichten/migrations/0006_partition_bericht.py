@@ -0,0 +1,107 @@
+# Generated by Django 5.2.15 on 2026-10-19 15:10
+
+import uuid
+
+from django.db import migrations, models
+
+# The table becomes a partitioned table, with the existing table as the partition of
+# the berichten which are not archived. The rows are not copied, but the table is
+# locked while the primary key and the unique constraint on the uuid are built again,
+# which takes time in proportion to the number of rows. The primary key and the
+# unique constraints of a partitioned table must contain the partition key, so the
+# foreign keys to the table (of the bijlagen and the planned publications) no longer
+# have a constraint.
+PARTITION_SQL = [
+    "ALTER TABLE berichten_bericht RENAME TO berichten_bericht_hot",
+    # the constraints and indexes are created again on the partitioned table
+    """
+    DO $$
+    DECLARE
+        name text;
+    BEGIN
+        FOR name IN
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = 'berichten_bericht_hot'::regclass
+            AND contype IN ('p', 'u', 'f')
+        LOOP
+            EXECUTE format('ALTER TABLE berichten_bericht_hot DROP CONSTRAINT %I', name);
+        END LOOP;
+        FOR name IN
+            SELECT indexrelid::regclass::text FROM pg_index
+            WHERE indrelid = 'berichten_bericht_hot'::regclass
+        LOOP
+            EXECUTE format('DROP INDEX %s', name);
+        END LOOP;
+    END $$
+    """,
+    # partitioned tables can only have an identity column as of Postgres 17
+    "ALTER TABLE berichten_bericht_hot ALTER COLUMN id DROP IDENTITY IF EXISTS",
+    "ALTER TABLE berichten_bericht_hot ALTER COLUMN id DROP DEFAULT",
+    "DROP SEQUENCE IF EXISTS berichten_bericht_id_seq",
+    # without the check constraint of the partition, which does not hold for the
+    # archive partition
+    """
+    CREATE TABLE berichten_bericht (
+        LIKE berichten_bericht_hot INCLUDING DEFAULTS
+    ) PARTITION BY LIST (gearchiveerd)
+    """,
+    "CREATE SEQUENCE berichten_bericht_id_seq AS integer OWNED BY berichten_bericht.id",
+    """
+    SELECT setval('berichten_bericht_id_seq', COALESCE(MAX(id), 0) + 1, false)
+    FROM berichten_bericht_hot
+    """,
+    """
+    ALTER TABLE berichten_bericht
+    ALTER COLUMN id SET DEFAULT nextval('berichten_bericht_id_seq')
+    """,
+    """
+    ALTER TABLE berichten_bericht
+    ADD CONSTRAINT berichten_bericht_pkey PRIMARY KEY (id, gearchiveerd)
+    """,
+    """
+    ALTER TABLE berichten_bericht
+    ADD CONSTRAINT berichten_bericht_unique_uuid UNIQUE (uuid, gearchiveerd)
+    """,
+    # the check constraint of the partition proves the partition bound, so the table
+    # is not scanned, and is redundant afterwards
+    """
+    ALTER TABLE berichten_bericht
+    ATTACH PARTITION berichten_bericht_hot FOR VALUES IN (false)
+    """,
+    "ALTER TABLE berichten_bericht_hot DROP CONSTRAINT berichten_bericht_niet_gearchiveerd",
+    """
+    CREATE TABLE berichten_bericht_archief
+    PARTITION OF berichten_bericht FOR VALUES IN (true)
+    """,
+]
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("berichten", "0005_bericht_gearchiveerd"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(PARTITION_SQL),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="bericht",
+                    name="uuid",
+                    field=models.UUIDField(
+                        default=uuid.uuid4,
+                        help_text="Unieke identificatiecode (UUID4) voor het Bericht.",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="bericht",
+                    constraint=models.UniqueConstraint(
+                        fields=("uuid", "gearchiveerd"),
+                        name="berichten_bericht_unique_uuid",
+                    ),
+                ),
+            ],
+        ),
+    ]
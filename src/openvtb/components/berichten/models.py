@@ -8,13 +8,20 @@ from django.utils.translation import gettext_lazy as _
 
 from openvtb.components.constants import HandelingsPerspectiefEnum
 from openvtb.components.schemas import IS_GERELATEERD_AAN_SCHEMA
+from openvtb.utils.archive import ArchivableModelMixin
 from openvtb.utils.fields import URNField
 from openvtb.utils.validators import validate_jsonschema
 
 
-class Bericht(models.Model):
+class Bericht(ArchivableModelMixin, models.Model):
+    """
+    The table is partitioned on ``gearchiveerd``, so the old published berichten are
+    moved to the archive partition (see ``manage.py archive_berichten``) and the
+    indexes of the hot partition stay small. Queries on the table are transparent for
+    the partitions.
+    """
+
     uuid = models.UUIDField(
-        unique=True,
         default=uuid.uuid4,
         help_text=_("Unieke identificatiecode (UUID4) voor het Bericht."),
     )
@@ -113,14 +120,34 @@ class Bericht(models.Model):
         help_text=_("Lijst met URN’s naar de ZAAK of het PRODUCT."),
         encoder=DjangoJSONEncoder,
     )
+    gearchiveerd = models.BooleanField(
+        _("gearchiveerd"),
+        default=False,
+        editable=False,
+        help_text=_(
+            "Geeft aan of het bericht gepubliceerd is en naar het archief is verplaatst."
+        ),
+    )
+
+    # a bericht which is no longer published is moved back to the hot partition
+    archive_fields = frozenset({"is_gepubliceerd"})
 
     class Meta:
         verbose_name = _("Bericht")
         verbose_name_plural = _("Berichten")
+        constraints = [
+            # the unique constraints of a partitioned table contain the partition key
+            models.UniqueConstraint(
+                fields=["uuid", "gearchiveerd"], name="berichten_bericht_unique_uuid"
+            ),
+        ]
 
     def __str__(self):
         return self.onderwerp
 
+    def is_archivable(self) -> bool:
+        return self.is_gepubliceerd
+
     def clean_is_gerelateerd_aan(self):
         if not self.is_gerelateerd_aan:
             return
@@ -148,6 +175,8 @@ class Bijlage(models.Model):
     bericht = models.ForeignKey(
         Bericht,
         on_delete=models.CASCADE,
+        # the primary key of the partitioned table contains the partition key
+        db_constraint=False,
         related_name="bijlagen",
         help_text=_("Bijlagen gekoppeld aan het bericht."),
     )
@@ -184,3 +213,34 @@ class Bijlage(models.Model):
 
     def __str__(self):
         return self.informatie_object
+
+
+class GeplandePublicatie(models.Model):
+    """
+    The publication of a bericht, planned at its ``publicatiedatum``.
+
+    The planned publications are kept up to date when a bericht is saved, so the
+    due publications can be found with an index scan instead of scanning all
+    unpublished berichten.
+    """
+
+    bericht = models.OneToOneField(
+        Bericht,
+        on_delete=models.CASCADE,
+        db_constraint=False,
+        primary_key=True,
+        related_name="geplande_publicatie",
+        help_text=_("Het bericht waarvan de publicatie gepland is."),
+    )
+    gepland_op = models.DateTimeField(
+        _("gepland op"),
+        db_index=True,
+        help_text=_("Datum/tijd waarop het bericht gepubliceerd moet worden."),
+    )
+
+    class Meta:
+        verbose_name = _("Geplande publicatie")
+        verbose_name_plural = _("Geplande publicaties")
+
+    def __str__(self):
+        return f"{self.bericht} ({self.gepland_op})"
@@ -0,0 +1,29 @@
+"""
+Planning of the publication of berichten.
+
+When a bericht is saved, its publication is planned at its ``publicatiedatum`` in
+the :class:`GeplandePublicatie` table. The planned publications are sent by the
+``send_due_berichten_events`` task, which only reads the publications that are due.
+"""
+
+from .models import Bericht, GeplandePublicatie
+
+# the fields of a bericht which determine its planned publication
+PLANNING_FIELDS = frozenset({"publicatiedatum", "is_gepubliceerd"})
+
+
+def plan_publicatie(bericht: Bericht) -> None:
+    """
+    Plan the publication of a bericht, or remove it if the bericht no longer has to
+    be published.
+    """
+    if bericht.is_gepubliceerd or not bericht.publicatiedatum:
+        GeplandePublicatie.objects.filter(bericht=bericht).delete()
+        return
+
+    GeplandePublicatie.objects.bulk_create(
+        [GeplandePublicatie(bericht=bericht, gepland_op=bericht.publicatiedatum)],
+        update_conflicts=True,
+        unique_fields=["bericht"],
+        update_fields=["gepland_op"],
+    )
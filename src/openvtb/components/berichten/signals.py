@@ -0,0 +1,15 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Bericht
+from .scheduling import PLANNING_FIELDS, plan_publicatie
+
+
+@receiver(post_save, sender=Bericht)
+def plan_publicatie_on_save(
+    sender, instance: Bericht, raw=False, update_fields=None, **kwargs
+):
+    if raw or (update_fields is not None and not PLANNING_FIELDS & update_fields):
+        return
+
+    plan_publicatie(instance)
@@ -1,24 +1,33 @@
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q, QuerySet
 from django.utils import timezone
 
 import structlog
-from celery import chord
 
 from openvtb.celery import app
+from openvtb.utils.db import claim
+from openvtb.utils.leases import job_lease
 
 from .cloudevents import BERICHT_GEPUBLICEERD, send_bericht_cloudevent
-from .models import Bericht
+from .models import Bericht, GeplandePublicatie
+from .scheduling import plan_publicatie
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# maximum number of planned publications handled in one transaction
+DUE_PUBLICATIES_BATCH_SIZE = 500
+
+
+# the tasks below are no longer scheduled, they are kept for the chords which were
+# queued before the berichten were claimed one by one
+
 
 @app.task(bind=True)
 def send_bericht(self, bericht_id: int) -> int:
     """
-    Sends published CloudEvent for a bericht.
+    Sends published CloudEvent for a bericht, unless it is already published.
     """
-    bericht = Bericht.objects.get(pk=bericht_id)
-    send_bericht_cloudevent(BERICHT_GEPUBLICEERD, bericht)
-    logger.info("bericht_published", extra={"uuid": str(bericht.uuid)})
+    publish_berichten(Bericht.objects.filter(pk=bericht_id))
     return bericht_id
 
 
@@ -30,28 +39,122 @@ def mark_as_published(bericht_ids: list[int]) -> None:
     Bericht.objects.filter(id__in=bericht_ids).update(is_gepubliceerd=True)
 
 
+def publish_berichten(berichten: QuerySet[Bericht]) -> list[int]:
+    """
+    Claim a batch of the berichten whose publication date has been reached, send
+    their published events and remove their planned publications.
+
+    A bericht is claimed by marking it as published, in one
+    ``UPDATE ... RETURNING`` statement, so it is published only once, also by the
+    periodic and the planned publications which overlap. The events are handed over
+    after the transaction commits, an event which can not be handed over is kept as
+    dead letter.
+
+    Returns the ids of the claimed berichten, in order.
+    """
+    with transaction.atomic():
+        bericht_ids = claim(
+            berichten.filter(
+                publicatiedatum__lte=timezone.now(),
+                is_gepubliceerd=False,
+            ),
+            DUE_PUBLICATIES_BATCH_SIZE,
+            is_gepubliceerd=True,
+        )
+        for bericht in Bericht.objects.filter(pk__in=bericht_ids).order_by("pk"):
+            send_bericht_cloudevent(BERICHT_GEPUBLICEERD, bericht)
+            logger.info("bericht_published", uuid=str(bericht.uuid))
+        GeplandePublicatie.objects.filter(bericht_id__in=bericht_ids).delete()
+
+    return bericht_ids
+
+
 @app.task
 def send_berichten_events():
     """
     Publishes all Bericht instances whose publication date has been reached
     and which are not yet marked as published.
 
-    NOTE:
-    This implementation loads all matching IDs into memory and creates a Celery
-    signature per item at once. If the dataset grows significantly, this may
-    lead to memory pressure and large broker payloads. Consider batching or
-    chunked processing for scalability.
-    """
-    bericht_ids = list(
-        Bericht.objects.filter(
-            publicatiedatum__lte=timezone.now(),
-            is_gepubliceerd=False,
-        ).values_list("id", flat=True)
-    )
-
-    if not bericht_ids:
-        logger.info("no_berichten_to_publish")
-        return
-
-    header = [send_bericht.s(bericht_id) for bericht_id in bericht_ids]
-    chord(header)(mark_as_published.s())
+    The berichten are claimed and published in batches of
+    ``DUE_PUBLICATIES_BATCH_SIZE``, see ``publish_berichten``. Only one run is
+    executed at a time, and a run which did not finish is resumed after the last
+    published bericht.
+    """
+    with job_lease("send-berichten-events") as lease:
+        if lease is None:
+            return
+
+        published = 0
+        while True:
+            bericht_ids = publish_berichten(
+                Bericht.objects.filter(
+                    # only the hot partition contains unpublished berichten
+                    gearchiveerd=False,
+                    pk__gt=lease.checkpoint.get("bericht", 0),
+                )
+            )
+            if bericht_ids:
+                published += len(bericht_ids)
+                lease.save_checkpoint(bericht=bericht_ids[-1])
+            if len(bericht_ids) < DUE_PUBLICATIES_BATCH_SIZE:
+                break
+
+        if not published:
+            logger.info("no_berichten_to_publish")
+
+
+def _send_due_publicaties_batch() -> int:
+    """
+    Publish a batch of berichten with a due planned publication.
+
+    The planned publications of the claimed berichten are removed. Those which
+    are out of date, e.g. because the bericht was changed with
+    ``QuerySet.update()``, which skips the signals, are planned again or removed.
+    The planned publication of a bericht which is locked by another transaction is
+    kept for a next run.
+
+    Returns the number of due planned publications which were handled.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        due_ids = list(
+            GeplandePublicatie.objects.filter(gepland_op__lte=now)
+            .order_by("gepland_op")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", flat=True)[:DUE_PUBLICATIES_BATCH_SIZE]
+        )
+        if not due_ids:
+            return 0
+
+        published_ids = publish_berichten(Bericht.objects.filter(id__in=due_ids))
+
+        remaining = GeplandePublicatie.objects.filter(pk__in=due_ids).exclude(
+            pk__in=published_ids
+        )
+        # the bericht was deleted without its planned publication
+        remaining.exclude(Exists(Bericht.objects.filter(pk=OuterRef("pk")))).delete()
+        for bericht in Bericht.objects.filter(
+            Q(is_gepubliceerd=True)
+            | Q(publicatiedatum__isnull=True)
+            | Q(publicatiedatum__gt=now),
+            pk__in=remaining.values("pk"),
+        ):
+            plan_publicatie(bericht)
+
+        not_handled = remaining.filter(gepland_op__lte=now).count()
+
+    return len(due_ids) - not_handled
+
+
+@app.task(ignore_result=True)
+def send_due_berichten_events() -> None:
+    """
+    Publishes the berichten with a planned publication which is due.
+
+    Unlike ``send_berichten_events``, this only reads the due publications from
+    the ``GeplandePublicatie`` table, so it can run every few seconds.
+    """
+    # stop when a batch is not handled at all, e.g. because all its berichten are
+    # locked, instead of fetching the same batch again
+    while _send_due_publicaties_batch():
+        pass
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Bericht
+from .factories import BerichtFactory, BijlageFactory
+
+
+class ArchiveBerichtenTests(TestCase):
+    def test_archive_old_published_berichten(self):
+        old = BerichtFactory.create(
+            publicatiedatum=timezone.now() - timedelta(days=100), is_gepubliceerd=True
+        )
+        BijlageFactory.create(bericht=old)
+        BerichtFactory.create(
+            publicatiedatum=timezone.now() - timedelta(days=10), is_gepubliceerd=True
+        )
+        BerichtFactory.create(
+            publicatiedatum=timezone.now() - timedelta(days=100), is_gepubliceerd=False
+        )
+
+        stdout = StringIO()
+        call_command("archive_berichten", days=90, stdout=stdout)
+
+        self.assertIn("Archived 1 berichten.", stdout.getvalue())
+        self.assertEqual(
+            list(
+                Bericht.objects.filter(gearchiveerd=True).values_list("pk", flat=True)
+            ),
+            [old.pk],
+        )
+        # the bijlagen of an archived bericht are still related
+        self.assertEqual(Bericht.objects.get(uuid=old.uuid).bijlagen.count(), 1)
+
+    def test_unpublished_bericht_is_moved_back(self):
+        bericht = BerichtFactory.create(
+            publicatiedatum=timezone.now() - timedelta(days=100), is_gepubliceerd=True
+        )
+        call_command("archive_berichten", stdout=StringIO())
+
+        bericht.refresh_from_db()
+        self.assertTrue(bericht.gearchiveerd)
+
+        bericht.is_gepubliceerd = False
+        bericht.save()
+
+        bericht.refresh_from_db()
+        self.assertFalse(bericht.gearchiveerd)
+
+    def test_stale_bericht_is_not_moved_back(self):
+        bericht = BerichtFactory.create(
+            publicatiedatum=timezone.now() - timedelta(days=100), is_gepubliceerd=True
+        )
+        # e.g. loaded by a request which runs at the same time as the archival
+        bericht = Bericht.objects.get(pk=bericht.pk)
+        call_command("archive_berichten", stdout=StringIO())
+
+        bericht.onderwerp = "Gewijzigd"
+        bericht.save()
+
+        bericht.refresh_from_db()
+        self.assertTrue(bericht.gearchiveerd)
+        self.assertEqual(bericht.onderwerp, "Gewijzigd")
@@ -7,7 +7,8 @@ from django.utils import timezone
 from freezegun.api import freeze_time
 
 from ..cloudevents import BERICHT_GEPUBLICEERD
-from ..tasks import send_berichten_events
+from ..models import Bericht, GeplandePublicatie
+from ..tasks import send_bericht, send_berichten_events, send_due_berichten_events
 from .factories import BerichtFactory
 
 MOCKED_CLOUDEVENT_ID = "f347fd1f-dac1-4870-9dd0-f6c00edf4bf7"
@@ -132,3 +133,124 @@ class PublishedBerichtenTest(TestCase):
         bericht.refresh_from_db()
 
         self.assertFalse(bericht.is_gepubliceerd)
+
+
+@freeze_time(FROZEN_TIME)
+@patch("notifications_api_common.tasks.send_cloudevent.delay")
+@patch("notifications_api_common.cloudevents.uuid.uuid4", lambda: MOCKED_CLOUDEVENT_ID)
+@override_settings(
+    NOTIFICATIONS_SOURCE=NOTIFICATIONS_SOURCE, CELERY_TASK_ALWAYS_EAGER=True
+)
+class DuePublicatiesTest(TestCase):
+    def test_publicatie_planned_on_save(self, mock_process_cloudevent):
+        publicatiedatum = timezone.now() + timedelta(hours=2)
+        bericht = BerichtFactory.create(publicatiedatum=publicatiedatum)
+
+        self.assertEqual(bericht.geplande_publicatie.gepland_op, publicatiedatum)
+
+        with self.subTest("publicatiedatum changed"):
+            bericht.publicatiedatum = publicatiedatum + timedelta(hours=1)
+            bericht.save()
+
+            self.assertEqual(
+                GeplandePublicatie.objects.get().gepland_op,
+                publicatiedatum + timedelta(hours=1),
+            )
+
+        with self.subTest("bericht published"):
+            bericht.is_gepubliceerd = True
+            bericht.save()
+
+            self.assertFalse(GeplandePublicatie.objects.exists())
+
+    def test_send_due_publicaties(self, mock_process_cloudevent):
+        publicatiedatum = timezone.now() + timedelta(minutes=5)
+        bericht = BerichtFactory.create(publicatiedatum=publicatiedatum)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            send_due_berichten_events()
+
+        mock_process_cloudevent.assert_not_called()
+
+        with freeze_time(publicatiedatum + timedelta(seconds=1)):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_berichten_events()
+
+        bericht.refresh_from_db()
+        mock_process_cloudevent.assert_called_once()
+        payload = mock_process_cloudevent.call_args[0][0]
+        self.assertEqual(payload["type"], BERICHT_GEPUBLICEERD)
+        self.assertTrue(bericht.is_gepubliceerd)
+        self.assertFalse(GeplandePublicatie.objects.exists())
+
+        with freeze_time(publicatiedatum + timedelta(minutes=1)):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_berichten_events()
+
+        mock_process_cloudevent.assert_called_once()
+
+    def test_published_once_by_both_jobs(self, mock_process_cloudevent):
+        publicatiedatum = timezone.now() + timedelta(hours=1)
+        bericht = BerichtFactory.create(publicatiedatum=publicatiedatum)
+
+        with freeze_time(publicatiedatum):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_berichten_events()
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_berichten_events()
+            # a legacy chord which was still queued
+            with self.captureOnCommitCallbacks(execute=True):
+                send_bericht(bericht.pk)
+
+        mock_process_cloudevent.assert_called_once()
+        self.assertFalse(GeplandePublicatie.objects.exists())
+
+    def test_planned_publicatie_of_published_bericht_removed(
+        self, mock_process_cloudevent
+    ):
+        publicatiedatum = timezone.now() + timedelta(minutes=5)
+        bericht = BerichtFactory.create(publicatiedatum=publicatiedatum)
+        # published without saving the bericht, so the planning is not updated
+        Bericht.objects.filter(pk=bericht.pk).update(is_gepubliceerd=True)
+
+        with freeze_time(publicatiedatum + timedelta(seconds=1)):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_berichten_events()
+
+        mock_process_cloudevent.assert_not_called()
+        self.assertFalse(GeplandePublicatie.objects.exists())
+
+    def test_planned_publicatie_of_moved_bericht_planned_again(
+        self, mock_process_cloudevent
+    ):
+        publicatiedatum = timezone.now() + timedelta(minutes=5)
+        bericht = BerichtFactory.create(publicatiedatum=publicatiedatum)
+        # moved without saving the bericht, so the planning is not updated
+        Bericht.objects.filter(pk=bericht.pk).update(
+            publicatiedatum=publicatiedatum + timedelta(hours=1)
+        )
+
+        with freeze_time(publicatiedatum + timedelta(seconds=1)):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_berichten_events()
+
+        mock_process_cloudevent.assert_not_called()
+        self.assertEqual(
+            GeplandePublicatie.objects.get().gepland_op,
+            publicatiedatum + timedelta(hours=1),
+        )
+
+    @patch("openvtb.components.berichten.tasks.DUE_PUBLICATIES_BATCH_SIZE", 1)
+    @patch("openvtb.components.berichten.tasks.claim", return_value=[])
+    def test_locked_berichten(self, mock_claim, mock_process_cloudevent):
+        publicatiedatum = timezone.now() + timedelta(minutes=5)
+        BerichtFactory.create_batch(2, publicatiedatum=publicatiedatum)
+
+        with freeze_time(publicatiedatum + timedelta(seconds=1)):
+            with self.captureOnCommitCallbacks(execute=True):
+                # the berichten are locked by another transaction, so the run stops
+                # instead of fetching the same planned publication again
+                send_due_berichten_events()
+
+        mock_process_cloudevent.assert_not_called()
+        self.assertEqual(GeplandePublicatie.objects.count(), 2)
@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _
 
 from openvtb.components.widgets import JSONSuit
 
-from .models import ExterneTaak
+from .models import ExterneTaak, FormulierDefinitie, FormulierSjabloon
 
 
 @admin.register(ExterneTaak)
@@ -16,10 +16,11 @@ class ExterneTaakdmin(admin.ModelAdmin):
         "status",
         "startdatum",
     )
-    readonly_fields = ("uuid",)
+    readonly_fields = ("uuid", "formulier_definitie")
     list_filter = (
         "taak_soort",
         "status",
+        "gearchiveerd",
     )
     search_fields = (
         "uuid",
@@ -34,3 +35,39 @@ class ExterneTaakdmin(admin.ModelAdmin):
             },
         },
     }
+
+
+@admin.register(FormulierDefinitie)
+class FormulierDefinitieAdmin(admin.ModelAdmin):
+    list_display = ("hash", "aangemaakt_op")
+    readonly_fields = ("hash", "definitie", "aangemaakt_op")
+    search_fields = ("hash",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(FormulierSjabloon)
+class FormulierSjabloonAdmin(admin.ModelAdmin):
+    list_display = (
+        "naam",
+        "uuid",
+        "aangemaakt_op",
+        "gewijzigd_op",
+    )
+    readonly_fields = ("uuid",)
+    search_fields = (
+        "uuid",
+        "naam",
+    )
+    formfield_overrides = {
+        JSONField: {
+            "widget": JSONSuit,
+            "error_messages": {
+                "invalid": _("'%(value)s' value must be valid JSON"),
+            },
+        },
+    }
@@ -14,6 +14,12 @@ FORMULIERTAKEN_DESCRIPTION = (
     f"{json.dumps(FORMULIER_DEFINITIE_SCHEMA, indent=4)}\n```"
 )
 
+FORMULIERSJABLONEN_DESCRIPTION = (
+    "Een formulier sjabloon bevat een gevalideerde `formulierDefinitie` met standaardwaarden. "
+    "Formuliertaken kunnen met het veld `sjabloon` naar een sjabloon verwijzen, in plaats van "
+    "de volledige `formulierDefinitie` mee te sturen."
+)
+
 custom_settings = {
     "TITLE": "Taken API",
     "DESCRIPTION": _(
@@ -32,5 +38,9 @@ custom_settings = {
             "name": "formuliertaken",
             "description": FORMULIERTAKEN_DESCRIPTION,
         },
+        {
+            "name": "formuliersjablonen",
+            "description": FORMULIERSJABLONEN_DESCRIPTION,
+        },
     ],
 }
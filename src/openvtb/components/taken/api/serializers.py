@@ -1,5 +1,6 @@
 import json
 
+from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
@@ -16,8 +17,9 @@ from openvtb.utils.json_utils import get_json_schema
 from openvtb.utils.serializers import IBANField, URNField, URNModelSerializer
 from openvtb.utils.validators import StartBeforeEndValidator, validate_jsonschema
 
-from ..models import ExterneTaak
-from .validators import FormulierDefinitieValidator
+from ..formulier import validate_ontvangen_gegevens
+from ..models import ExterneTaak, FormulierSjabloon
+from .validators import FormulierDefinitieValidator, ValidatedFormulierDefinitie
 
 
 class IsGerelateerdAanSerializer(serializers.Serializer):
@@ -161,6 +163,12 @@ class FormulierTaakSerializer(CamelToUnderscoreMixin, serializers.Serializer):
     class Meta:
         model = None
 
+    def get_attribute(self, instance):
+        if isinstance(instance, ExterneTaak):
+            # the details with the shared ``formulierDefinitie`` of the taak
+            return instance.get_details()
+        return super().get_attribute(instance)
+
 
 class ExterneTaakPolymorphicSerializer(URNModelSerializer, PolymorphicSerializer):
     discriminator = Discriminator(
@@ -174,12 +182,27 @@ class ExterneTaakPolymorphicSerializer(URNModelSerializer, PolymorphicSerializer
         same_model=False,
     )
     discriminator_field = "taak_soort"
+    deferrable_fields = ("details",)
 
     is_gerelateerd_aan = serializers.ListSerializer(
         child=IsGerelateerdAanSerializer(),
         required=False,
         help_text=get_help_text("taken.ExterneTaak", "is_gerelateerd_aan"),
     )
+    sjabloon = serializers.HyperlinkedRelatedField(
+        view_name="taken:formuliersjabloon-detail",
+        lookup_field="uuid",
+        queryset=FormulierSjabloon.objects.all(),
+        write_only=True,
+        required=False,
+        help_text=_(
+            "Het FormulierSjabloon waarmee een formuliertaak wordt aangemaakt. De "
+            "`formulierDefinitie` van het sjabloon wordt overgenomen en mag niet in de "
+            "`details` worden meegegeven. Bij het aanmaken van een taak worden de `titel`, "
+            "`toelichting`, `handelingsPerspectief` en `voorinvullenGegevens` van het "
+            "sjabloon gebruikt als ze niet zijn meegegeven."
+        ),
+    )
 
     class Meta:
         model = ExterneTaak
@@ -199,6 +222,7 @@ class ExterneTaakPolymorphicSerializer(URNModelSerializer, PolymorphicSerializer
             "is_gerelateerd_aan",
             "taak_soort",
             "details",
+            "sjabloon",
         )
         validators = [
             StartBeforeEndValidator("startdatum", "einddatum_handelings_termijn"),
@@ -270,19 +294,141 @@ class ExterneTaakPolymorphicSerializer(URNModelSerializer, PolymorphicSerializer
             taak_soort = context.get(self.discriminator_field, None)
             self._init_taak_soort(taak_soort, partial)
 
+    def to_representation(self, instance):
+        if self.discriminator.group_field not in self.fields:
+            # the discriminator would render the (deferred) details anyway
+            return serializers.ModelSerializer.to_representation(self, instance)
+        return super().to_representation(instance)
+
+    def _apply_sjabloon(self, data: dict) -> dict:
+        """
+        Fill in the (already validated) ``formulierDefinitie`` and the defaults of the
+        ``sjabloon`` of a formuliertaak.
+        """
+        try:
+            sjabloon = self.fields["sjabloon"].run_validation(data.pop("sjabloon"))
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({"sjabloon": exc.detail})
+
+        taak_soort = data.get(self.discriminator_field) or getattr(
+            self.instance, self.discriminator_field, None
+        )
+        if taak_soort != SoortTaak.FORMULIERTAAK:
+            raise serializers.ValidationError(
+                {
+                    "sjabloon": _(
+                        "Een sjabloon kan alleen voor een formuliertaak worden gebruikt."
+                    )
+                },
+                code="invalid",
+            )
+
+        details = data.get("details") or {}
+        if not isinstance(details, dict):
+            return data
+        if "formulier_definitie" in details:
+            raise serializers.ValidationError(
+                {
+                    "sjabloon": _(
+                        "Een formuliertaak met een sjabloon kan geen eigen "
+                        "`formulierDefinitie` hebben."
+                    )
+                },
+                code="invalid",
+            )
+
+        data["details"] = {
+            **details,
+            "formulier_definitie": ValidatedFormulierDefinitie(
+                sjabloon.formulier_definitie
+            ),
+        }
+        if self.instance:
+            # the defaults are only used for new taken
+            return data
+
+        voorinvullen_gegevens = details.get("voorinvullen_gegevens", {})
+        if isinstance(voorinvullen_gegevens, dict):
+            data["details"]["voorinvullen_gegevens"] = {
+                **sjabloon.voorinvullen_gegevens,
+                **voorinvullen_gegevens,
+            }
+        for field in ("titel", "toelichting", "handelings_perspectief"):
+            if value := getattr(sjabloon, field):
+                data.setdefault(field, value)
+        return data
+
+    def to_internal_value(self, data):
+        if isinstance(data, dict) and "sjabloon" in data:
+            data = self._apply_sjabloon({**data})
+        return super().to_internal_value(data)
+
     def validate(self, attrs):
         renderer = CamelCaseJSONRenderer()
         details = json.loads(renderer.render(attrs.pop("details", {})))
         taak_soort = get_from_serializer_data_or_instance(
             self.discriminator_field, attrs, self
         )
+        definitie_hash = None
         if self.instance and self.instance.taak_soort == taak_soort:
+            if "formulierDefinitie" not in details:
+                # the stored definition is kept, so its hash is already known
+                definitie_hash = self.instance.formulier_definitie_id
             # update details only for the same taak_soort
-            details = {**self.instance.details, **details}
+            details = {**self.instance.get_details(), **details}
         validate_jsonschema(
             instance=details,
             label="details",
             schema=get_json_schema(taak_soort, SOORTTAAK_SCHEMA_MAPPING),
         )
+        if taak_soort == SoortTaak.FORMULIERTAAK:
+            try:
+                validate_ontvangen_gegevens(details, definitie_hash=definitie_hash)
+            except ValidationError as error:
+                raise serializers.ValidationError(
+                    error.message_dict, code="invalid-ontvangen-gegevens"
+                )
         attrs["details"] = details
         return super().validate(attrs)
+
+
+class FormulierSjabloonSerializer(URNModelSerializer, serializers.ModelSerializer):
+    deferrable_fields = ("formulier_definitie",)
+
+    class Meta:
+        model = FormulierSjabloon
+        fields = (
+            "url",
+            "urn",
+            "uuid",
+            "naam",
+            "titel",
+            "toelichting",
+            "handelings_perspectief",
+            "formulier_definitie",
+            "voorinvullen_gegevens",
+            "aangemaakt_op",
+            "gewijzigd_op",
+        )
+        validators = [FormulierDefinitieValidator()]
+        extra_kwargs = {
+            "uuid": {"read_only": True},
+            "url": {
+                "view_name": "taken:formuliersjabloon-detail",
+                "lookup_field": "uuid",
+                "help_text": _(
+                    "De unieke URL van het FormulierSjabloon binnen deze API."
+                ),
+            },
+            "urn": {
+                "lookup_field": "uuid",
+                "help_text": _("De Uniform Resource Name van het FormulierSjabloon."),
+            },
+            "formulier_definitie": {
+                "help_text": FormulierTaakSerializer._declared_fields[
+                    "formulier_definitie"
+                ].help_text,
+            },
+            "aangemaakt_op": {"read_only": True},
+            "gewijzigd_op": {"read_only": True},
+        }
@@ -1,5 +1,8 @@
 import datetime
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from freezegun import freeze_time
 from rest_framework import status
 from vng_api_common.tests import get_validation_errors, reverse
@@ -595,3 +598,65 @@ class ExterneTaakTests(APITestCase):
         response = self.client.get(self.list_url)
         self.assertEqual(response.json()["count"], 0)
         self.assertFalse(ExterneTaak.objects.exists())
+
+
+class ExterneTaakSparseFieldsTests(APITestCase):
+    list_url = reverse("taken:externetaak-list")
+
+    def setUp(self):
+        super().setUp()
+        self.taak = ExterneTaakFactory.create(formuliertaak=True)
+
+    def test_fields(self):
+        response = self.client.get(self.list_url, {"fields": "uuid,taakSoort"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [{"uuid": str(self.taak.uuid), "taakSoort": SoortTaak.FORMULIERTAAK}],
+        )
+
+    def test_exclude(self):
+        detail_url = reverse(
+            "taken:externetaak-detail", kwargs={"uuid": self.taak.uuid}
+        )
+
+        response = self.client.get(detail_url, {"exclude": "details,isToegewezenAan"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertNotIn("details", data)
+        self.assertNotIn("isToegewezenAan", data)
+        self.assertEqual(data["uuid"], str(self.taak.uuid))
+
+    def test_excluded_details_are_not_fetched(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.list_url, {"exclude": "details"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("details", response.json()["results"][0])
+        taken_queries = [
+            query["sql"] for query in queries if "taken_externetaak" in query["sql"]
+        ]
+        self.assertTrue(taken_queries)
+        for sql in taken_queries:
+            self.assertNotIn('"details"', sql)
+
+    def test_unknown_field(self):
+        response = self.client.get(self.list_url, {"fields": "uuid,onbekend"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "fields")
+        self.assertEqual(error["code"], "unknown-fields")
+
+    def test_write_responses_are_complete(self):
+        detail_url = reverse(
+            "taken:externetaak-detail", kwargs={"uuid": self.taak.uuid}
+        )
+
+        response = self.client.patch(
+            f"{detail_url}?fields=uuid", {"titel": "Nieuwe titel"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("details", response.json())
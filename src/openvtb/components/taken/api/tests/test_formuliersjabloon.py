@@ -0,0 +1,205 @@
+import datetime
+from unittest.mock import patch
+
+from freezegun import freeze_time
+from rest_framework import status
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openvtb.components.constants import HandelingsPerspectiefEnum
+from openvtb.components.taken.constants import SoortTaak
+from openvtb.components.taken.models import ExterneTaak, FormulierSjabloon
+from openvtb.components.taken.tests.factories import (
+    FORM_IO,
+    ExterneTaakFactory,
+    FormulierSjabloonFactory,
+)
+from openvtb.utils.api_testcase import APITestCase
+
+
+@freeze_time("2026-01-01")
+class FormulierSjabloonTests(APITestCase):
+    list_url = reverse("taken:formuliersjabloon-list")
+
+    def test_list(self):
+        sjabloon = FormulierSjabloonFactory.create()
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "url": f"http://testserver{reverse('taken:formuliersjabloon-detail', kwargs={'uuid': str(sjabloon.uuid)})}",
+                    "urn": f"urn:maykin:taken:formuliersjabloon:{sjabloon.uuid}",
+                    "uuid": str(sjabloon.uuid),
+                    "naam": sjabloon.naam,
+                    "titel": sjabloon.titel,
+                    "toelichting": "",
+                    "handelingsPerspectief": "",
+                    "formulierDefinitie": FORM_IO,
+                    "voorinvullenGegevens": {"textField": "Test value"},
+                    "aangemaaktOp": "2026-01-01",
+                    "gewijzigdOp": "2026-01-01",
+                }
+            ],
+        )
+
+    def test_create(self):
+        response = self.client.post(
+            self.list_url,
+            {
+                "naam": "aanvraag",
+                "titel": "Vul het formulier in",
+                "formulierDefinitie": FORM_IO,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        sjabloon = FormulierSjabloon.objects.get()
+        self.assertEqual(sjabloon.formulier_definitie, FORM_IO)
+        self.assertEqual(sjabloon.voorinvullen_gegevens, {})
+
+    def test_create_invalid_formulier_definitie(self):
+        response = self.client.post(
+            self.list_url,
+            {
+                "naam": "aanvraag",
+                "formulierDefinitie": {"components": [{"label": "test"}]},
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            get_validation_errors(response, "formulierDefinitie.components.0"),
+            {
+                "name": "formulierDefinitie.components.0",
+                "code": "invalid-json-schema",
+                "reason": "'key' is a required property",
+            },
+        )
+        self.assertFalse(FormulierSjabloon.objects.exists())
+
+
+@freeze_time("2026-01-01")
+class FormulierTaakSjabloonTests(APITestCase):
+    list_url = reverse("taken:formuliertaak-list")
+
+    def setUp(self):
+        super().setUp()
+
+        self.sjabloon = FormulierSjabloonFactory.create(
+            titel="Vul het formulier in",
+            handelings_perspectief=HandelingsPerspectiefEnum.INFORMATIE_GEVEN,
+            voorinvullen_gegevens={"textField": "sjabloon", "other": "sjabloon"},
+        )
+        self.sjabloon_url = reverse(
+            "taken:formuliersjabloon-detail", kwargs={"uuid": str(self.sjabloon.uuid)}
+        )
+
+    def test_create_with_sjabloon(self):
+        data = {
+            "sjabloon": f"http://testserver{self.sjabloon_url}",
+            "einddatumHandelingsTermijn": datetime.date(2026, 1, 10),
+            "details": {"voorinvullenGegevens": {"textField": "taak"}},
+        }
+
+        with patch(
+            "openvtb.components.taken.api.validators.validate_jsonschema"
+        ) as mock_validate:
+            response = self.client.post(self.list_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # the formulierDefinitie of the sjabloon is not validated again
+        mock_validate.assert_not_called()
+
+        taak = ExterneTaak.objects.get()
+        self.assertEqual(taak.taak_soort, SoortTaak.FORMULIERTAAK)
+        self.assertEqual(taak.titel, "Vul het formulier in")
+        self.assertEqual(
+            taak.handelings_perspectief, HandelingsPerspectiefEnum.INFORMATIE_GEVEN
+        )
+        self.assertEqual(
+            response.json()["details"],
+            {
+                "formulierDefinitie": FORM_IO,
+                "voorinvullenGegevens": {"textField": "taak", "other": "sjabloon"},
+                "ontvangenGegevens": {},
+            },
+        )
+        self.assertNotIn("sjabloon", response.json())
+
+    def test_create_with_sjabloon_overrides_defaults(self):
+        data = {
+            "sjabloon": f"http://testserver{self.sjabloon_url}",
+            "titel": "titel",
+            "einddatumHandelingsTermijn": datetime.date(2026, 1, 10),
+            "details": {},
+        }
+
+        response = self.client.post(self.list_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["titel"], "titel")
+
+    def test_create_with_sjabloon_and_formulier_definitie(self):
+        data = {
+            "sjabloon": f"http://testserver{self.sjabloon_url}",
+            "einddatumHandelingsTermijn": datetime.date(2026, 1, 10),
+            "details": {"formulierDefinitie": FORM_IO},
+        }
+
+        response = self.client.post(self.list_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(get_validation_errors(response, "sjabloon")["code"], "invalid")
+        self.assertFalse(ExterneTaak.objects.exists())
+
+    def test_create_with_unknown_sjabloon(self):
+        sjabloon_url = reverse(
+            "taken:formuliersjabloon-detail",
+            kwargs={"uuid": "4e0e5a08-7bd4-4bba-9e2e-b3d3cdb9d3d1"},
+        )
+        data = {
+            "sjabloon": f"http://testserver{sjabloon_url}",
+            "einddatumHandelingsTermijn": datetime.date(2026, 1, 10),
+            "details": {},
+        }
+
+        response = self.client.post(self.list_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            get_validation_errors(response, "sjabloon")["code"], "does_not_exist"
+        )
+
+    def test_sjabloon_for_other_taak_soort(self):
+        data = {
+            "sjabloon": f"http://testserver{self.sjabloon_url}",
+            "titel": "titel",
+            "taakSoort": SoortTaak.URLTAAK,
+            "einddatumHandelingsTermijn": datetime.date(2026, 1, 10),
+            "details": {"uitvraagLink": "http://example.com/"},
+        }
+
+        response = self.client.post(reverse("taken:externetaak-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(get_validation_errors(response, "sjabloon")["code"], "invalid")
+
+    def test_update_with_sjabloon(self):
+        taak = ExterneTaakFactory.create(
+            formuliertaak=True,
+            details={"formulierDefinitie": {"components": []}},
+        )
+        detail_url = reverse(
+            "taken:formuliertaak-detail", kwargs={"uuid": str(taak.uuid)}
+        )
+
+        response = self.client.patch(
+            detail_url, {"sjabloon": f"http://testserver{self.sjabloon_url}"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        taak.refresh_from_db()
+        self.assertEqual(taak.details["formulierDefinitie"], FORM_IO)
@@ -1,12 +1,14 @@
 import datetime
 import uuid
 
+from django.test import override_settings
+
 from freezegun import freeze_time
 from rest_framework import status
 from vng_api_common.tests import get_validation_errors, reverse
 
 from openvtb.components.taken.constants import SoortTaak
-from openvtb.components.taken.models import ExterneTaak
+from openvtb.components.taken.models import ExterneTaak, FormulierDefinitie
 from openvtb.components.taken.tests.factories import FORM_IO, ExterneTaakFactory
 from openvtb.utils.api_testcase import APITestCase
 
@@ -673,6 +675,59 @@ class FormulierTaakTests(APITestCase):
         self.assertFalse(ExterneTaak.objects.exists())
 
 
+@freeze_time("2026-01-01")
+@override_settings(TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION=True)
+class FormulierTaakDeduplicationTests(APITestCase):
+    list_url = reverse("taken:formuliertaak-list")
+
+    def test_create_and_list(self):
+        data = {
+            "titel": "titel",
+            "einddatumHandelingsTermijn": datetime.date(2026, 1, 10),
+            "details": {
+                "formulierDefinitie": FORM_IO,
+                "voorinvullenGegevens": {"textField": "value"},
+            },
+        }
+
+        for _ in range(2):
+            response = self.client.post(self.list_url, data)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(response.json()["details"]["formulierDefinitie"], FORM_IO)
+
+        self.assertEqual(FormulierDefinitie.objects.count(), 1)
+        self.assertEqual(ExterneTaak.objects.count(), 2)
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for taak in response.json()["results"]:
+            self.assertEqual(
+                taak["details"],
+                {
+                    "formulierDefinitie": FORM_IO,
+                    "voorinvullenGegevens": {"textField": "value"},
+                },
+            )
+
+    def test_update_partial_keeps_definitie(self):
+        formuliertaak = ExterneTaakFactory.create(formuliertaak=True)
+        detail_url = reverse(
+            "taken:formuliertaak-detail", kwargs={"uuid": str(formuliertaak.uuid)}
+        )
+
+        response = self.client.patch(
+            detail_url, {"details": {"ontvangenGegevens": {"textField": "value"}}}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["details"]["formulierDefinitie"], FORM_IO)
+        formuliertaak.refresh_from_db()
+        self.assertNotIn("formulierDefinitie", formuliertaak.details)
+        self.assertEqual(formuliertaak.get_details()["formulierDefinitie"], FORM_IO)
+        self.assertEqual(FormulierDefinitie.objects.count(), 1)
+
+
 class FormulierTaakValidationTests(APITestCase):
     list_url = reverse("taken:formuliertaak-list")
 
@@ -992,3 +1047,25 @@ class FormulierTaakValidationTests(APITestCase):
                 },
             )
             self.assertFalse(ExterneTaak.objects.exists())
+
+    def test_invalid_ontvangen_gegevens(self):
+        data = {
+            "titel": "titel",
+            "einddatumHandelingsTermijn": datetime.date(2026, 1, 10),
+            "details": {
+                "formulierDefinitie": FORM_IO,
+                "ontvangenGegevens": {"textField": 1},
+            },
+        }
+        response = self.client.post(self.list_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            get_validation_errors(response, "details.ontvangenGegevens.textField"),
+            {
+                "name": "details.ontvangenGegevens.textField",
+                "code": "invalid-ontvangen-gegevens",
+                "reason": "Verwacht een tekst.",
+            },
+        )
+        self.assertFalse(ExterneTaak.objects.exists())
@@ -6,6 +6,7 @@ from vng_api_common import routers
 from openvtb.components.taken.api.viewsets import (
     BetaalTaakViewSet,
     ExterneTaakViewSet,
+    FormulierSjabloonViewSet,
     FormulierTaakViewSet,
     URLTaakViewSet,
 )
@@ -32,6 +33,7 @@ router.register(
     FormulierTaakViewSet,
     basename="formuliertaak",
 )
+router.register("formuliersjablonen", FormulierSjabloonViewSet)
 
 
 urlpatterns = [
@@ -9,6 +9,7 @@ from ..cloudevents import (
     send_taak_cloudevent,
 )
 from ..constants import StatusTaak
+from .serializers import FormulierTaakSerializer
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -82,6 +83,10 @@ def make_inline_response(
     if write and "taak_soort" in parent_fields:
         parent_fields.pop("taak_soort")
 
+    # a sjabloon can only be used to write formuliertaken
+    if not write or inner_serializer_class is not FormulierTaakSerializer:
+        parent_fields.pop("sjabloon", None)
+
     parent_fields["details"] = inner_serializer_class()
 
     return inline_serializer(
@@ -8,6 +8,13 @@ from openvtb.utils.validators import validate_jsonschema
 from ..schemas import FORMULIER_DEFINITIE_SCHEMA
 
 
+class ValidatedFormulierDefinitie(dict):
+    """
+    A ``formulier_definitie`` that is already validated, like the definition of a
+    ``FormulierSjabloon``, which is not validated again for every taak.
+    """
+
+
 class FormulierDefinitieValidator:
     """
     Validates the ``formulier_definitie`` field against ``FORMULIER_DEFINITIE_SCHEMA``.
@@ -22,7 +29,7 @@ class FormulierDefinitieValidator:
         instance = get_from_serializer_data_or_instance(
             "formulier_definitie", attrs, serializer
         )
-        if instance is None:
+        if instance is None or isinstance(instance, ValidatedFormulierDefinitie):
             return
 
         try:
@@ -4,12 +4,15 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from vng_api_common.pagination import DynamicPageSizePagination
 
+from openvtb.utils.api_mixins import SparseFieldsViewSetMixin
+
 from ..constants import SoortTaak
-from ..models import ExterneTaak
+from ..models import ExterneTaak, FormulierSjabloon
 from .filters import ExterneTaakFilter
 from .serializers import (
     BetaalTaakSerializer,
     ExterneTaakPolymorphicSerializer,
+    FormulierSjabloonSerializer,
     FormulierTaakSerializer,
     URLTaakSerializer,
 )
@@ -44,8 +47,10 @@ logger = structlog.stdlib.get_logger(__name__)
         description="Een externe taak verwijderen",
     ),
 )
-class ExterneTaakViewSet(TaakCloudEventsMixin, viewsets.ModelViewSet):
-    queryset = ExterneTaak.objects.all()
+class ExterneTaakViewSet(
+    SparseFieldsViewSetMixin, TaakCloudEventsMixin, viewsets.ModelViewSet
+):
+    queryset = ExterneTaak.objects.prefetch_related("formulier_definitie")
     serializer_class = ExterneTaakPolymorphicSerializer
     pagination_class = DynamicPageSizePagination
     permission_classes = (IsAuthenticated,)
@@ -135,7 +140,12 @@ class ExterneTaakViewSet(TaakCloudEventsMixin, viewsets.ModelViewSet):
         },
     ),
 )
-class BetaalTaakViewSet(TaakCloudEventsMixin, SoortTaakMixin, viewsets.ModelViewSet):
+class BetaalTaakViewSet(
+    SparseFieldsViewSetMixin,
+    TaakCloudEventsMixin,
+    SoortTaakMixin,
+    viewsets.ModelViewSet,
+):
     queryset = ExterneTaak.objects.all()
     serializer_class = ExterneTaakPolymorphicSerializer
     pagination_class = DynamicPageSizePagination
@@ -227,7 +237,12 @@ class BetaalTaakViewSet(TaakCloudEventsMixin, SoortTaakMixin, viewsets.ModelView
         },
     ),
 )
-class URLTaakViewSet(TaakCloudEventsMixin, SoortTaakMixin, viewsets.ModelViewSet):
+class URLTaakViewSet(
+    SparseFieldsViewSetMixin,
+    TaakCloudEventsMixin,
+    SoortTaakMixin,
+    viewsets.ModelViewSet,
+):
     queryset = ExterneTaak.objects.all()
     serializer_class = ExterneTaakPolymorphicSerializer
     pagination_class = DynamicPageSizePagination
@@ -319,11 +334,50 @@ class URLTaakViewSet(TaakCloudEventsMixin, SoortTaakMixin, viewsets.ModelViewSet
         },
     ),
 )
-class FormulierTaakViewSet(TaakCloudEventsMixin, SoortTaakMixin, viewsets.ModelViewSet):
-    queryset = ExterneTaak.objects.all()
+class FormulierTaakViewSet(
+    SparseFieldsViewSetMixin,
+    TaakCloudEventsMixin,
+    SoortTaakMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = ExterneTaak.objects.prefetch_related("formulier_definitie")
     serializer_class = ExterneTaakPolymorphicSerializer
     pagination_class = DynamicPageSizePagination
     permission_classes = (IsAuthenticated,)
     lookup_field = "uuid"
     taak_soort = SoortTaak.FORMULIERTAAK
     filterset_class = ExterneTaakFilter
+
+
+@extend_schema_view(
+    list=extend_schema(
+        summary="Vraag alle formulier sjablonen aan.",
+        description="Vraag alle formulier sjablonen aan.",
+    ),
+    retrieve=extend_schema(
+        summary="Een specifiek formulier sjabloon opvragen.",
+        description="Een specifiek formulier sjabloon opvragen.",
+    ),
+    create=extend_schema(
+        summary="Maak een formulier sjabloon aan.",
+        description="Maak een formulier sjabloon aan.",
+    ),
+    update=extend_schema(
+        summary="Volledig formulier sjabloon wijzigen.",
+        description="Volledig formulier sjabloon wijzigen.",
+    ),
+    partial_update=extend_schema(
+        summary="Een formulier sjabloon gedeeltelijk wijzigen.",
+        description="Een formulier sjabloon gedeeltelijk wijzigen.",
+    ),
+    destroy=extend_schema(
+        summary="Een formulier sjabloon verwijderen",
+        description="Een formulier sjabloon verwijderen",
+    ),
+)
+class FormulierSjabloonViewSet(SparseFieldsViewSetMixin, viewsets.ModelViewSet):
+    queryset = FormulierSjabloon.objects.order_by("-pk")
+    serializer_class = FormulierSjabloonSerializer
+    pagination_class = DynamicPageSizePagination
+    permission_classes = (IsAuthenticated,)
+    lookup_field = "uuid"
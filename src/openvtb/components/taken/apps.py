@@ -3,3 +3,9 @@ from django.apps import AppConfig
 
 class TakenConfig(AppConfig):
     name = "openvtb.components.taken"
+
+    def ready(self):
+        from . import signals  # noqa
+        from .schemas import compile_schemas
+
+        compile_schemas()
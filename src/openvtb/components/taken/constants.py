@@ -10,7 +10,20 @@ class StatusTaak(models.TextChoices):
     VERWERKT = "verwerkt", _("Verwerkt")
 
 
+# the taken with these statuses are finished, and can be archived
+AFGERONDE_STATUSSEN = (
+    StatusTaak.VERWERKT,
+    StatusTaak.AFGEBROKEN,
+    StatusTaak.NIET_UITGEVOERD,
+)
+
+
 class SoortTaak(models.TextChoices):
     BETAALTAAK = "betaaltaak", _("Betaallink")
     URLTAAK = "urltaak", _("URL taak")
     FORMULIERTAAK = "formuliertaak", _("Standaard formulier")
+
+
+class GeplandTaakEventSoort(models.TextChoices):
+    HERINNERING = "herinnering", _("Herinnering")
+    VERLOPEN = "verlopen", _("Verlopen")
@@ -0,0 +1,329 @@
+"""
+Validation of the ``ontvangenGegevens`` of a formuliertaak against its (FormIO)
+``formulierDefinitie``.
+
+A definition is compiled once into a :class:`FormulierSpec`, which maps the keys of
+the input components to their type, allowed values and parser. The compiled specs
+are cached per definition hash, so validating a submission is a single pass over
+the submitted values.
+"""
+
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext as _, gettext_lazy
+
+from .models import FormulierDefinitie
+
+MAX_CACHED_SPECS = 128
+
+# components without a value in the submission
+LAYOUT_TYPES = {"panel", "fieldset", "well", "columns", "table", "tabs"}
+CONTENT_TYPES = {"content", "htmlelement"}
+
+STRING_TYPES = {
+    "textfield",
+    "textarea",
+    "email",
+    "phoneNumber",
+    "password",
+    "iban",
+    "bsn",
+    "postcode",
+    "licenseplate",
+    "signature",
+    "url",
+}
+NUMBER_TYPES = {"number", "currency"}
+BOOLEAN_TYPES = {"checkbox", "button"}
+CHOICE_TYPES = {"select", "radio"}
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    key: str
+    type: str
+    values: frozenset[str] | None = None
+    decimal_limit: int | None = None
+    multiple: bool = False
+    # the fields of a container or grid
+    fields: dict[str, "FieldSpec"] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class FormulierSpec:
+    fields: dict[str, FieldSpec]
+
+    def validate(
+        self, data: dict, label: str, reject_unknown_keys: bool = False
+    ) -> dict[str, list[str]]:
+        """
+        Return the errors of the submitted data, by path.
+        """
+        errors: dict[str, list[str]] = defaultdict(list)
+        _validate_fields(self.fields, data, label, errors, reject_unknown_keys)
+        return dict(errors)
+
+
+def _values(component: dict) -> frozenset[str] | None:
+    values = component.get("values") or component.get("data", {}).get("values")
+    if not values:
+        return None
+    return frozenset(value["value"] for value in values)
+
+
+def _compile_components(components: Iterable[dict]) -> dict[str, FieldSpec]:
+    fields: dict[str, FieldSpec] = {}
+    for component in components:
+        component_type = component.get("type")
+
+        if component_type in CONTENT_TYPES:
+            continue
+
+        if component_type in LAYOUT_TYPES or not component.get("key"):
+            # the values of the nested components are stored at the same level
+            nested = list(component.get("components", []))
+            for column in component.get("columns", []):
+                nested.extend(column.get("components", []))
+            for row in component.get("rows", []):
+                for cell in row:
+                    nested.extend(cell.get("components", []))
+            fields.update(_compile_components(nested))
+            continue
+
+        match component_type:
+            case "date" | "datetime":
+                enable_time = component.get("enableTime", component_type == "datetime")
+                spec_type = "datetime" if enable_time else "date"
+            case "selectboxes" | "container" | "datagrid" | "editgrid" | "file":
+                spec_type = component_type
+            case _ if component_type in STRING_TYPES:
+                spec_type = "string"
+            case _ if component_type in NUMBER_TYPES:
+                spec_type = "number"
+            case _ if component_type in BOOLEAN_TYPES:
+                spec_type = "boolean"
+            case _ if component_type in CHOICE_TYPES:
+                spec_type = "choice"
+            case "time":
+                spec_type = "time"
+            case _:
+                spec_type = "any"
+
+        key = component["key"]
+        fields[key] = FieldSpec(
+            key=key,
+            type=spec_type,
+            values=_values(component),
+            decimal_limit=component.get("decimalLimit"),
+            multiple=bool(component.get("multiple")) and component_type != "file",
+            fields=_compile_components(component.get("components", [])),
+        )
+    return fields
+
+
+def compile_formulier_definitie(definitie: dict) -> FormulierSpec:
+    return FormulierSpec(fields=_compile_components(definitie.get("components", [])))
+
+
+_specs: OrderedDict[str, FormulierSpec] = OrderedDict()
+_specs_lock = threading.Lock()
+
+
+def get_formulier_spec(
+    definitie: dict, definitie_hash: str | None = None
+) -> FormulierSpec:
+    """
+    Return the compiled spec of a definition from the cache, or compile it.
+    """
+    if definitie_hash is None:
+        definitie_hash = FormulierDefinitie.get_hash(definitie)
+
+    with _specs_lock:
+        if (spec := _specs.get(definitie_hash)) is not None:
+            _specs.move_to_end(definitie_hash)
+            return spec
+
+    spec = compile_formulier_definitie(definitie)
+    with _specs_lock:
+        _specs[definitie_hash] = spec
+        while len(_specs) > MAX_CACHED_SPECS:
+            _specs.popitem(last=False)
+    return spec
+
+
+def _check_string(spec: FieldSpec, value) -> str | None:
+    if not isinstance(value, str):
+        return _("Verwacht een tekst.")
+
+
+def _check_number(spec: FieldSpec, value) -> str | None:
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        return _("Verwacht een getal.")
+    try:
+        number = Decimal(str(value))
+    except InvalidOperation:
+        return _("Verwacht een getal.")
+    if not number.is_finite():
+        return _("Verwacht een getal.")
+
+    if spec.decimal_limit is not None and -number.as_tuple().exponent > max(
+        spec.decimal_limit, 0
+    ):
+        return _("Er zijn maximaal {limit} decimalen toegestaan.").format(
+            limit=spec.decimal_limit
+        )
+
+
+def _check_boolean(spec: FieldSpec, value) -> str | None:
+    if not isinstance(value, bool):
+        return _("Verwacht een boolean (true of false).")
+
+
+def _parser_check(parser: Callable[[str], object], message):
+    def check(spec: FieldSpec, value) -> str | None:
+        if value == "":
+            return
+        if not isinstance(value, str):
+            return str(message)
+        try:
+            parser(value)
+        except ValueError:
+            return str(message)
+
+    return check
+
+
+def _check_choice(spec: FieldSpec, value) -> str | None:
+    if spec.values is None or value == "":
+        return
+    if not isinstance(value, str) or value not in spec.values:
+        return _("'{value}' is geen geldige keuze.").format(value=value)
+
+
+def _check_selectboxes(spec: FieldSpec, value) -> str | None:
+    if not isinstance(value, dict) or not all(
+        isinstance(selected, bool) for selected in value.values()
+    ):
+        return _("Verwacht een object met een boolean per keuze.")
+    if spec.values is not None and (invalid := set(value) - spec.values):
+        return _("Ongeldige keuzes: {values}.").format(
+            values=", ".join(f"'{key}'" for key in sorted(invalid))
+        )
+
+
+def _check_file(spec: FieldSpec, value) -> str | None:
+    if not isinstance(value, list):
+        return _("Verwacht een lijst.")
+
+
+CHECKS = {
+    "string": _check_string,
+    "number": _check_number,
+    "boolean": _check_boolean,
+    "date": _parser_check(
+        date.fromisoformat, gettext_lazy("Verwacht een datum (JJJJ-MM-DD).")
+    ),
+    "datetime": _parser_check(
+        datetime.fromisoformat, gettext_lazy("Verwacht een datum en tijd (ISO 8601).")
+    ),
+    "time": _parser_check(
+        time.fromisoformat, gettext_lazy("Verwacht een tijd (UU:MM).")
+    ),
+    "choice": _check_choice,
+    "selectboxes": _check_selectboxes,
+    "file": _check_file,
+}
+
+
+def _validate_value(
+    spec: FieldSpec,
+    value,
+    path: str,
+    errors: dict[str, list[str]],
+    reject_unknown_keys: bool,
+) -> None:
+    if value is None or spec.type == "any":
+        return
+
+    match spec.type:
+        case "container":
+            if not isinstance(value, dict):
+                errors[path].append(_("Verwacht een object."))
+                return
+            _validate_fields(spec.fields, value, path, errors, reject_unknown_keys)
+        case "datagrid" | "editgrid":
+            if not isinstance(value, list):
+                errors[path].append(_("Verwacht een lijst."))
+                return
+            for index, row in enumerate(value):
+                row_path = f"{path}.{index}"
+                if not isinstance(row, dict):
+                    errors[row_path].append(_("Verwacht een object."))
+                    continue
+                _validate_fields(
+                    spec.fields, row, row_path, errors, reject_unknown_keys
+                )
+        case _:
+            if message := CHECKS[spec.type](spec, value):
+                errors[path].append(message)
+
+
+def _validate_fields(
+    fields: dict[str, FieldSpec],
+    data: dict,
+    path: str,
+    errors: dict[str, list[str]],
+    reject_unknown_keys: bool,
+) -> None:
+    for key, value in data.items():
+        key_path = f"{path}.{key}"
+        if (spec := fields.get(key)) is None:
+            if reject_unknown_keys:
+                errors[key_path].append(
+                    _("Dit veld komt niet voor in de formulierDefinitie.")
+                )
+            continue
+
+        if not spec.multiple:
+            _validate_value(spec, value, key_path, errors, reject_unknown_keys)
+        elif not isinstance(value, list):
+            errors[key_path].append(_("Verwacht een lijst."))
+        else:
+            for index, item in enumerate(value):
+                _validate_value(
+                    spec, item, f"{key_path}.{index}", errors, reject_unknown_keys
+                )
+
+
+def validate_ontvangen_gegevens(
+    details: dict,
+    definitie_hash: str | None = None,
+    label: str = "details",
+) -> None:
+    """
+    Validate the ``ontvangenGegevens`` of the details of a formuliertaak against
+    its ``formulierDefinitie``.
+
+    Raises:
+        ValidationError: Raises a dictionary mapping the error path to the
+            validation messages.
+    """
+    ontvangen_gegevens = details.get("ontvangenGegevens")
+    definitie = details.get("formulierDefinitie")
+    if not ontvangen_gegevens or not isinstance(definitie, dict):
+        return
+
+    spec = get_formulier_spec(definitie, definitie_hash)
+    if errors := spec.validate(
+        ontvangen_gegevens,
+        label=f"{label}.ontvangenGegevens",
+        reject_unknown_keys=settings.TAKEN_ONTVANGEN_GEGEVENS_REJECT_UNKNOWN_KEYS,
+    ):
+        raise ValidationError(errors)
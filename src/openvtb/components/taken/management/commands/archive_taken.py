@@ -0,0 +1,14 @@
+from openvtb.components.taken.constants import AFGERONDE_STATUSSEN
+from openvtb.components.taken.models import ExterneTaak
+from openvtb.utils.archive import BaseArchiveCommand
+
+
+class Command(BaseArchiveCommand):
+    help = (
+        "Move the finished taken (verwerkt, afgebroken or niet uitgevoerd) to the "
+        "archive partition. The archived taken remain available in the API."
+    )
+    name_plural = "taken"
+
+    def get_queryset(self, **options):
+        return ExterneTaak.objects.filter(status__in=AFGERONDE_STATUSSEN)
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.15 on 2026-10-19 09:12
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("taken", "0003_alter_externetaak_verwerker_taak_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FormulierDefinitie",
+            fields=[
+                (
+                    "hash",
+                    models.CharField(
+                        help_text="SHA-256 hash van de genormaliseerde formulierdefinitie.",
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="hash",
+                    ),
+                ),
+                (
+                    "definitie",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="JSON-structuur van het formulier (FormIO).",
+                        verbose_name="definitie",
+                    ),
+                ),
+                (
+                    "aangemaakt_op",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="aangemaakt op"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Formulierdefinitie",
+                "verbose_name_plural": "Formulierdefinities",
+            },
+        ),
+        migrations.AddField(
+            model_name="externetaak",
+            name="formulier_definitie",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="De gedeelde `formulierDefinitie` van een formuliertaak, als deze niet in de `details` zelf is opgeslagen.",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="taken.formulierdefinitie",
+                verbose_name="formulier definitie",
+            ),
+        ),
+    ]
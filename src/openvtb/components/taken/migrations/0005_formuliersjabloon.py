@@ -0,0 +1,119 @@
+# Generated by Django 5.2.15 on 2026-10-19 10:03
+
+import uuid
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("taken", "0004_formulierdefinitie_externetaak_formulier_definitie"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FormulierSjabloon",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        help_text="Unieke identificatiecode (UUID4) voor het FormulierSjabloon",
+                        unique=True,
+                    ),
+                ),
+                (
+                    "naam",
+                    models.CharField(
+                        help_text="Naam voor het FormulierSjabloon",
+                        max_length=100,
+                        verbose_name="naam",
+                    ),
+                ),
+                (
+                    "titel",
+                    models.CharField(
+                        blank=True,
+                        help_text="Standaard titel van de formuliertaken die met dit sjabloon worden aangemaakt.",
+                        max_length=100,
+                        verbose_name="titel",
+                    ),
+                ),
+                (
+                    "toelichting",
+                    models.CharField(
+                        blank=True,
+                        help_text="Standaard toelichting van de formuliertaken die met dit sjabloon worden aangemaakt.",
+                        max_length=80,
+                        verbose_name="toelichting",
+                    ),
+                ),
+                (
+                    "handelings_perspectief",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("betalen", "Betalen"),
+                            ("incasso", "Incasso"),
+                            ("informatie_geven", "Informatie geven"),
+                            ("informatie_krijgen", "Informatie krijgen"),
+                            ("reactie_ontvangen", "Reactie ontvangen"),
+                            ("vernieuwing_nodig", "Vernieuwing nodig"),
+                            ("uitnodiging_voor_afspraak", "Uitnodiging voor afspraak"),
+                        ],
+                        help_text="Standaard handelings perspectief van de formuliertaken die met dit sjabloon worden aangemaakt.",
+                        max_length=100,
+                        verbose_name="handelings perspectief",
+                    ),
+                ),
+                (
+                    "formulier_definitie",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="JSON-structuur van het formulier (FormIO).",
+                        verbose_name="formulier definitie",
+                    ),
+                ),
+                (
+                    "voorinvullen_gegevens",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Standaard sleutel-waarde gegevens die ingevuld moeten worden in het formulier.",
+                        verbose_name="voorinvullen gegevens",
+                    ),
+                ),
+                (
+                    "aangemaakt_op",
+                    models.DateField(
+                        auto_now_add=True,
+                        help_text="Datum waarop het FormulierSjabloon is aangemaakt",
+                        verbose_name="aangemaakt op",
+                    ),
+                ),
+                (
+                    "gewijzigd_op",
+                    models.DateField(
+                        auto_now=True,
+                        help_text="Laatste datum waarop het FormulierSjabloon is gewijzigd",
+                        verbose_name="gewijzigd op",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "FormulierSjabloon",
+                "verbose_name_plural": "FormulierSjablonen",
+            },
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.2.15 on 2026-10-19 11:20
+
+from datetime import datetime, time
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def plan_open_taken(apps, schema_editor):
+    ExterneTaak = apps.get_model("taken", "ExterneTaak")
+    GeplandTaakEvent = apps.get_model("taken", "GeplandTaakEvent")
+
+    def due(value):
+        return timezone.make_aware(datetime.combine(value, time.min))
+
+    open_taken = ExterneTaak.objects.filter(status="open").values_list(
+        "id",
+        "datum_herinnering",
+        "is_herinnering_verzonden",
+        "einddatum_handelings_termijn",
+        "is_handelings_termijn_verzonden",
+    )
+    events = []
+    for (
+        taak_id,
+        datum_herinnering,
+        is_herinnering_verzonden,
+        einddatum_handelings_termijn,
+        is_handelings_termijn_verzonden,
+    ) in open_taken.iterator(chunk_size=2000):
+        if datum_herinnering and not is_herinnering_verzonden:
+            events.append(
+                GeplandTaakEvent(
+                    taak_id=taak_id,
+                    soort="herinnering",
+                    gepland_op=due(datum_herinnering),
+                )
+            )
+        if einddatum_handelings_termijn and not is_handelings_termijn_verzonden:
+            events.append(
+                GeplandTaakEvent(
+                    taak_id=taak_id,
+                    soort="verlopen",
+                    gepland_op=due(einddatum_handelings_termijn),
+                )
+            )
+    GeplandTaakEvent.objects.bulk_create(events, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("taken", "0005_formuliersjabloon"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GeplandTaakEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "soort",
+                    models.CharField(
+                        choices=[
+                            ("herinnering", "Herinnering"),
+                            ("verlopen", "Verlopen"),
+                        ],
+                        help_text="Soort van het geplande event.",
+                        max_length=20,
+                        verbose_name="soort",
+                    ),
+                ),
+                (
+                    "gepland_op",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="Datum/tijd waarop het event verstuurd moet worden.",
+                        verbose_name="gepland op",
+                    ),
+                ),
+                (
+                    "taak",
+                    models.ForeignKey(
+                        help_text="De taak waarvoor het event gepland is.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="geplande_events",
+                        to="taken.externetaak",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Gepland taak event",
+                "verbose_name_plural": "Geplande taak events",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("taak", "soort"), name="unique_gepland_taak_event"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(plan_open_taken, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.15 on 2026-10-19 15:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The partition of the taken which are not archived is attached to the partitioned
+# table with this constraint, so Postgres does not have to scan the table for the
+# partition bound while the table is locked. The constraint is validated in a
+# separate transaction, which does not block reads and writes.
+CHECK_CONSTRAINT = "taken_externetaak_niet_gearchiveerd"
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("taken", "0006_geplandtaakevent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="externetaak",
+            name="gearchiveerd",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Geeft aan of de taak afgerond is en naar het archief is verplaatst.",
+                verbose_name="gearchiveerd",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="geplandtaakevent",
+            name="taak",
+            field=models.ForeignKey(
+                db_constraint=False,
+                help_text="De taak waarvoor het event gepland is.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="geplande_events",
+                to="taken.externetaak",
+            ),
+        ),
+        migrations.RunSQL(
+            f"""
+            ALTER TABLE taken_externetaak
+            ADD CONSTRAINT {CHECK_CONSTRAINT} CHECK (gearchiveerd = false) NOT VALID
+            """,
+            f"ALTER TABLE taken_externetaak DROP CONSTRAINT {CHECK_CONSTRAINT}",
+        ),
+        migrations.RunSQL(
+            f"ALTER TABLE taken_externetaak VALIDATE CONSTRAINT {CHECK_CONSTRAINT}",
+            migrations.RunSQL.noop,
+        ),
+    ]
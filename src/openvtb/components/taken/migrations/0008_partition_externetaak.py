@@ -0,0 +1,116 @@
+# Generated by Django 5.2.15 on 2026-10-19 15:10
+
+import uuid
+
+from django.db import migrations, models
+
+# The table becomes a partitioned table, with the existing table as the partition of
+# the taken which are not archived. The rows are not copied, but the table is locked
+# while the primary key and the unique constraint on the uuid are built again, which
+# takes time in proportion to the number of rows. The primary key and the unique
+# constraints of a partitioned table must contain the partition key, so the foreign
+# keys to the table (of the planned events) no longer have a constraint.
+PARTITION_SQL = [
+    "ALTER TABLE taken_externetaak RENAME TO taken_externetaak_hot",
+    # the constraints and indexes are created again on the partitioned table
+    """
+    DO $$
+    DECLARE
+        name text;
+    BEGIN
+        FOR name IN
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = 'taken_externetaak_hot'::regclass
+            AND contype IN ('p', 'u', 'f')
+        LOOP
+            EXECUTE format('ALTER TABLE taken_externetaak_hot DROP CONSTRAINT %I', name);
+        END LOOP;
+        FOR name IN
+            SELECT indexrelid::regclass::text FROM pg_index
+            WHERE indrelid = 'taken_externetaak_hot'::regclass
+        LOOP
+            EXECUTE format('DROP INDEX %s', name);
+        END LOOP;
+    END $$
+    """,
+    # partitioned tables can only have an identity column as of Postgres 17
+    "ALTER TABLE taken_externetaak_hot ALTER COLUMN id DROP IDENTITY IF EXISTS",
+    "ALTER TABLE taken_externetaak_hot ALTER COLUMN id DROP DEFAULT",
+    "DROP SEQUENCE IF EXISTS taken_externetaak_id_seq",
+    # without the check constraint of the partition, which does not hold for the
+    # archive partition
+    """
+    CREATE TABLE taken_externetaak (
+        LIKE taken_externetaak_hot INCLUDING DEFAULTS
+    ) PARTITION BY LIST (gearchiveerd)
+    """,
+    "CREATE SEQUENCE taken_externetaak_id_seq AS integer OWNED BY taken_externetaak.id",
+    """
+    SELECT setval('taken_externetaak_id_seq', COALESCE(MAX(id), 0) + 1, false)
+    FROM taken_externetaak_hot
+    """,
+    """
+    ALTER TABLE taken_externetaak
+    ALTER COLUMN id SET DEFAULT nextval('taken_externetaak_id_seq')
+    """,
+    """
+    ALTER TABLE taken_externetaak
+    ADD CONSTRAINT taken_externetaak_pkey PRIMARY KEY (id, gearchiveerd)
+    """,
+    """
+    ALTER TABLE taken_externetaak
+    ADD CONSTRAINT taken_externetaak_unique_uuid UNIQUE (uuid, gearchiveerd)
+    """,
+    """
+    ALTER TABLE taken_externetaak
+    ADD CONSTRAINT taken_externetaak_formulier_definitie_id_fk
+    FOREIGN KEY (formulier_definitie_id) REFERENCES taken_formulierdefinitie (hash)
+    DEFERRABLE INITIALLY DEFERRED
+    """,
+    """
+    CREATE INDEX taken_externetaak_formulier_definitie_id_idx
+    ON taken_externetaak (formulier_definitie_id)
+    """,
+    # the check constraint of the partition proves the partition bound, so the table
+    # is not scanned, and is redundant afterwards
+    """
+    ALTER TABLE taken_externetaak
+    ATTACH PARTITION taken_externetaak_hot FOR VALUES IN (false)
+    """,
+    "ALTER TABLE taken_externetaak_hot DROP CONSTRAINT taken_externetaak_niet_gearchiveerd",
+    """
+    CREATE TABLE taken_externetaak_archief
+    PARTITION OF taken_externetaak FOR VALUES IN (true)
+    """,
+]
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("taken", "0007_externetaak_gearchiveerd"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(PARTITION_SQL),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="externetaak",
+                    name="uuid",
+                    field=models.UUIDField(
+                        default=uuid.uuid4,
+                        help_text="Een UUID waarmee een ZAC een link kan leggen tussen de taak en zijn eigen administratie.",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="externetaak",
+                    constraint=models.UniqueConstraint(
+                        fields=("uuid", "gearchiveerd"),
+                        name="taken_externetaak_unique_uuid",
+                    ),
+                ),
+            ],
+        ),
+    ]
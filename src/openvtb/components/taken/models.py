@@ -1,3 +1,5 @@
+import hashlib
+import json
 import uuid
 from datetime import date, timedelta
 
@@ -9,17 +11,67 @@ from django.utils.translation import gettext_lazy as _
 
 from openvtb.components.constants import HandelingsPerspectiefEnum
 from openvtb.components.schemas import IS_GERELATEERD_AAN_SCHEMA
+from openvtb.utils.archive import ArchivableModelMixin
 from openvtb.utils.fields import URNField
 from openvtb.utils.json_utils import get_json_schema
 from openvtb.utils.validators import validate_date, validate_jsonschema
 
-from .constants import SoortTaak, StatusTaak
+from .constants import (
+    AFGERONDE_STATUSSEN,
+    GeplandTaakEventSoort,
+    SoortTaak,
+    StatusTaak,
+)
 from .schemas import FORMULIER_DEFINITIE_SCHEMA, SOORTTAAK_SCHEMA_MAPPING
 
 
-class ExterneTaak(models.Model):
+class FormulierDefinitie(models.Model):
+    """
+    A ``formulierDefinitie`` shared by formuliertaken, stored once by content hash.
+
+    Definitions are never changed: a different definition gets a different hash.
+    """
+
+    hash = models.CharField(
+        _("hash"),
+        max_length=64,
+        primary_key=True,
+        help_text=_("SHA-256 hash van de genormaliseerde formulierdefinitie."),
+    )
+    definitie = models.JSONField(
+        _("definitie"),
+        help_text=_("JSON-structuur van het formulier (FormIO)."),
+        encoder=DjangoJSONEncoder,
+    )
+    aangemaakt_op = models.DateTimeField(
+        _("aangemaakt op"),
+        auto_now_add=True,
+    )
+
+    class Meta:
+        verbose_name = _("Formulierdefinitie")
+        verbose_name_plural = _("Formulierdefinities")
+
+    def __str__(self):
+        return self.hash
+
+    @staticmethod
+    def get_hash(definitie: dict) -> str:
+        normalized = json.dumps(
+            definitie, sort_keys=True, separators=(",", ":"), cls=DjangoJSONEncoder
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class ExterneTaak(ArchivableModelMixin, models.Model):
+    """
+    The table is partitioned on ``gearchiveerd``, so the finished taken are moved to
+    the archive partition (see ``manage.py archive_taken``) and the indexes of the
+    hot partition only contain the open taken. Queries on the table are transparent
+    for the partitions.
+    """
+
     uuid = models.UUIDField(
-        unique=True,
         default=uuid.uuid4,
         help_text=(
             "Een UUID waarmee een ZAC een link kan leggen tussen "
@@ -111,6 +163,18 @@ class ExterneTaak(models.Model):
         help_text=_("De attributen die horen bij de `taakSoort`."),
         encoder=DjangoJSONEncoder,
     )
+    formulier_definitie = models.ForeignKey(
+        FormulierDefinitie,
+        verbose_name=_("formulier definitie"),
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+        help_text=_(
+            "De gedeelde `formulierDefinitie` van een formuliertaak, als deze niet "
+            "in de `details` zelf is opgeslagen."
+        ),
+    )
     is_toegewezen_aan = URNField(
         _("is toegewezen aan subject"),
         help_text=_(
@@ -134,10 +198,27 @@ class ExterneTaak(models.Model):
         ),
         encoder=DjangoJSONEncoder,
     )
+    gearchiveerd = models.BooleanField(
+        _("gearchiveerd"),
+        default=False,
+        editable=False,
+        help_text=_(
+            "Geeft aan of de taak afgerond is en naar het archief is verplaatst."
+        ),
+    )
+
+    # a taak which is opened again is moved back to the hot partition
+    archive_fields = frozenset({"status"})
 
     class Meta:
         verbose_name = _("Externe taak")
         verbose_name_plural = _("Externe taken")
+        constraints = [
+            # the unique constraints of a partitioned table contain the partition key
+            models.UniqueConstraint(
+                fields=["uuid", "gearchiveerd"], name="taken_externetaak_unique_uuid"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.titel} ({self.status})"
@@ -151,7 +232,76 @@ class ExterneTaak(models.Model):
                 self.datum_herinnering = self.einddatum_handelings_termijn - timedelta(
                     days=settings.TAKEN_DEFAULT_REMINDER_IN_DAYS
                 )
-        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if "details" not in self.__dict__ or (
+            update_fields is not None and "details" not in update_fields
+        ):
+            super().save(*args, **kwargs)
+            return
+
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "formulier_definitie"}
+
+        details = self.details
+        stored_details = self._deduplicate_formulier_definitie(details)
+        self.details = stored_details
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            # the definition is kept in the details it was passed with
+            self.details = details if self.formulier_definitie_id else stored_details
+
+    def is_archivable(self) -> bool:
+        return self.status in AFGERONDE_STATUSSEN
+
+    def get_details(self):
+        """
+        Return the details with the shared ``formulierDefinitie`` added, so it is
+        transparent whether the definition is deduplicated.
+
+        Prefetch ``formulier_definitie`` when this is used for many taken. The
+        definition is shared with the other taken and must not be mutated.
+        """
+        if (
+            not self.formulier_definitie_id
+            or not isinstance(self.details, dict)
+            or "formulierDefinitie" in self.details
+        ):
+            return self.details
+        return {
+            "formulierDefinitie": self.formulier_definitie.definitie,
+            **self.details,
+        }
+
+    def _deduplicate_formulier_definitie(self, details: dict) -> dict:
+        """
+        Return the details to store, without the ``formulierDefinitie`` if it is
+        stored in a shared :class:`FormulierDefinitie`.
+        """
+        if self.taak_soort != SoortTaak.FORMULIERTAAK or not isinstance(details, dict):
+            self.formulier_definitie = None
+            return details
+
+        if not settings.TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION:
+            # a shared definition is stored in the details again
+            details = self.get_details()
+            self.formulier_definitie = None
+            return details
+
+        definitie = details.get("formulierDefinitie")
+        if not isinstance(definitie, dict):
+            # the details are stored without the definition, which stays shared
+            return details
+
+        formulier_definitie, _created = FormulierDefinitie.objects.get_or_create(
+            hash=FormulierDefinitie.get_hash(definitie),
+            defaults={"definitie": definitie},
+        )
+        self.formulier_definitie = formulier_definitie
+        return {
+            key: value for key, value in details.items() if key != "formulierDefinitie"
+        }
 
     def clean_is_gerelateerd_aan(self):
         if not self.is_gerelateerd_aan:
@@ -167,15 +317,16 @@ class ExterneTaak(models.Model):
             raise ValidationError({"is_gerelateerd_aan": str(error)})
 
     def clean_details(self):
+        details = self.get_details()
         try:
             validate_jsonschema(
-                instance=self.details,
+                instance=details,
                 label="details",
                 schema=get_json_schema(self.taak_soort, SOORTTAAK_SCHEMA_MAPPING),
             )
             if self.taak_soort == SoortTaak.FORMULIERTAAK:
                 validate_jsonschema(
-                    instance=self.details["formulierDefinitie"],
+                    instance=details["formulierDefinitie"],
                     label="formulierDefinitie",
                     schema=FORMULIER_DEFINITIE_SCHEMA,
                 )
@@ -198,3 +349,126 @@ class ExterneTaak(models.Model):
         self.clean_details()
         self.clean_dates()
         self.clean_is_gerelateerd_aan()
+
+
+class FormulierSjabloon(models.Model):
+    uuid = models.UUIDField(
+        unique=True,
+        default=uuid.uuid4,
+        help_text=_("Unieke identificatiecode (UUID4) voor het FormulierSjabloon"),
+    )
+    naam = models.CharField(
+        _("naam"),
+        max_length=100,
+        help_text=_("Naam voor het FormulierSjabloon"),
+    )
+    titel = models.CharField(
+        _("titel"),
+        max_length=100,
+        blank=True,
+        help_text=_(
+            "Standaard titel van de formuliertaken die met dit sjabloon worden aangemaakt."
+        ),
+    )
+    toelichting = models.CharField(
+        _("toelichting"),
+        max_length=80,
+        blank=True,
+        help_text=_(
+            "Standaard toelichting van de formuliertaken die met dit sjabloon worden aangemaakt."
+        ),
+    )
+    handelings_perspectief = models.CharField(
+        _("handelings perspectief"),
+        max_length=100,
+        blank=True,
+        choices=HandelingsPerspectiefEnum.choices,
+        help_text=_(
+            "Standaard handelings perspectief van de formuliertaken die met dit sjabloon "
+            "worden aangemaakt."
+        ),
+    )
+    formulier_definitie = models.JSONField(
+        _("formulier definitie"),
+        help_text=_("JSON-structuur van het formulier (FormIO)."),
+        encoder=DjangoJSONEncoder,
+    )
+    voorinvullen_gegevens = models.JSONField(
+        _("voorinvullen gegevens"),
+        default=dict,
+        blank=True,
+        help_text=_(
+            "Standaard sleutel-waarde gegevens die ingevuld moeten worden in het formulier."
+        ),
+        encoder=DjangoJSONEncoder,
+    )
+    aangemaakt_op = models.DateField(
+        _("aangemaakt op"),
+        auto_now_add=True,
+        help_text=_("Datum waarop het FormulierSjabloon is aangemaakt"),
+    )
+    gewijzigd_op = models.DateField(
+        _("gewijzigd op"),
+        auto_now=True,
+        help_text=_("Laatste datum waarop het FormulierSjabloon is gewijzigd"),
+    )
+
+    class Meta:
+        verbose_name = _("FormulierSjabloon")
+        verbose_name_plural = _("FormulierSjablonen")
+
+    def __str__(self):
+        return self.naam
+
+    def clean(self):
+        super().clean()
+
+        try:
+            validate_jsonschema(
+                instance=self.formulier_definitie,
+                label="formulierDefinitie",
+                schema=FORMULIER_DEFINITIE_SCHEMA,
+            )
+        except ValidationError as error:
+            raise ValidationError({"formulier_definitie": str(error)})
+
+
+class GeplandTaakEvent(models.Model):
+    """
+    A reminder or expiration CloudEvent of a taak, planned at its due time.
+
+    The planned events are kept up to date when a taak is saved, so the due events
+    can be found with an index scan instead of scanning all open taken.
+    """
+
+    taak = models.ForeignKey(
+        ExterneTaak,
+        on_delete=models.CASCADE,
+        # the primary key of the partitioned table contains the partition key
+        db_constraint=False,
+        related_name="geplande_events",
+        help_text=_("De taak waarvoor het event gepland is."),
+    )
+    soort = models.CharField(
+        _("soort"),
+        max_length=20,
+        choices=GeplandTaakEventSoort.choices,
+        help_text=_("Soort van het geplande event."),
+    )
+    gepland_op = models.DateTimeField(
+        _("gepland op"),
+        db_index=True,
+        help_text=_("Datum/tijd waarop het event verstuurd moet worden."),
+    )
+
+    class Meta:
+        verbose_name = _("Gepland taak event")
+        verbose_name_plural = _("Geplande taak events")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["taak", "soort"], name="unique_gepland_taak_event"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.soort} ({self.gepland_op})"
@@ -0,0 +1,71 @@
+"""
+Planning of the reminder and expiration CloudEvents of taken.
+
+When a taak is saved, its events are planned at their due time in the
+:class:`GeplandTaakEvent` table. The planned events are sent by the
+``send_due_taak_events`` task, which only reads the events that are due.
+"""
+
+from datetime import date, datetime, time
+
+from django.utils import timezone
+
+from .constants import GeplandTaakEventSoort, StatusTaak
+from .models import ExterneTaak, GeplandTaakEvent
+
+# the fields of a taak which determine its planned events
+PLANNING_FIELDS = frozenset(
+    {
+        "status",
+        "datum_herinnering",
+        "einddatum_handelings_termijn",
+        "is_herinnering_verzonden",
+        "is_handelings_termijn_verzonden",
+    }
+)
+
+
+def get_due_datetime(value: date) -> datetime:
+    """
+    Return the start of the day of a date, in the current timezone.
+    """
+    if isinstance(value, datetime):
+        # the same conversion as ``DateField.to_python``
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        value = value.date()
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def get_due_events(taak: ExterneTaak) -> dict[str, date]:
+    due_events = {}
+    if taak.status != StatusTaak.OPEN:
+        return due_events
+
+    if taak.datum_herinnering and not taak.is_herinnering_verzonden:
+        due_events[GeplandTaakEventSoort.HERINNERING] = taak.datum_herinnering
+    if taak.einddatum_handelings_termijn and not taak.is_handelings_termijn_verzonden:
+        due_events[GeplandTaakEventSoort.VERLOPEN] = taak.einddatum_handelings_termijn
+    return due_events
+
+
+def plan_taak_events(taak: ExterneTaak) -> None:
+    """
+    Plan the reminder and expiration events of a taak, or remove them if they no
+    longer have to be sent.
+    """
+    due_events = get_due_events(taak)
+
+    GeplandTaakEvent.objects.filter(taak=taak).exclude(soort__in=due_events).delete()
+    if not due_events:
+        return
+
+    GeplandTaakEvent.objects.bulk_create(
+        [
+            GeplandTaakEvent(taak=taak, soort=soort, gepland_op=get_due_datetime(due))
+            for soort, due in due_events.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["taak", "soort"],
+        update_fields=["gepland_op"],
+    )
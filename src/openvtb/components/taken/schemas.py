@@ -2,6 +2,8 @@ from django.utils.translation import gettext as _
 
 from jsonschema import Draft7Validator, Draft202012Validator
 
+from openvtb.utils.validators import compile_jsonschema
+
 from .constants import SoortTaak
 
 BETAAL_SCHEMA = {
@@ -222,3 +224,11 @@ FORMULIER_DEFINITIE_SCHEMA = {
     },
     "required": ["components"],
 }
+
+
+def compile_schemas() -> None:
+    """
+    Compile the static schemas once, for fast validation.
+    """
+    for schema in (*SOORTTAAK_SCHEMA_MAPPING.values(), FORMULIER_DEFINITIE_SCHEMA):
+        compile_jsonschema(schema)
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import ExterneTaak
+from .scheduling import PLANNING_FIELDS, plan_taak_events
+
+
+@receiver(post_save, sender=ExterneTaak)
+def plan_taak_events_on_save(
+    sender, instance: ExterneTaak, raw=False, update_fields=None, **kwargs
+):
+    if raw or (update_fields is not None and not PLANNING_FIELDS & update_fields):
+        return
+
+    plan_taak_events(instance)
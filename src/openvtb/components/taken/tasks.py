@@ -1,20 +1,33 @@
-from datetime import date
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
 
 import structlog
-from celery import chord
 
 from openvtb.celery import app
+from openvtb.utils.db import claim
+from openvtb.utils.leases import job_lease
 
 from .cloudevents import (
     EXTERNETAAK_HERINNERD,
     EXTERNETAAK_VERLOPEN,
     send_taak_cloudevent,
 )
-from .constants import StatusTaak
-from .models import ExterneTaak
+from .constants import GeplandTaakEventSoort, StatusTaak
+from .models import ExterneTaak, GeplandTaakEvent
+from .scheduling import plan_taak_events
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# maximum number of planned events handled in one transaction
+DUE_EVENTS_BATCH_SIZE = 500
+
+
+# the tasks below are no longer scheduled, they are kept for the chords which were
+# queued before the taken were claimed one by one
+
 
 @app.task(bind=True)
 def send_taak_reminder(self, taak_id: int) -> int:
@@ -59,6 +72,76 @@ def mark_expired_sent(taak_ids: list[int]) -> None:
     )
 
 
+def _send_claimed_taak_events(type_event: str, taak_ids: list[int]) -> None:
+    """
+    Send the events of the claimed taken.
+
+    The events are handed over after the transaction commits. An event which can
+    not be handed over, e.g. because the broker is unavailable, is kept as dead
+    letter and replayed from there, the taak stays claimed.
+    """
+    for taak in ExterneTaak.objects.filter(pk__in=taak_ids).order_by("pk"):
+        send_taak_cloudevent(type_event, taak)
+        logger.info("taak_event_sent", uuid=str(taak.uuid), type=type_event)
+
+
+def send_taak_reminders(taken: QuerySet[ExterneTaak]) -> list[int]:
+    """
+    Claim a batch of the taken whose reminder is due, and send their reminder
+    events.
+
+    A taak is claimed by marking its reminder as sent, in one
+    ``UPDATE ... RETURNING`` statement, so it is claimed only once, also by runs
+    which overlap. The events are sent (or kept as dead letter) after the
+    transaction commits.
+
+    Returns the ids of the claimed taken, in order.
+    """
+    with transaction.atomic():
+        taak_ids = claim(
+            taken.filter(
+                status=StatusTaak.OPEN,
+                datum_herinnering__lte=timezone.localdate(),
+                is_herinnering_verzonden=False,
+            ),
+            DUE_EVENTS_BATCH_SIZE,
+            is_herinnering_verzonden=True,
+        )
+        _send_claimed_taak_events(EXTERNETAAK_HERINNERD, taak_ids)
+        GeplandTaakEvent.objects.filter(
+            taak_id__in=taak_ids, soort=GeplandTaakEventSoort.HERINNERING
+        ).delete()
+
+    return taak_ids
+
+
+def send_taak_expirations(taken: QuerySet[ExterneTaak]) -> list[int]:
+    """
+    Claim a batch of the taken whose term has ended, send their expiration events
+    and set their status to ``NIET_UITGEVOERD``, as ``send_taak_reminders``.
+
+    Returns the ids of the claimed taken, in order.
+    """
+    with transaction.atomic():
+        taak_ids = claim(
+            taken.filter(
+                status=StatusTaak.OPEN,
+                einddatum_handelings_termijn__lte=timezone.localdate(),
+                is_handelings_termijn_verzonden=False,
+            ),
+            DUE_EVENTS_BATCH_SIZE,
+            is_handelings_termijn_verzonden=True,
+        )
+        # the event is sent with the status of the taak before it expired
+        _send_claimed_taak_events(EXTERNETAAK_VERLOPEN, taak_ids)
+        ExterneTaak.objects.filter(pk__in=taak_ids).update(
+            status=StatusTaak.NIET_UITGEVOERD
+        )
+        GeplandTaakEvent.objects.filter(taak_id__in=taak_ids).delete()
+
+    return taak_ids
+
+
 @app.task(ignore_result=True)
 def send_taak_events() -> None:
     """
@@ -68,36 +151,95 @@ def send_taak_events() -> None:
     - Reminder events when datum_herinnering is reached
     - Expiration events when einddatum_handelings_termijn is reached
 
-    NOTE:
-    This implementation loads all matching IDs into memory and creates a Celery
-    signature per item at once. If the dataset grows significantly, this may
-    lead to memory pressure and large broker payloads. Consider batching or
-    chunked processing for scalability.
+    The taken are claimed and sent in batches of ``DUE_EVENTS_BATCH_SIZE``, see
+    ``send_taak_reminders``. Only one run is executed at a time, and a run which
+    did not finish is resumed after the last claimed taak.
     """
-    today = date.today()
-    open_taken = ExterneTaak.objects.filter(status=StatusTaak.OPEN)
-
-    if not open_taken:
+    # only the hot partition contains open taken
+    open_taken = ExterneTaak.objects.filter(gearchiveerd=False)
+    if not open_taken.filter(status=StatusTaak.OPEN).exists():
         logger.info("no_open_taken")
         return
 
-    reminder_ids = list(
-        open_taken.filter(
-            datum_herinnering__lte=today, is_herinnering_verzonden=False
-        ).values_list("id", flat=True)
-    )
+    with job_lease("send-taak-events") as lease:
+        if lease is None:
+            return
 
-    if reminder_ids:
-        header = [send_taak_reminder.s(tid) for tid in reminder_ids]
-        chord(header)(mark_reminder_sent.s())
+        for step, send in (
+            ("reminders", send_taak_reminders),
+            ("expirations", send_taak_expirations),
+        ):
+            while True:
+                last_id = lease.checkpoint.get(step, 0)
+                taak_ids = send(open_taken.filter(pk__gt=last_id))
+                if taak_ids:
+                    lease.save_checkpoint(**{step: taak_ids[-1]})
+                if len(taak_ids) < DUE_EVENTS_BATCH_SIZE:
+                    break
 
-    expired_ids = list(
-        open_taken.filter(
-            einddatum_handelings_termijn__lte=today,
-            is_handelings_termijn_verzonden=False,
-        ).values_list("id", flat=True)
-    )
 
-    if expired_ids:
-        header = [send_taak_expired.s(tid) for tid in expired_ids]
-        chord(header)(mark_expired_sent.s())
+def _send_due_taak_events_batch() -> int:
+    """
+    Send the events of a batch of due planned events.
+
+    The planned events of the claimed taken are removed. Those which are out of
+    date, e.g. because the taak was changed with ``QuerySet.update()``, which skips
+    the signals, are planned again or removed. The planned event of a taak which is
+    locked by another transaction is kept for a next run.
+
+    Returns the number of due planned events which were handled.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        due_events = list(
+            GeplandTaakEvent.objects.filter(gepland_op__lte=now)
+            .order_by("gepland_op")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", "taak_id", "soort")[:DUE_EVENTS_BATCH_SIZE]
+        )
+        if not due_events:
+            return 0
+
+        taak_ids = defaultdict(list)
+        for _pk, taak_id, soort in due_events:
+            taak_ids[soort].append(taak_id)
+
+        # the planned events are removed when a taak changes, but the claim checks
+        # the taken again so an event is never sent twice
+        send_taak_reminders(
+            ExterneTaak.objects.filter(
+                id__in=taak_ids[GeplandTaakEventSoort.HERINNERING]
+            )
+        )
+        send_taak_expirations(
+            ExterneTaak.objects.filter(id__in=taak_ids[GeplandTaakEventSoort.VERLOPEN])
+        )
+
+        remaining = GeplandTaakEvent.objects.filter(
+            pk__in=[pk for pk, _taak_id, _soort in due_events]
+        )
+        # the taak was deleted without its planned events
+        remaining.exclude(
+            Exists(ExterneTaak.objects.filter(pk=OuterRef("taak_id")))
+        ).delete()
+        for taak in ExterneTaak.objects.filter(pk__in=remaining.values("taak_id")):
+            plan_taak_events(taak)
+
+        not_handled = remaining.filter(gepland_op__lte=now).count()
+
+    return len(due_events) - not_handled
+
+
+@app.task(ignore_result=True)
+def send_due_taak_events() -> None:
+    """
+    Sends the reminder and expiration CloudEvents of the planned taak events which
+    are due.
+
+    Unlike ``send_taak_events``, this only reads the due events from the
+    ``GeplandTaakEvent`` table, so it can run every few seconds.
+    """
+    # stop when a batch is not handled at all, e.g. because all its taken are
+    # locked, instead of fetching the same batch again
+    while _send_due_taak_events_batch():
+        pass
@@ -5,7 +5,7 @@ import factory
 from openvtb.components.constants import HandelingsPerspectiefEnum
 
 from ..constants import SoortTaak
-from ..models import ExterneTaak
+from ..models import ExterneTaak, FormulierSjabloon
 
 ADRES = {
     "woonplaats": "Amsterdam",
@@ -100,3 +100,13 @@ class ExterneTaakFactory(factory.django.DjangoModelFactory):
                 },
             },
         )
+
+
+class FormulierSjabloonFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = FormulierSjabloon
+
+    naam = factory.Faker("word")
+    titel = factory.Faker("sentence", nb_words=4)
+    formulier_definitie = FORM_IO
+    voorinvullen_gegevens = factory.LazyFunction(lambda: {"textField": "Test value"})
@@ -0,0 +1,112 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.db.models import Model
+
+from psycopg.errors import SerializationFailure
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openvtb.utils.api_testcase import APITestCase
+
+from ..constants import StatusTaak
+from ..models import ExterneTaak
+from .factories import ExterneTaakFactory
+
+
+def count_rows(table: str) -> int:
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return cursor.fetchone()[0]
+
+
+class ArchiveTakenTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.open = ExterneTaakFactory.create(betaaltaak=True)
+        self.uitgevoerd = ExterneTaakFactory.create(
+            betaaltaak=True, status=StatusTaak.UITGEVOERD
+        )
+        self.finished = [
+            ExterneTaakFactory.create(betaaltaak=True, status=status_taak)
+            for status_taak in (
+                StatusTaak.VERWERKT,
+                StatusTaak.AFGEBROKEN,
+                StatusTaak.NIET_UITGEVOERD,
+            )
+        ]
+
+    def test_archive_finished_taken(self):
+        stdout = StringIO()
+        call_command("archive_taken", batch_size=2, stdout=stdout)
+
+        self.assertIn("Archived 3 taken.", stdout.getvalue())
+        self.assertEqual(
+            set(
+                ExterneTaak.objects.filter(gearchiveerd=True).values_list(
+                    "pk", flat=True
+                )
+            ),
+            {taak.pk for taak in self.finished},
+        )
+        self.assertEqual(count_rows("taken_externetaak_hot"), 2)
+        self.assertEqual(count_rows("taken_externetaak_archief"), 3)
+
+    def test_dry_run(self):
+        stdout = StringIO()
+        call_command("archive_taken", dry_run=True, stdout=stdout)
+
+        self.assertIn("3 taken would be archived.", stdout.getvalue())
+        self.assertFalse(ExterneTaak.objects.filter(gearchiveerd=True).exists())
+
+    def test_archived_taken_in_api(self):
+        call_command("archive_taken", stdout=StringIO())
+
+        response = self.client.get(reverse("taken:externetaak-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 5)
+
+        taak = self.finished[0]
+        detail_url = reverse("taken:externetaak-detail", kwargs={"uuid": taak.uuid})
+        response = self.client.get(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["uuid"], str(taak.uuid))
+
+    def test_reopened_taak_is_moved_back(self):
+        call_command("archive_taken", stdout=StringIO())
+        taak = ExterneTaak.objects.get(pk=self.finished[0].pk)
+        self.assertTrue(taak.gearchiveerd)
+
+        taak.status = StatusTaak.OPEN
+        taak.save(update_fields=["status"])
+
+        taak.refresh_from_db()
+        self.assertFalse(taak.gearchiveerd)
+        self.assertEqual(count_rows("taken_externetaak_hot"), 3)
+
+    def test_stale_taak_is_not_moved_back(self):
+        # e.g. loaded by a request which runs at the same time as the archival
+        taak = ExterneTaak.objects.get(pk=self.finished[0].pk)
+        call_command("archive_taken", stdout=StringIO())
+
+        taak.titel = "Gewijzigd"
+        taak.save()
+
+        taak.refresh_from_db()
+        self.assertTrue(taak.gearchiveerd)
+        self.assertEqual(taak.titel, "Gewijzigd")
+
+    def test_save_retried_when_moved_to_other_partition(self):
+        taak = ExterneTaak.objects.get(pk=self.open.pk)
+        error = OperationalError(
+            "tuple to be updated was already moved to another partition due to "
+            "concurrent update"
+        )
+        error.__cause__ = SerializationFailure()
+
+        with patch.object(Model, "save", side_effect=[error, None]) as save:
+            taak.save()
+
+        self.assertEqual(save.call_count, 2)
@@ -0,0 +1,211 @@
+import copy
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, override_settings
+
+from ..formulier import (
+    compile_formulier_definitie,
+    get_formulier_spec,
+    validate_ontvangen_gegevens,
+)
+
+DEFINITIE = {
+    "components": [
+        {"type": "textfield", "key": "naam", "label": "Naam"},
+        {"type": "number", "key": "aantal", "label": "Aantal", "decimalLimit": 2},
+        {"type": "checkbox", "key": "akkoord", "label": "Akkoord"},
+        {"type": "date", "key": "geboortedatum", "label": "Geboortedatum"},
+        {
+            "type": "datetime",
+            "key": "afspraak",
+            "label": "Afspraak",
+            "enableTime": True,
+        },
+        {
+            "type": "radio",
+            "key": "kleur",
+            "label": "Kleur",
+            "values": [
+                {"label": "Rood", "value": "rood"},
+                {"label": "Blauw", "value": "blauw"},
+            ],
+        },
+        {
+            "type": "select",
+            "key": "dagen",
+            "label": "Dagen",
+            "multiple": True,
+            "data": {
+                "values": [
+                    {"label": "Maandag", "value": "ma"},
+                    {"label": "Dinsdag", "value": "di"},
+                ]
+            },
+        },
+        {
+            "type": "selectboxes",
+            "key": "hobbies",
+            "label": "Hobbies",
+            "values": [
+                {"label": "Lezen", "value": "lezen"},
+                {"label": "Sport", "value": "sport"},
+            ],
+        },
+        {
+            "type": "fieldset",
+            "key": "adres",
+            "label": "Adres",
+            "components": [
+                {"type": "postcode", "key": "postcode", "label": "Postcode"},
+            ],
+        },
+        {
+            "type": "editgrid",
+            "key": "kinderen",
+            "label": "Kinderen",
+            "components": [
+                {"type": "textfield", "key": "voornaam", "label": "Voornaam"},
+                {"type": "number", "key": "leeftijd", "label": "Leeftijd"},
+            ],
+        },
+        {"type": "content", "key": "uitleg", "label": "Uitleg"},
+    ]
+}
+
+
+def validate(ontvangen_gegevens):
+    validate_ontvangen_gegevens(
+        {"formulierDefinitie": DEFINITIE, "ontvangenGegevens": ontvangen_gegevens}
+    )
+
+
+class CompileFormulierDefinitieTestCase(SimpleTestCase):
+    def test_compile(self):
+        spec = compile_formulier_definitie(DEFINITIE)
+
+        self.assertEqual(
+            {key: field.type for key, field in spec.fields.items()},
+            {
+                "naam": "string",
+                "aantal": "number",
+                "akkoord": "boolean",
+                "geboortedatum": "date",
+                "afspraak": "datetime",
+                "kleur": "choice",
+                "dagen": "choice",
+                "hobbies": "selectboxes",
+                # the fields of layout components are at the top level
+                "postcode": "string",
+                "kinderen": "editgrid",
+            },
+        )
+        self.assertEqual(spec.fields["kleur"].values, {"rood", "blauw"})
+        self.assertEqual(spec.fields["dagen"].values, {"ma", "di"})
+        self.assertTrue(spec.fields["dagen"].multiple)
+        self.assertEqual(set(spec.fields["kinderen"].fields), {"voornaam", "leeftijd"})
+
+    def test_spec_cached_by_hash(self):
+        spec = get_formulier_spec(DEFINITIE)
+
+        self.assertIs(get_formulier_spec(copy.deepcopy(DEFINITIE)), spec)
+        self.assertIsNot(get_formulier_spec({"components": []}), spec)
+
+
+class ValidateOntvangenGegevensTestCase(SimpleTestCase):
+    def test_valid(self):
+        validate(
+            {
+                "naam": "Jan",
+                "aantal": 1.25,
+                "akkoord": True,
+                "geboortedatum": "2000-01-31",
+                "afspraak": "2026-01-01T10:00:00+01:00",
+                "kleur": "rood",
+                "dagen": ["ma", "di"],
+                "hobbies": {"lezen": True, "sport": False},
+                "postcode": "1234 AB",
+                "kinderen": [{"voornaam": "Piet", "leeftijd": 4}],
+                "submit": True,
+                "onbekend": "value",
+            }
+        )
+
+    def test_empty_values(self):
+        validate({"naam": None, "geboortedatum": "", "kleur": ""})
+
+    def test_invalid(self):
+        with self.assertRaises(ValidationError) as error:
+            validate(
+                {
+                    "naam": 1,
+                    "aantal": "veel",
+                    "akkoord": "ja",
+                    "geboortedatum": "31-01-2000",
+                    "afspraak": "morgen",
+                    "kleur": "groen",
+                    "dagen": ["ma", "wo"],
+                    "hobbies": {"koken": True},
+                    "postcode": 1234,
+                    "kinderen": [{"voornaam": "Piet", "leeftijd": "vier"}],
+                }
+            )
+
+        self.assertEqual(
+            error.exception.message_dict,
+            {
+                "details.ontvangenGegevens.naam": ["Verwacht een tekst."],
+                "details.ontvangenGegevens.aantal": ["Verwacht een getal."],
+                "details.ontvangenGegevens.akkoord": [
+                    "Verwacht een boolean (true of false)."
+                ],
+                "details.ontvangenGegevens.geboortedatum": [
+                    "Verwacht een datum (JJJJ-MM-DD)."
+                ],
+                "details.ontvangenGegevens.afspraak": [
+                    "Verwacht een datum en tijd (ISO 8601)."
+                ],
+                "details.ontvangenGegevens.kleur": ["'groen' is geen geldige keuze."],
+                "details.ontvangenGegevens.dagen.1": ["'wo' is geen geldige keuze."],
+                "details.ontvangenGegevens.hobbies": ["Ongeldige keuzes: 'koken'."],
+                "details.ontvangenGegevens.postcode": ["Verwacht een tekst."],
+                "details.ontvangenGegevens.kinderen.0.leeftijd": [
+                    "Verwacht een getal."
+                ],
+            },
+        )
+
+    def test_decimal_limit(self):
+        with self.assertRaises(ValidationError) as error:
+            validate({"aantal": 1.255})
+
+        self.assertEqual(
+            error.exception.message_dict,
+            {
+                "details.ontvangenGegevens.aantal": [
+                    "Er zijn maximaal 2 decimalen toegestaan."
+                ]
+            },
+        )
+
+    def test_multiple_requires_list(self):
+        with self.assertRaises(ValidationError) as error:
+            validate({"dagen": "ma"})
+
+        self.assertEqual(
+            error.exception.message_dict,
+            {"details.ontvangenGegevens.dagen": ["Verwacht een lijst."]},
+        )
+
+    @override_settings(TAKEN_ONTVANGEN_GEGEVENS_REJECT_UNKNOWN_KEYS=True)
+    def test_reject_unknown_keys(self):
+        with self.assertRaises(ValidationError) as error:
+            validate({"naam": "Jan", "onbekend": "value"})
+
+        self.assertEqual(
+            error.exception.message_dict,
+            {
+                "details.ontvangenGegevens.onbekend": [
+                    "Dit veld komt niet voor in de formulierDefinitie."
+                ]
+            },
+        )
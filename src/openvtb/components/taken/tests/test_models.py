@@ -1,12 +1,16 @@
 import datetime
+import json
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase, override_settings
 
 from freezegun import freeze_time
 
-from .factories import ExterneTaakFactory
+from ..constants import SoortTaak
+from ..models import ExterneTaak, FormulierDefinitie
+from .factories import FORM_IO, ExterneTaakFactory
 
 
 @freeze_time("2026-01-01")
@@ -72,3 +76,108 @@ class ValidateExterneTaakModelTestCase(TestCase):
         with self.assertRaises(ValidationError) as error:
             taak.full_clean()
         self.assertTrue("einddatum_handelings_termijn" in error.exception.message_dict)
+
+
+@override_settings(TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION=True)
+class FormulierDefinitieDeduplicationTestCase(TestCase):
+    def test_definitie_stored_once(self):
+        taken = ExterneTaakFactory.create_batch(3, formuliertaak=True)
+
+        definitie = FormulierDefinitie.objects.get()
+        self.assertEqual(definitie.definitie, FORM_IO)
+        self.assertEqual(definitie.hash, FormulierDefinitie.get_hash(FORM_IO))
+        for taak in taken:
+            self.assertEqual(taak.formulier_definitie, definitie)
+            # the instance keeps the complete details
+            self.assertEqual(taak.details["formulierDefinitie"], FORM_IO)
+
+        # the definition is not stored in the details column
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT details::text FROM taken_externetaak")
+            for (details,) in cursor.fetchall():
+                self.assertNotIn("formulierDefinitie", json.loads(details))
+
+    def test_hash_ignores_key_order(self):
+        reordered = dict(reversed(FORM_IO.items()))
+
+        self.assertEqual(
+            FormulierDefinitie.get_hash(reordered), FormulierDefinitie.get_hash(FORM_IO)
+        )
+
+    def test_different_definities(self):
+        ExterneTaakFactory.create(formuliertaak=True)
+        ExterneTaakFactory.create(
+            formuliertaak=True,
+            details={"formulierDefinitie": {"components": []}},
+        )
+
+        self.assertEqual(FormulierDefinitie.objects.count(), 2)
+
+    def test_get_details(self):
+        ExterneTaakFactory.create(formuliertaak=True)
+        taak = ExterneTaak.objects.get()
+
+        # the stored details do not contain the definition
+        self.assertNotIn("formulierDefinitie", taak.details)
+        self.assertEqual(taak.get_details()["formulierDefinitie"], FORM_IO)
+
+    def test_get_details_prefetched(self):
+        ExterneTaakFactory.create_batch(3, formuliertaak=True)
+        ExterneTaakFactory.create(betaaltaak=True)
+
+        with self.assertNumQueries(2):
+            # the shared definition is fetched once for all taken
+            taken = list(
+                ExterneTaak.objects.prefetch_related("formulier_definitie").filter(
+                    taak_soort=SoortTaak.FORMULIERTAAK
+                )
+            )
+            for taak in taken:
+                self.assertEqual(taak.get_details()["formulierDefinitie"], FORM_IO)
+
+    def test_save_loaded_taak_keeps_definitie(self):
+        ExterneTaakFactory.create(formuliertaak=True)
+        taak = ExterneTaak.objects.get()
+
+        taak.details = {**taak.details, "ontvangenGegevens": {"textField": "value"}}
+        taak.save()
+
+        taak = ExterneTaak.objects.get()
+        self.assertIsNotNone(taak.formulier_definitie_id)
+        self.assertEqual(taak.get_details()["formulierDefinitie"], FORM_IO)
+        self.assertEqual(FormulierDefinitie.objects.count(), 1)
+
+    def test_full_clean_loaded_taak(self):
+        ExterneTaakFactory.create(formuliertaak=True)
+        taak = ExterneTaak.objects.get()
+
+        taak.full_clean()
+
+    def test_other_taak_soort_not_deduplicated(self):
+        taak = ExterneTaakFactory.create(betaaltaak=True)
+
+        self.assertIsNone(taak.formulier_definitie)
+        self.assertFalse(FormulierDefinitie.objects.exists())
+
+    def test_update_fields_without_details(self):
+        taak = ExterneTaakFactory.create(formuliertaak=True)
+        taak = ExterneTaak.objects.get()
+
+        taak.is_herinnering_verzonden = True
+        with self.assertNumQueries(1):
+            taak.save(update_fields=["is_herinnering_verzonden"])
+
+        taak.refresh_from_db()
+        self.assertEqual(taak.get_details()["formulierDefinitie"], FORM_IO)
+
+    def test_disable_deduplication(self):
+        taak = ExterneTaakFactory.create(formuliertaak=True)
+        taak = ExterneTaak.objects.get()
+
+        with override_settings(TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION=False):
+            taak.save()
+
+        self.assertEqual(taak.details["formulierDefinitie"], FORM_IO)
+        taak.refresh_from_db()
+        self.assertIsNone(taak.formulier_definitie)
+        self.assertEqual(taak.details["formulierDefinitie"], FORM_IO)
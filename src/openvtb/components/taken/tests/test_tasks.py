@@ -1,16 +1,21 @@
+import datetime
 from datetime import timedelta
 from unittest.mock import patch
 
+from django.db import connection
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from freezegun import freeze_time
 
-from openvtb.components.taken.constants import StatusTaak
+from openvtb.cloudevents.models import DeadLetterCloudEvent
+from openvtb.components.taken.constants import GeplandTaakEventSoort, StatusTaak
+from openvtb.components.taken.models import ExterneTaak, GeplandTaakEvent
 from openvtb.components.taken.tests.factories import ExterneTaakFactory
+from openvtb.utils.models import JobLease
 
 from ..cloudevents import EXTERNETAAK_HERINNERD, EXTERNETAAK_VERLOPEN
-from ..tasks import send_taak_events
+from ..tasks import send_due_taak_events, send_taak_events, send_taak_reminders
 
 MOCKED_CLOUDEVENT_ID = "f347fd1f-dac1-4870-9dd0-f6c00edf4bf7"
 NOTIFICATIONS_SOURCE = "openvtb-test"
@@ -234,18 +239,260 @@ class CloudEventsTaskTakenTest(TestCase):
             payload = mock_process_cloudevent.call_args[0][0]
             self.assertEqual(payload["type"], EXTERNETAAK_VERLOPEN)
 
-    @patch("openvtb.components.taken.tasks.send_taak_cloudevent", side_effect=Exception)
-    def test_does_not_publish_if_event_fails(self, m, mock_send):
-        taak = ExterneTaakFactory.create(
+    @patch(
+        "openvtb.utils.cloudevents._process_cloudevent",
+        side_effect=[Exception("broker unavailable"), None],
+    )
+    def test_event_not_handed_over_is_dead_lettered(self, m, mock_send):
+        failing_taak, taak = ExterneTaakFactory.create_batch(
+            2,
             formuliertaak=True,
             einddatum_handelings_termijn=timezone.now() - timedelta(days=1),
             is_herinnering_verzonden=True,
         )
 
-        self.assertFalse(taak.is_handelings_termijn_verzonden)
+        with self.captureOnCommitCallbacks(execute=True):
+            send_taak_events()
+
+        # the other taak is sent regardless
+        self.assertEqual(m.call_count, 2)
+        for claimed_taak in (failing_taak, taak):
+            claimed_taak.refresh_from_db()
+            self.assertTrue(claimed_taak.is_handelings_termijn_verzonden)
+            self.assertEqual(claimed_taak.status, StatusTaak.NIET_UITGEVOERD)
+        dead_letter = DeadLetterCloudEvent.objects.get()
+        self.assertEqual(dead_letter.type, EXTERNETAAK_VERLOPEN)
+        self.assertEqual(dead_letter.subject, str(failing_taak.uuid))
+
+    def test_taak_claimed_once(self, mock_process_cloudevent):
+        taak = ExterneTaakFactory.create(
+            formuliertaak=True,
+            datum_herinnering=timezone.now() - timedelta(days=1),
+            is_handelings_termijn_verzonden=True,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(send_taak_reminders(ExterneTaak.objects.all()), [taak.pk])
+            # e.g. an overlapping run
+            self.assertEqual(send_taak_reminders(ExterneTaak.objects.all()), [])
+
+        mock_process_cloudevent.assert_called_once()
+        payload = mock_process_cloudevent.call_args[0][0]
+        self.assertEqual(payload["subject"], str(taak.uuid))
 
-        with self.assertRaises(Exception):
+    def test_resume_unfinished_run(self, mock_process_cloudevent):
+        sent_taak, taak = ExterneTaakFactory.create_batch(
+            2,
+            formuliertaak=True,
+            datum_herinnering=timezone.now() - timedelta(days=1),
+            is_handelings_termijn_verzonden=True,
+        )
+        # the taken up to the first one were handled by a run which crashed
+        JobLease.objects.create(
+            name="send-taak-events", checkpoint={"reminders": sent_taak.pk}
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
             send_taak_events()
 
+        mock_process_cloudevent.assert_called_once()
+        payload = mock_process_cloudevent.call_args[0][0]
+        self.assertEqual(payload["subject"], str(taak.uuid))
+        self.assertEqual(JobLease.objects.get().checkpoint, {})
+
+    def test_run_in_progress(self, mock_process_cloudevent):
+        ExterneTaakFactory.create(
+            formuliertaak=True,
+            datum_herinnering=timezone.now() - timedelta(days=1),
+        )
+        JobLease.objects.create(
+            name="send-taak-events",
+            owner="other",
+            expires_at=timezone.now() + timedelta(minutes=1),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            send_taak_events()
+
+        mock_process_cloudevent.assert_not_called()
+
+    def test_expired_event_status(self, mock_process_cloudevent):
+        ExterneTaakFactory.create(
+            formuliertaak=True,
+            einddatum_handelings_termijn=timezone.now() - timedelta(days=1),
+            is_herinnering_verzonden=True,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            send_taak_events()
+
+        # the event has the status of the taak before it expired
+        payload = mock_process_cloudevent.call_args[0][0]
+        self.assertEqual(payload["data"]["status"], StatusTaak.OPEN)
+
+
+@freeze_time(FROZEN_TIME)
+@patch("notifications_api_common.tasks.send_cloudevent.delay")
+@patch("notifications_api_common.cloudevents.uuid.uuid4", lambda: MOCKED_CLOUDEVENT_ID)
+@override_settings(
+    NOTIFICATIONS_SOURCE=NOTIFICATIONS_SOURCE, CELERY_TASK_ALWAYS_EAGER=True
+)
+class DueTaakEventsTest(TestCase):
+    def test_events_planned_on_save(self, mock_process_cloudevent):
+        taak = ExterneTaakFactory.create(
+            formuliertaak=True,
+            datum_herinnering=datetime.date(2026, 1, 3),
+            einddatum_handelings_termijn=datetime.date(2026, 1, 10),
+        )
+
+        self.assertEqual(
+            dict(taak.geplande_events.values_list("soort", "gepland_op")),
+            {
+                GeplandTaakEventSoort.HERINNERING: timezone.make_aware(
+                    datetime.datetime(2026, 1, 3)
+                ),
+                GeplandTaakEventSoort.VERLOPEN: timezone.make_aware(
+                    datetime.datetime(2026, 1, 10)
+                ),
+            },
+        )
+
+        with self.subTest("date changed"):
+            taak.einddatum_handelings_termijn = datetime.date(2026, 1, 20)
+            taak.save()
+
+            self.assertEqual(
+                taak.geplande_events.get(
+                    soort=GeplandTaakEventSoort.VERLOPEN
+                ).gepland_op,
+                timezone.make_aware(datetime.datetime(2026, 1, 20)),
+            )
+            self.assertEqual(taak.geplande_events.count(), 2)
+
+        with self.subTest("taak no longer open"):
+            taak.status = StatusTaak.VERWERKT
+            taak.save()
+
+            self.assertFalse(taak.geplande_events.exists())
+
+    def test_send_due_events(self, mock_process_cloudevent):
+        taak = ExterneTaakFactory.create(
+            formuliertaak=True,
+            datum_herinnering=datetime.date(2026, 1, 3),
+            einddatum_handelings_termijn=datetime.date(2026, 1, 10),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            send_due_taak_events()
+
+        mock_process_cloudevent.assert_not_called()
+        self.assertEqual(GeplandTaakEvent.objects.count(), 2)
+
+        with freeze_time("2026-01-03"):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_taak_events()
+
         taak.refresh_from_db()
-        self.assertFalse(taak.is_handelings_termijn_verzonden)
+        mock_process_cloudevent.assert_called_once()
+        payload = mock_process_cloudevent.call_args[0][0]
+        self.assertEqual(payload["type"], EXTERNETAAK_HERINNERD)
+        self.assertTrue(taak.is_herinnering_verzonden)
+        self.assertEqual(
+            list(GeplandTaakEvent.objects.values_list("soort", flat=True)),
+            [GeplandTaakEventSoort.VERLOPEN],
+        )
+
+        with freeze_time("2026-01-10"):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_taak_events()
+
+        taak.refresh_from_db()
+        self.assertEqual(mock_process_cloudevent.call_count, 2)
+        payload = mock_process_cloudevent.call_args[0][0]
+        self.assertEqual(payload["type"], EXTERNETAAK_VERLOPEN)
+        self.assertTrue(taak.is_handelings_termijn_verzonden)
+        self.assertEqual(taak.status, StatusTaak.NIET_UITGEVOERD)
+        self.assertFalse(GeplandTaakEvent.objects.exists())
+
+    def test_send_due_events_already_sent(self, mock_process_cloudevent):
+        taak = ExterneTaakFactory.create(
+            formuliertaak=True,
+            datum_herinnering=datetime.date(2026, 1, 3),
+            einddatum_handelings_termijn=datetime.date(2026, 1, 10),
+        )
+        # updated without saving the taak, as done by ``send_taak_events``
+        ExterneTaak.objects.filter(pk=taak.pk).update(is_herinnering_verzonden=True)
+
+        with freeze_time("2026-01-03"):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_taak_events()
+
+        mock_process_cloudevent.assert_not_called()
+        self.assertEqual(
+            list(GeplandTaakEvent.objects.values_list("soort", flat=True)),
+            [GeplandTaakEventSoort.VERLOPEN],
+        )
+
+    def test_send_due_events_not_claimed(self, mock_process_cloudevent):
+        taak = ExterneTaakFactory.create(
+            formuliertaak=True,
+            datum_herinnering=datetime.date(2026, 1, 3),
+            einddatum_handelings_termijn=datetime.date(2026, 1, 10),
+        )
+        # updated without saving the taak, so the planned event is not updated
+        ExterneTaak.objects.filter(pk=taak.pk).update(
+            datum_herinnering=datetime.date(2026, 1, 5)
+        )
+
+        with freeze_time("2026-01-03"):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_taak_events()
+
+        mock_process_cloudevent.assert_not_called()
+        # the planned event of the taak which is not claimed is planned again
+        self.assertEqual(
+            GeplandTaakEvent.objects.get(
+                soort=GeplandTaakEventSoort.HERINNERING
+            ).gepland_op,
+            timezone.make_aware(datetime.datetime(2026, 1, 5)),
+        )
+        self.assertEqual(GeplandTaakEvent.objects.count(), 2)
+
+    def test_send_due_events_taak_deleted(self, mock_process_cloudevent):
+        taak = ExterneTaakFactory.create(
+            formuliertaak=True,
+            datum_herinnering=datetime.date(2026, 1, 3),
+            einddatum_handelings_termijn=datetime.date(2026, 1, 10),
+        )
+        # deleted without its planned events
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM taken_externetaak WHERE id = %s", [taak.pk])
+
+        with freeze_time("2026-01-03"):
+            with self.captureOnCommitCallbacks(execute=True):
+                send_due_taak_events()
+
+        mock_process_cloudevent.assert_not_called()
+        self.assertEqual(
+            list(GeplandTaakEvent.objects.values_list("soort", flat=True)),
+            [GeplandTaakEventSoort.VERLOPEN],
+        )
+
+    @patch("openvtb.components.taken.tasks.DUE_EVENTS_BATCH_SIZE", 1)
+    @patch("openvtb.components.taken.tasks.claim", return_value=[])
+    def test_send_due_events_locked_taken(self, mock_claim, mock_process_cloudevent):
+        ExterneTaakFactory.create_batch(
+            2,
+            formuliertaak=True,
+            datum_herinnering=datetime.date(2026, 1, 3),
+            einddatum_handelings_termijn=datetime.date(2026, 1, 10),
+        )
+
+        with freeze_time("2026-01-03"):
+            with self.captureOnCommitCallbacks(execute=True):
+                # the taken are locked by another transaction, so the run stops
+                # instead of fetching the same planned event again
+                send_due_taak_events()
+
+        mock_process_cloudevent.assert_not_called()
+        self.assertEqual(GeplandTaakEvent.objects.count(), 4)
@@ -1,3 +1,8 @@
+import math
+
+from django.contrib.gis.gdal.error import GDALException
+from django.contrib.gis.geos import GEOSException, GEOSGeometry, Point, Polygon
+from django.contrib.gis.measure import D
 from django.utils.translation import gettext_lazy as _
 
 from django_filters import filters
@@ -8,6 +13,55 @@ from openvtb.utils.serializers import URNRelatedField
 
 from ..models import Verzoek, VerzoekType
 
+GEOMETRIE_SRID = 4326
+
+# radius of the sphere of ``ST_DistanceSphere``, used to derive a bounding box
+# around a point that can be looked up with the GiST index
+EARTH_RADIUS = 6_370_986
+# the bounding box is slightly enlarged, so rounding never excludes points on the
+# edge of the distance
+BBOX_MARGIN = 1.001
+
+
+def parse_numbers(value: str, count: int, field_name: str) -> list[float]:
+    try:
+        numbers = [float(number) for number in value.split(",")]
+    except ValueError:
+        numbers = []
+    if len(numbers) != count or not all(map(math.isfinite, numbers)):
+        raise ValidationError(
+            {
+                field_name: _(
+                    "Verwacht {count} getallen, gescheiden door komma's."
+                ).format(count=count)
+            }
+        )
+    return numbers
+
+
+def parse_geojson(value: str, field_name: str, geom_types=None) -> GEOSGeometry:
+    try:
+        geometry = GEOSGeometry(value)
+    except (ValueError, GEOSException, GDALException):
+        raise ValidationError({field_name: _("Ongeldige GeoJSON geometrie.")})
+
+    if geom_types and geometry.geom_type not in geom_types:
+        raise ValidationError(
+            {
+                field_name: _("Het geometrie type moet een van {types} zijn.").format(
+                    types=", ".join(geom_types)
+                )
+            }
+        )
+    if not geometry.valid:
+        raise ValidationError({field_name: geometry.valid_reason})
+
+    if geometry.srid is None:
+        geometry.srid = GEOMETRIE_SRID
+    elif geometry.srid != GEOMETRIE_SRID:
+        geometry.transform(GEOMETRIE_SRID)
+    return geometry
+
 
 class VerzoekFilter(FilterSet):
     verzoek_type__uuid = filters.UUIDFilter(
@@ -30,6 +84,33 @@ class VerzoekFilter(FilterSet):
     verzoek_betaling__voltooid = filters.BooleanFilter(
         method="filter_verzoek_betaling_voltooid",
     )
+    geometrie__bbox = filters.CharFilter(
+        method="filter_geometrie_bbox",
+        help_text=_(
+            "Filter op Verzoeken waarvan de geometrie de bounding box overlapt. "
+            "Formaat: `minLon,minLat,maxLon,maxLat` (WGS 84)."
+        ),
+    )
+    geometrie__within = filters.CharFilter(
+        method="filter_geometrie_within",
+        help_text=_(
+            "Filter op Verzoeken waarvan de geometrie volledig binnen de opgegeven "
+            "GeoJSON Polygon of MultiPolygon valt."
+        ),
+    )
+    geometrie__intersects = filters.CharFilter(
+        method="filter_geometrie_intersects",
+        help_text=_(
+            "Filter op Verzoeken waarvan de geometrie de opgegeven GeoJSON geometrie snijdt."
+        ),
+    )
+    geometrie__afstand = filters.CharFilter(
+        method="filter_geometrie_afstand",
+        help_text=_(
+            "Filter op Verzoeken waarvan de geometrie binnen een afstand (in meters) "
+            "van een punt ligt. Formaat: `lon,lat,afstand` (WGS 84)."
+        ),
+    )
 
     class Meta:
         model = Verzoek
@@ -63,6 +144,54 @@ class VerzoekFilter(FilterSet):
     def filter_verzoek_betaling_voltooid(self, queryset, name, value):
         return queryset.filter(betaling__voltooid=value)
 
+    def filter_geometrie_bbox(self, queryset, name, value):
+        min_x, min_y, max_x, max_y = parse_numbers(value, 4, name)
+        if min_x > max_x or min_y > max_y:
+            raise ValidationError(
+                {
+                    name: _(
+                        "De minimale coördinaten moeten kleiner zijn dan de maximale."
+                    )
+                }
+            )
+
+        bbox = Polygon.from_bbox((min_x, min_y, max_x, max_y))
+        bbox.srid = GEOMETRIE_SRID
+        return queryset.filter(geometrie__bboverlaps=bbox)
+
+    def filter_geometrie_within(self, queryset, name, value):
+        polygon = parse_geojson(value, name, geom_types=("Polygon", "MultiPolygon"))
+        return queryset.filter(geometrie__within=polygon)
+
+    def filter_geometrie_intersects(self, queryset, name, value):
+        geometry = parse_geojson(value, name)
+        return queryset.filter(geometrie__intersects=geometry)
+
+    def filter_geometrie_afstand(self, queryset, name, value):
+        lon, lat, distance = parse_numbers(value, 3, name)
+        if not (-180 <= lon <= 180 and -90 <= lat <= 90) or distance < 0:
+            raise ValidationError({name: _("Ongeldig punt of ongeldige afstand.")})
+
+        point = Point(lon, lat, srid=GEOMETRIE_SRID)
+        # The distance on the sphere can't use the GiST index, so the candidates
+        # are first narrowed down with a bounding box around the point
+        angle = distance / EARTH_RADIUS * BBOX_MARGIN
+        delta_lat = math.degrees(angle)
+        cos_lat = math.cos(math.radians(lat))
+        if abs(lat) + delta_lat >= 90 or math.sin(angle) >= cos_lat:
+            # the circle contains a pole
+            delta_lon = 180
+        else:
+            delta_lon = math.degrees(math.asin(math.sin(angle) / cos_lat))
+        bbox = Polygon.from_bbox(
+            (lon - delta_lon, lat - delta_lat, lon + delta_lon, lat + delta_lat)
+        )
+        bbox.srid = GEOMETRIE_SRID
+        return queryset.filter(
+            geometrie__bboverlaps=bbox,
+            geometrie__distance_lte=(point, D(m=distance)),
+        )
+
 
 class VerzoekTypeFilter(FilterSet):
     class Meta:
@@ -0,0 +1,25 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from ..tiles import MVT_CONTENT_TYPE
+
+
+class MVTRenderer(BaseRenderer):
+    """
+    Render Mapbox Vector Tiles, which are already encoded by PostGIS.
+
+    Errors (for example invalid filters) are rendered as JSON.
+    """
+
+    media_type = MVT_CONTENT_TYPE
+    format = "mvt"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, bytes):
+            return data
+
+        response = (renderer_context or {}).get("response")
+        if response is not None:
+            response["Content-Type"] = JSONRenderer.media_type
+        return JSONRenderer().render(data, accepted_media_type, renderer_context)
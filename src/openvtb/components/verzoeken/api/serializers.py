@@ -1,4 +1,6 @@
-from django.db import IntegrityError, transaction
+import copy
+
+from django.db import IntegrityError, models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
@@ -7,6 +9,7 @@ from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
 from vng_api_common.serializers import CachedHyperlinkedRelatedField
 from vng_api_common.utils import get_help_text
 
+from openvtb.utils.api_mixins import SparseFieldsSerializerMixin
 from openvtb.utils.serializers import (
     URNField,
     URNModelSerializer,
@@ -22,6 +25,7 @@ from ..models import (
     VerzoekBron,
     VerzoekType,
     VerzoekTypeVersion,
+    prefetch_verzoek_type_versies,
 )
 from .validators import (
     AanvraagGegevensValidator,
@@ -44,7 +48,9 @@ class BijlageTypeSerializer(serializers.ModelSerializer):
         }
 
 
-class VerzoekTypeVersionSerializer(NestedHyperlinkedModelSerializer):
+class VerzoekTypeVersionSerializer(
+    SparseFieldsSerializerMixin, NestedHyperlinkedModelSerializer
+):
     """
     Serializer for a specific version of a ``VerzoekType``.
 
@@ -60,6 +66,8 @@ class VerzoekTypeVersionSerializer(NestedHyperlinkedModelSerializer):
         help_text=_("Lijst met bijlagen typen die aan deze bron zijn gekoppeld."),
     )
 
+    deferrable_fields = ("aanvraag_gegevens_schema",)
+
     class Meta:
         model = VerzoekTypeVersion
         fields = (
@@ -259,6 +267,53 @@ class IsGerelateerdAanSerializer(serializers.Serializer):
     )
 
 
+class GeometrieWeergaveSerializer(serializers.Serializer):
+    """
+    Query parameters to reduce the size of the geometries in the list of verzoeken.
+    """
+
+    geometrie_tolerantie = serializers.FloatField(min_value=0, required=False)
+    geometrie_precisie = serializers.IntegerField(
+        min_value=0, max_value=15, required=False
+    )
+    geometrie_weglaten = serializers.BooleanField(default=False)
+
+
+class VerzoekExpandSerializer(serializers.Serializer):
+    """
+    The related resources of a verzoek that are requested with ``expand``.
+    """
+
+    verzoek_type = VerzoekTypeSerializer(
+        read_only=True,
+        help_text=_("Het VerzoekType van het verzoek."),
+    )
+    verzoek_type_versie = VerzoekTypeVersionSerializer(
+        read_only=True,
+        allow_null=True,
+        help_text=_(
+            "De versie van het VerzoekType die door het verzoek gebruikt wordt."
+        ),
+    )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if expand := self.context.get("expand"):
+            fields = {name: field for name, field in fields.items() if name in expand}
+        return fields
+
+
+class VerzoekListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+
+        if "verzoek_type_versie" in self.context.get("expand", ()):
+            data = list(data)
+            prefetch_verzoek_type_versies(data)
+        return super().to_representation(data)
+
+
 class VerzoekSerializer(URNModelSerializer, serializers.ModelSerializer):
     verzoek_type = CachedHyperlinkedRelatedField(
         view_name="verzoeken:verzoektype-detail",
@@ -299,9 +354,18 @@ class VerzoekSerializer(URNModelSerializer, serializers.ModelSerializer):
         required=False,
         help_text=get_help_text("verzoeken.Verzoek", "is_gerelateerd_aan"),
     )
+    _expand = VerzoekExpandSerializer(
+        source="*",
+        read_only=True,
+        required=False,
+        help_text=_(
+            "De gerelateerde resources die met de `expand` query parameter zijn opgevraagd."
+        ),
+    )
 
     class Meta:
         model = Verzoek
+        list_serializer_class = VerzoekListSerializer
         fields = (
             "url",
             "urn",
@@ -321,6 +385,7 @@ class VerzoekSerializer(URNModelSerializer, serializers.ModelSerializer):
             "verzoek_informatie_object",
             "verzoek_bron",
             "verzoek_betaling",
+            "_expand",
         )
 
         extra_kwargs = {
@@ -344,6 +409,33 @@ class VerzoekSerializer(URNModelSerializer, serializers.ModelSerializer):
         }
 
     validators = [AanvraagGegevensValidator()]
+    deferrable_fields = ("aanvraag_gegevens", "geometrie")
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        if self.context.get("expand"):
+            # also expand when ``_expand`` is not selected with ``fields``
+            fields.setdefault(
+                "_expand", copy.deepcopy(self._declared_fields["_expand"])
+            )
+        elif not getattr(self.context.get("view"), "swagger_fake_view", False):
+            fields.pop("_expand", None)
+
+        weergave = self.context.get("geometrie_weergave", {})
+        if weergave.get("geometrie_weglaten"):
+            fields.pop("geometrie", None)
+        if "geometrie" not in fields:
+            return fields
+
+        # the geometry is simplified in the database, see ``VerzoekViewSet``
+        if weergave.get("geometrie_tolerantie"):
+            fields["geometrie"].source = "geometrie_weergave"
+        if (precisie := weergave.get("geometrie_precisie")) is not None:
+            fields["geometrie"].precision = precisie
+            # rounding can result in consecutive points that are equal
+            fields["geometrie"].remove_dupes = True
+        return fields
 
     def validate_bijlagen(self, value):
         """
@@ -1,9 +1,14 @@
 import uuid
 
+from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.geos import Point, Polygon
+from django.db import connection
+
 from rest_framework import status
 from vng_api_common.tests import get_validation_errors, reverse
 
 from openvtb.components.verzoeken.constants import VerwerkStatus
+from openvtb.components.verzoeken.models import Verzoek
 from openvtb.components.verzoeken.tests.factories import (
     VerzoekFactory,
     VerzoekTypeFactory,
@@ -413,3 +418,126 @@ class VerzoekTypeFilterTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertEqual(data["count"], 0)
+
+
+class VerzoekGeometrieFilterTest(APITestCase):
+    list_url = reverse("verzoeken:verzoek-list")
+
+    def setUp(self):
+        super().setUp()
+        # Utrecht Domtoren
+        self.verzoek_punt = VerzoekFactory.create(
+            geometrie=Point(5.1214, 52.0907, srid=4326)
+        )
+        # a polygon around Utrecht Centraal
+        self.verzoek_polygoon = VerzoekFactory.create(
+            geometrie=Polygon.from_bbox((5.108, 52.088, 5.112, 52.091))
+        )
+        # Amsterdam Dam
+        self.verzoek_ver_weg = VerzoekFactory.create(
+            geometrie=Point(4.8932, 52.3731, srid=4326)
+        )
+        self.verzoek_zonder_geometrie = VerzoekFactory.create(geometrie=None)
+
+    def assertResults(self, params, expected):
+        response = self.client.get(self.list_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        uuids = {result["uuid"] for result in response.json()["results"]}
+        self.assertEqual(uuids, {str(verzoek.uuid) for verzoek in expected})
+
+    def test_filter_bbox(self):
+        self.assertResults(
+            {"geometrie__bbox": "5.0,52.0,5.2,52.2"},
+            [self.verzoek_punt, self.verzoek_polygoon],
+        )
+        # overlapping only a part of the polygon
+        self.assertResults(
+            {"geometrie__bbox": "5.111,52.090,5.115,52.095"},
+            [self.verzoek_polygoon],
+        )
+
+    def test_filter_within(self):
+        utrecht = Polygon.from_bbox((5.0, 52.0, 5.2, 52.2))
+        self.assertResults(
+            {"geometrie__within": utrecht.geojson},
+            [self.verzoek_punt, self.verzoek_polygoon],
+        )
+
+        # the polygon is only partially inside
+        partial = Polygon.from_bbox((5.110, 52.0, 5.2, 52.2))
+        self.assertResults({"geometrie__within": partial.geojson}, [self.verzoek_punt])
+
+    def test_filter_intersects(self):
+        partial = Polygon.from_bbox((5.110, 52.0, 5.2, 52.2))
+        self.assertResults(
+            {"geometrie__intersects": partial.geojson},
+            [self.verzoek_punt, self.verzoek_polygoon],
+        )
+        self.assertResults(
+            {"geometrie__intersects": Point(4.8932, 52.3731).geojson},
+            [self.verzoek_ver_weg],
+        )
+
+    def test_filter_afstand(self):
+        # Utrecht Centraal is roughly 1 km from the Domtoren
+        self.assertResults(
+            {"geometrie__afstand": "5.1214,52.0907,100"}, [self.verzoek_punt]
+        )
+        self.assertResults(
+            {"geometrie__afstand": "5.1214,52.0907,2000"},
+            [self.verzoek_punt, self.verzoek_polygoon],
+        )
+        self.assertResults(
+            {"geometrie__afstand": "5.1214,52.0907,50000"},
+            [self.verzoek_punt, self.verzoek_polygoon, self.verzoek_ver_weg],
+        )
+
+    def test_filter_afstand_edge(self):
+        center = Point(6.0, 53.0, srid=4326)
+        noord = VerzoekFactory.create(geometrie=Point(6.0, 53.01, srid=4326))
+        oost = VerzoekFactory.create(geometrie=Point(6.01, 53.0, srid=4326))
+
+        for verzoek in (noord, oost):
+            with self.subTest(verzoek=verzoek.geometrie.coords):
+                # ST_DistanceSphere, like the filter
+                distance = (
+                    Verzoek.objects.annotate(afstand=Distance("geometrie", center))
+                    .get(pk=verzoek.pk)
+                    .afstand.m
+                )
+                # the point lies at 0.9999 times the distance
+                self.assertResults(
+                    {"geometrie__afstand": f"6.0,53.0,{distance / 0.9999}"},
+                    [verzoek],
+                )
+                self.assertResults(
+                    {"geometrie__afstand": f"6.0,53.0,{distance * 0.9999}"}, []
+                )
+
+    def test_filter_invalid_values(self):
+        invalid = {
+            "geometrie__bbox": ["5.0,52.0,5.2", "a,b,c,d", "5.2,52.0,5.0,52.2"],
+            "geometrie__within": [
+                "not json",
+                Point(5.1, 52.1).geojson,
+            ],
+            "geometrie__intersects": ['{"type": "Polygon"}'],
+            "geometrie__afstand": ["5.1,52.1", "5.1,52.1,-1", "200,52.1,10"],
+        }
+        for param, values in invalid.items():
+            for value in values:
+                with self.subTest(param=param, value=value):
+                    response = self.client.get(self.list_url, {param: value})
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                    self.assertIsNotNone(get_validation_errors(response, param))
+
+    def test_query_plan_uses_gist_index(self):
+        bbox = Polygon.from_bbox((5.0, 52.0, 5.2, 52.2))
+        bbox.srid = 4326
+        queryset = Verzoek.objects.filter(geometrie__bboverlaps=bbox)
+
+        # with only a handful of rows the planner prefers a sequential scan
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        self.assertIn("verzoek_geometrie_gist", queryset.explain())
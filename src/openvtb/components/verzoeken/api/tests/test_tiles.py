@@ -0,0 +1,192 @@
+from unittest.mock import patch
+
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from rest_framework import status
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openvtb.components.verzoeken.constants import VerwerkStatus
+from openvtb.components.verzoeken.models import Verzoek
+from openvtb.components.verzoeken.tests.factories import VerzoekFactory
+from openvtb.components.verzoeken.tiles import (
+    MVT_CONTENT_TYPE,
+    invalidate_all_tiles,
+    invalidate_tiles,
+    render_tile,
+    tile_bounds,
+    tiles_for_extent,
+)
+from openvtb.utils.api_testcase import APITestCase
+
+# the tile containing the center of Utrecht at zoom level 12
+UTRECHT_TILE = (12, 2106, 1351)
+
+
+def tile_url(z, x, y):
+    return reverse("verzoeken:verzoek-tiles", kwargs={"z": z, "x": x, "y": y})
+
+
+class TileUtilsTests(SimpleTestCase):
+    def test_tile_bounds(self):
+        bounds = tile_bounds(0, 0, 0)
+        min_lon, min_lat, max_lon, max_lat = bounds.extent
+
+        self.assertEqual((min_lon, max_lon), (-180, 180))
+        self.assertAlmostEqual(max_lat, 85.0511, places=4)
+        self.assertAlmostEqual(min_lat, -85.0511, places=4)
+
+    def test_tiles_for_extent(self):
+        point = Point(5.1214, 52.0907)
+        z, x, y = UTRECHT_TILE
+
+        xs, ys = tiles_for_extent(point.extent, z)
+
+        self.assertEqual((list(xs), list(ys)), ([x], [y]))
+        self.assertTrue(tile_bounds(*UTRECHT_TILE).contains(point))
+
+
+class VerzoekTilesTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        self.verzoek = VerzoekFactory.create(
+            geometrie=Point(5.1214, 52.0907, srid=4326),
+            verwerk_status=VerwerkStatus.GEREGISTREERD,
+        )
+
+    def test_tile(self):
+        response = self.client.get(tile_url(*UTRECHT_TILE))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], MVT_CONTENT_TYPE)
+        self.assertIn(str(self.verzoek.uuid).encode(), response.content)
+
+    def test_empty_tile(self):
+        response = self.client.get(tile_url(12, 0, 0))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, b"")
+
+    def test_tile_does_not_exist(self):
+        response = self.client.get(tile_url(1, 2, 0))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_filters(self):
+        response = self.client.get(
+            tile_url(*UTRECHT_TILE), {"verwerkStatus": VerwerkStatus.VERWERKT}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, b"")
+
+    def test_invalid_filter(self):
+        response = self.client.get(
+            tile_url(*UTRECHT_TILE), {"geometrie__bbox": "invalid"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNotNone(get_validation_errors(response, "geometrie__bbox"))
+
+    @patch("openvtb.components.verzoeken.tiles.render_tile", side_effect=render_tile)
+    def test_cache(self, mock_render_tile):
+        with self.subTest("tile is cached"):
+            self.client.get(tile_url(*UTRECHT_TILE))
+            self.client.get(tile_url(*UTRECHT_TILE))
+
+            self.assertEqual(mock_render_tile.call_count, 1)
+
+        with self.subTest("filters are part of the cache key"):
+            self.client.get(tile_url(*UTRECHT_TILE), {"verwerkStatus": "verwerkt"})
+
+            self.assertEqual(mock_render_tile.call_count, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            VerzoekFactory.create(geometrie=Point(0, 0, srid=4326))
+
+        with self.subTest("change outside the tile"):
+            self.client.get(tile_url(*UTRECHT_TILE))
+
+            self.assertEqual(mock_render_tile.call_count, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.verzoek.verwerk_status = VerwerkStatus.VERWERKT
+            self.verzoek.save()
+
+        with self.subTest("change inside the tile"):
+            response = self.client.get(tile_url(*UTRECHT_TILE))
+
+            self.assertEqual(mock_render_tile.call_count, 3)
+            self.assertIn(b"verwerkt", response.content)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.verzoek.geometrie = Point(0, 0, srid=4326)
+            self.verzoek.save()
+
+        with self.subTest("verzoek moved out of the tile"):
+            response = self.client.get(tile_url(*UTRECHT_TILE))
+
+            self.assertEqual(mock_render_tile.call_count, 4)
+            self.assertEqual(response.content, b"")
+
+    @patch("openvtb.components.verzoeken.tiles.render_tile", side_effect=render_tile)
+    def test_loaded_verzoek_moved(self, mock_render_tile):
+        self.client.get(tile_url(*UTRECHT_TILE))
+        verzoek = Verzoek.objects.get(pk=self.verzoek.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            verzoek.geometrie = Point(0, 0, srid=4326)
+            # the previous geometry was loaded, so it is not queried again
+            with self.assertNumQueries(1):
+                verzoek.save(update_fields=["geometrie"])
+
+        response = self.client.get(tile_url(*UTRECHT_TILE))
+
+        self.assertEqual(mock_render_tile.call_count, 2)
+        self.assertEqual(response.content, b"")
+
+    @patch("openvtb.components.verzoeken.tiles.render_tile", side_effect=render_tile)
+    def test_deferred_verzoek_moved(self, mock_render_tile):
+        self.client.get(tile_url(*UTRECHT_TILE))
+        verzoek = Verzoek.objects.defer("geometrie").get(pk=self.verzoek.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            verzoek.geometrie = Point(0, 0, srid=4326)
+            verzoek.save(update_fields=["geometrie"])
+
+        response = self.client.get(tile_url(*UTRECHT_TILE))
+
+        self.assertEqual(mock_render_tile.call_count, 2)
+        self.assertEqual(response.content, b"")
+
+    def test_invalidate_tiles_single_round_trip(self):
+        with (
+            patch.object(cache, "set_many", wraps=cache.set_many) as mock_set_many,
+            patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many,
+        ):
+            invalidate_tiles([self.verzoek.geometrie, Point(0, 0, srid=4326)])
+
+        mock_set_many.assert_called_once()
+        mock_get_many.assert_not_called()
+
+    @patch("openvtb.components.verzoeken.tiles.render_tile", side_effect=render_tile)
+    def test_bulk_update(self, mock_render_tile):
+        self.client.get(tile_url(*UTRECHT_TILE))
+        Verzoek.objects.update(verwerk_status=VerwerkStatus.VERWERKT)
+
+        with self.subTest("signals are not sent"):
+            self.client.get(tile_url(*UTRECHT_TILE))
+
+            self.assertEqual(mock_render_tile.call_count, 1)
+
+        invalidate_all_tiles()
+
+        with self.subTest("all tiles invalidated"):
+            response = self.client.get(tile_url(*UTRECHT_TILE))
+
+            self.assertEqual(mock_render_tile.call_count, 2)
+            self.assertIn(b"verwerkt", response.content)
@@ -1,6 +1,10 @@
 import json
 from decimal import Decimal
 
+from django.contrib.gis.geos import Polygon
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from vng_api_common.tests import get_validation_errors, reverse
 
@@ -547,3 +551,153 @@ class VerzoekTests(APITestCase):
         response = self.client.get(self.list_url)
         self.assertEqual(response.json()["count"], 0)
         self.assertFalse(Verzoek.objects.exists())
+
+
+class VerzoekGeometrieWeergaveTests(APITestCase):
+    list_url = reverse("verzoeken:verzoek-list")
+
+    def setUp(self):
+        super().setUp()
+        # a polygon with a redundant vertex on the straight edge between the corners
+        self.verzoek = VerzoekFactory.create(
+            geometrie=Polygon(
+                (
+                    (5.123456789, 52.0),
+                    (5.2, 52.0),
+                    (5.2, 52.1),
+                    (5.1615, 52.1000001),
+                    (5.123456789, 52.1),
+                    (5.123456789, 52.0),
+                ),
+                srid=4326,
+            )
+        )
+
+    def get_geometrie(self, params):
+        response = self.client.get(self.list_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["results"][0].get("geometrie", "missing")
+
+    def test_full_geometrie(self):
+        geometrie = self.get_geometrie({})
+
+        self.assertEqual(geometrie, json.loads(self.verzoek.geometrie.geojson))
+
+    def test_tolerantie(self):
+        geometrie = self.get_geometrie({"geometrieTolerantie": "0.001"})
+
+        self.assertEqual(geometrie["type"], "Polygon")
+        self.assertEqual(len(geometrie["coordinates"][0]), 5)
+        self.assertNotIn([5.1615, 52.1000001], geometrie["coordinates"][0])
+
+    def test_precisie(self):
+        geometrie = self.get_geometrie({"geometriePrecisie": "3"})
+
+        self.assertEqual(geometrie["coordinates"][0][0], [5.123, 52.0])
+
+    def test_tolerantie_and_precisie(self):
+        geometrie = self.get_geometrie(
+            {"geometrieTolerantie": "0.001", "geometriePrecisie": "2"}
+        )
+
+        self.assertEqual(
+            geometrie["coordinates"][0],
+            [[5.12, 52.0], [5.2, 52.0], [5.2, 52.1], [5.12, 52.1], [5.12, 52.0]],
+        )
+
+    def test_weglaten(self):
+        geometrie = self.get_geometrie({"geometrieWeglaten": "true"})
+
+        self.assertEqual(geometrie, "missing")
+
+    def test_retrieve_is_not_affected(self):
+        detail_url = reverse(
+            "verzoeken:verzoek-detail", kwargs={"uuid": self.verzoek.uuid}
+        )
+
+        response = self.client.get(detail_url, {"geometrieWeglaten": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("geometrie", response.json())
+
+    def test_invalid_values(self):
+        invalid = {
+            "geometrieTolerantie": "-1",
+            "geometriePrecisie": "16",
+            "geometrieWeglaten": "misschien",
+        }
+        for param, value in invalid.items():
+            with self.subTest(param=param):
+                response = self.client.get(self.list_url, {param: value})
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIsNotNone(get_validation_errors(response, param))
+
+
+class VerzoekExpandTests(APITestCase):
+    list_url = reverse("verzoeken:verzoek-list")
+
+    def setUp(self):
+        super().setUp()
+        self.verzoek_type = VerzoekTypeFactory.create(create_versie=True)
+        self.verzoek = VerzoekFactory.create(verzoek_type=self.verzoek_type)
+
+    def test_no_expand(self):
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("_expand", response.json()["results"][0])
+
+    def test_expand_list(self):
+        response = self.client.get(
+            self.list_url, {"expand": "verzoekType,verzoekTypeVersie"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expand = response.json()["results"][0]["_expand"]
+        self.assertEqual(expand["verzoekType"]["uuid"], str(self.verzoek_type.uuid))
+        self.assertEqual(expand["verzoekTypeVersie"]["versie"], self.verzoek.versie)
+        self.assertIn("aanvraagGegevensSchema", expand["verzoekTypeVersie"])
+
+    def test_expand_retrieve(self):
+        detail_url = reverse(
+            "verzoeken:verzoek-detail", kwargs={"uuid": self.verzoek.uuid}
+        )
+
+        response = self.client.get(detail_url, {"expand": "verzoekTypeVersie"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expand = response.json()["_expand"]
+        self.assertEqual(list(expand), ["verzoekTypeVersie"])
+        self.assertEqual(expand["verzoekTypeVersie"]["versie"], self.verzoek.versie)
+
+    def test_expand_with_fields(self):
+        response = self.client.get(
+            self.list_url, {"expand": "verzoekType", "fields": "uuid"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.json()["results"][0]
+        self.assertEqual(set(result), {"uuid", "_expand"})
+
+    def test_number_of_queries_does_not_depend_on_the_number_of_verzoeken(self):
+        params = {"expand": "verzoekType,verzoekTypeVersie"}
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.list_url, params)
+
+        for _ in range(3):
+            VerzoekFactory.create(
+                verzoek_type=VerzoekTypeFactory.create(create_versie=True)
+            )
+
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get(self.list_url, params)
+
+        self.assertEqual(len(response.json()["results"]), 4)
+
+    def test_invalid_expand(self):
+        response = self.client.get(self.list_url, {"expand": "verzoekType,bijlagen"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "expand")
+        self.assertEqual(error["code"], "invalid-expand")
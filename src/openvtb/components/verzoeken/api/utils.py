@@ -1,3 +1,4 @@
+from django.contrib.gis.db.models.functions import GeoFunc
 from django.core.exceptions import ValidationError
 from django.http import Http404
 from django.utils.translation import gettext_lazy as _
@@ -26,3 +27,44 @@ verzoektype_uuid_param = OpenApiParameter(
     required=True,
     description=_("UUID van het VerzoekType"),
 )
+
+
+class SimplifyPreserveTopology(GeoFunc):
+    function = "ST_SimplifyPreserveTopology"
+
+
+expand_param = OpenApiParameter(
+    name="expand",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    description=_(
+        "Komma-gescheiden lijst van gerelateerde resources die in `_expand` worden "
+        "opgenomen. Mogelijke waarden: `verzoekType`, `verzoekTypeVersie`."
+    ),
+)
+
+geometrie_weergave_params = [
+    OpenApiParameter(
+        name="geometrieTolerantie",
+        type=OpenApiTypes.DOUBLE,
+        location=OpenApiParameter.QUERY,
+        description=_(
+            "Vereenvoudig de geometrieën met deze tolerantie (in graden) met behoud van "
+            "de topologie, bijvoorbeeld `0.0001` voor ongeveer 10 meter."
+        ),
+    ),
+    OpenApiParameter(
+        name="geometriePrecisie",
+        type=OpenApiTypes.INT,
+        location=OpenApiParameter.QUERY,
+        description=_(
+            "Het aantal decimalen waarop de coördinaten van de geometrieën worden afgerond."
+        ),
+    ),
+    OpenApiParameter(
+        name="geometrieWeglaten",
+        type=OpenApiTypes.BOOL,
+        location=OpenApiParameter.QUERY,
+        description=_("Laat de geometrie weg uit de resultaten."),
+    ),
+]
@@ -1,31 +1,54 @@
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from djangorestframework_camel_case.util import camel_to_underscore, underscoreize
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+    extend_schema_view,
+)
 from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.settings import api_settings
 from vng_api_common.pagination import DynamicPageSizePagination
 
 from openvtb.components.verzoeken.constants import VerzoekTypeVersionStatus
+from openvtb.utils.api_mixins import SparseFieldsViewSetMixin
 
 from ..models import Verzoek, VerzoekType, VerzoekTypeVersion
+from ..tiles import MVT_CONTENT_TYPE, get_tile, tile_exists
 from .filters import VerzoekFilter, VerzoekTypeFilter
+from .renderers import MVTRenderer
 from .serializers import (
+    GeometrieWeergaveSerializer,
     VerzoekSerializer,
     VerzoekTypeSerializer,
     VerzoekTypeVersionSerializer,
 )
-from .utils import NestedViewSetMixin, verzoektype_uuid_param
+from .utils import (
+    NestedViewSetMixin,
+    SimplifyPreserveTopology,
+    expand_param,
+    geometrie_weergave_params,
+    verzoektype_uuid_param,
+)
 
 
 @extend_schema_view(
     list=extend_schema(
         summary=_("Vraag alle verzoeken aan."),
         description=_("Vraag alle verzoeken aan."),
+        parameters=[expand_param, *geometrie_weergave_params],
     ),
     retrieve=extend_schema(
         summary=_("Een specifiek verzoek opvragen."),
         description=_("Een specifiek verzoek opvragen."),
+        parameters=[expand_param],
     ),
     create=extend_schema(
         summary=_("Maak een verzoek aan."),
@@ -43,8 +66,33 @@ from .utils import NestedViewSetMixin, verzoektype_uuid_param
         summary=_("Een verzoek verwijderen"),
         description=_("Een verzoek verwijderen"),
     ),
+    tiles=extend_schema(
+        summary=_("Vraag een vector tile van de verzoeken aan."),
+        description=_(
+            "Vraag de geometrieën van de verzoeken in een tile aan als Mapbox Vector Tile. "
+            "De laag `verzoeken` bevat de attributen `uuid`, `verzoek_type` en `verwerk_status`. "
+            "De filters zijn gelijk aan die van de lijst van verzoeken."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name,
+                OpenApiTypes.INT,
+                OpenApiParameter.PATH,
+                description=description,
+            )
+            for name, description in (
+                ("z", _("Zoomniveau van de tile.")),
+                ("x", _("Kolom van de tile.")),
+                ("y", _("Rij van de tile.")),
+            )
+        ],
+        filters=True,
+        responses={
+            (200, MVT_CONTENT_TYPE): OpenApiResponse(OpenApiTypes.BINARY),
+        },
+    ),
 )
-class VerzoekViewSet(viewsets.ModelViewSet):
+class VerzoekViewSet(SparseFieldsViewSetMixin, viewsets.ModelViewSet):
     queryset = Verzoek.objects.select_related(
         "verzoek_type", "betaling", "bron"
     ).prefetch_related("bijlagen")
@@ -53,6 +101,75 @@ class VerzoekViewSet(viewsets.ModelViewSet):
     permission_classes = (IsAuthenticated,)
     lookup_field = "uuid"
     filterset_class = VerzoekFilter
+    expand_options = frozenset({"verzoek_type", "verzoek_type_versie"})
+    statement_timeouts = {"tiles": "export"}
+
+    @cached_property
+    def expand(self) -> frozenset[str]:
+        if self.action not in ("list", "retrieve"):
+            return frozenset()
+
+        value = self.request.query_params.get("expand", "")
+        expand = frozenset(
+            camel_to_underscore(name.strip())
+            for name in value.split(",")
+            if name.strip()
+        )
+        if unknown := expand - self.expand_options:
+            raise ValidationError(
+                {
+                    "expand": _("Onbekende waarden: {values}.").format(
+                        values=", ".join(sorted(unknown))
+                    )
+                },
+                code="invalid-expand",
+            )
+        return expand
+
+    @cached_property
+    def geometrie_weergave(self) -> dict:
+        if self.action != "list":
+            return {}
+
+        serializer = GeometrieWeergaveSerializer(
+            data=underscoreize(self.request.query_params.dict())
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if "verzoek_type" in self.expand:
+            queryset = queryset.prefetch_related("verzoek_type__versies")
+
+        if self.geometrie_weergave.get("geometrie_weglaten"):
+            return queryset.defer("geometrie")
+        if tolerantie := self.geometrie_weergave.get("geometrie_tolerantie"):
+            return queryset.defer("geometrie").annotate(
+                geometrie_weergave=SimplifyPreserveTopology("geometrie", tolerantie)
+            )
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["geometrie_weergave"] = self.geometrie_weergave
+        context["expand"] = self.expand
+        return context
+
+    @action(
+        detail=False,
+        url_path=r"tiles/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.mvt",
+        renderer_classes=(MVTRenderer,),
+    )
+    def tiles(self, request, z, x, y, *args, **kwargs):
+        z, x, y = int(z), int(x), int(y)
+        if not tile_exists(z, x, y):
+            raise NotFound(_("Deze tile bestaat niet."))
+
+        queryset = self.filter_queryset(Verzoek.objects.all())
+        tile = get_tile(queryset, z, x, y, filters=request.query_params.dict())
+        return Response(tile, content_type=MVT_CONTENT_TYPE)
 
 
 @extend_schema_view(
@@ -81,7 +198,7 @@ class VerzoekViewSet(viewsets.ModelViewSet):
         description=_("Een verzoektype verwijderen"),
     ),
 )
-class VerzoekTypeViewSet(viewsets.ModelViewSet):
+class VerzoekTypeViewSet(SparseFieldsViewSetMixin, viewsets.ModelViewSet):
     queryset = VerzoekType.objects.prefetch_related("versies").order_by("-pk")
     serializer_class = VerzoekTypeSerializer
     pagination_class = DynamicPageSizePagination
@@ -122,8 +239,14 @@ class VerzoekTypeViewSet(viewsets.ModelViewSet):
         parameters=[verzoektype_uuid_param],
     ),
 )
-class VerzoekTypeVersionViewSet(NestedViewSetMixin, viewsets.ModelViewSet):
-    queryset = VerzoekTypeVersion.objects.order_by("verzoek_type", "-versie")
+class VerzoekTypeVersionViewSet(
+    SparseFieldsViewSetMixin, NestedViewSetMixin, viewsets.ModelViewSet
+):
+    queryset = (
+        VerzoekTypeVersion.objects.select_related("verzoek_type")
+        .prefetch_related("bijlage_typen")
+        .order_by("verzoek_type", "-versie")
+    )
     serializer_class = VerzoekTypeVersionSerializer
     lookup_field = "versie"
     lookup_url_kwarg = "verzoektype_versie"
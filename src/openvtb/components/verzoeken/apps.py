@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class VerzoekenConfig(AppConfig):
     name = "openvtb.components.verzoeken"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.15 on 2026-10-19 10:12
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+# name of the spatial index created for ``spatial_index=True`` in 0001_initial
+SPATIAL_INDEX_NAME = "verzoeken_verzoek_geometrie_75938e1a_id"
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("verzoeken", "0002_verzoek_mede_initiator"),
+    ]
+
+    operations = [
+        # the existing spatial index already is a GiST index, so it is renamed
+        # instead of dropped and rebuilt, which would lock the table for writes
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="verzoek",
+                    name="geometrie",
+                    field=django.contrib.gis.db.models.fields.GeometryField(
+                        blank=True,
+                        help_text="Point, LineString of Polygon object dat de locatie van het verzoek representeert.",
+                        null=True,
+                        spatial_index=False,
+                        srid=4326,
+                        verbose_name="geometrie",
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="verzoek",
+                    index=django.contrib.postgres.indexes.GistIndex(
+                        fields=["geometrie"], name="verzoek_geometrie_gist"
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    f"ALTER INDEX {SPATIAL_INDEX_NAME} RENAME TO verzoek_geometrie_gist",
+                    reverse_sql=(
+                        f"ALTER INDEX verzoek_geometrie_gist RENAME TO {SPATIAL_INDEX_NAME}"
+                    ),
+                ),
+            ],
+        ),
+    ]
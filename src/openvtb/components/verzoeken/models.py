@@ -1,12 +1,15 @@
 import uuid
+from collections.abc import Iterable
 from datetime import date
 
 from django.contrib.gis.db.models import GeometryField
+from django.contrib.postgres.indexes import GistIndex
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinLengthValidator
 from django.db import models
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
@@ -288,6 +291,8 @@ class Verzoek(models.Model):
         _("geometrie"),
         blank=True,
         null=True,
+        # the GiST index is declared explicitly in ``Meta.indexes``
+        spatial_index=False,
         help_text=_(
             "Point, LineString of Polygon object dat de locatie van het verzoek representeert."
         ),
@@ -373,6 +378,9 @@ class Verzoek(models.Model):
     class Meta:
         verbose_name = _("Verzoek")
         verbose_name_plural = _("Verzoeken")
+        indexes = [
+            GistIndex(fields=["geometrie"], name="verzoek_geometrie_gist"),
+        ]
 
     def __str__(self):
         return f"{self.uuid}"
@@ -426,6 +434,51 @@ class Verzoek(models.Model):
         self.clean_verzoek_type()
         self.clean_is_gerelateerd_aan()
 
+    @cached_property
+    def verzoek_type_versie(self) -> "VerzoekTypeVersion | None":
+        """
+        The version of the VerzoekType that is used by this verzoek.
+
+        Can be set for a batch of verzoeken with ``prefetch_verzoek_type_versies``.
+        """
+        return self.verzoek_type.versies.filter(versie=self.versie).first()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the tiles of the stored geometry are invalidated when it is changed
+        if "geometrie" in instance.__dict__:
+            instance._stored_geometrie = instance.geometrie
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        if "geometrie" in self.__dict__:
+            self._stored_geometrie = self.geometrie
+
+
+def prefetch_verzoek_type_versies(verzoeken: Iterable[Verzoek]) -> None:
+    """
+    Look up the ``verzoek_type_versie`` of the verzoeken with one query.
+    """
+    verzoeken = list(verzoeken)
+    versies = (
+        VerzoekTypeVersion.objects.filter(
+            verzoek_type__in={verzoek.verzoek_type_id for verzoek in verzoeken},
+            versie__in={verzoek.versie for verzoek in verzoeken},
+        )
+        .select_related("verzoek_type")
+        .prefetch_related("bijlage_typen")
+    )
+    versies_by_key = {
+        (versie.verzoek_type_id, versie.versie): versie for versie in versies
+    }
+
+    for verzoek in verzoeken:
+        verzoek.verzoek_type_versie = versies_by_key.get(
+            (verzoek.verzoek_type_id, verzoek.versie)
+        )
+
 
 class Bijlage(models.Model):
     uuid = models.UUIDField(
@@ -0,0 +1,39 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Verzoek
+from .tiles import invalidate_tiles
+
+
+@receiver(pre_save, sender=Verzoek)
+def store_previous_geometrie(sender, instance: Verzoek, raw=False, **kwargs):
+    if raw or instance._state.adding or hasattr(instance, "_stored_geometrie"):
+        return
+
+    # the stored geometry is only unknown if it was not loaded (e.g. deferred)
+    instance._stored_geometrie = (
+        Verzoek.objects.filter(pk=instance.pk)
+        .values_list("geometrie", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Verzoek)
+def invalidate_tiles_on_save(
+    sender, instance: Verzoek, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        return
+
+    # the tiles of the previous geometry also have to be invalidated
+    geometries = [instance.geometrie, getattr(instance, "_stored_geometrie", None)]
+    if update_fields is None or "geometrie" in update_fields:
+        instance._stored_geometrie = instance.geometrie
+    transaction.on_commit(lambda: invalidate_tiles(geometries))
+
+
+@receiver(post_delete, sender=Verzoek)
+def invalidate_tiles_on_delete(sender, instance: Verzoek, **kwargs):
+    geometries = [instance.geometrie]
+    transaction.on_commit(lambda: invalidate_tiles(geometries))
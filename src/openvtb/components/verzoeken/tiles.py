@@ -0,0 +1,211 @@
+"""
+Mapbox Vector Tiles (MVT) of the geometries of verzoeken.
+
+Tiles are rendered by PostGIS with ``ST_AsMVT`` and cached per tile. Every tile has
+a version in the cache, which is replaced when a verzoek with a geometry in that
+tile is saved or deleted, so the stale tile is no longer used.
+
+``QuerySet.update()`` and ``bulk_create()`` do not send the signals that invalidate
+the tiles. Call ``invalidate_tiles`` with the changed geometries after them, or
+``invalidate_all_tiles`` when these are not known.
+"""
+
+import hashlib
+import math
+import uuid
+from collections.abc import Iterable, Iterator
+
+from django.conf import settings
+from django.contrib.gis.geos import GEOSGeometry, Polygon
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import QuerySet
+
+import structlog
+
+from .models import Verzoek, VerzoekType
+
+logger = structlog.stdlib.get_logger(__name__)
+
+MVT_CONTENT_TYPE = "application/vnd.mapbox-vector-tile"
+MVT_LAYER_NAME = "verzoeken"
+MAX_ZOOM = 24
+
+# above this number of tiles per zoom level, all tiles of the zoom level are
+# invalidated at once, to bound the work done when saving large geometries
+MAX_INVALIDATED_TILES_PER_ZOOM = 16
+
+TILE_SQL = """
+SELECT ST_AsMVT(tile, %s)
+FROM (
+    SELECT
+        ST_AsMVTGeom(
+            ST_Transform(verzoek.geometrie, 3857), ST_TileEnvelope(%s, %s, %s)
+        ) AS geom,
+        verzoek.uuid::text AS uuid,
+        verzoek_type.uuid::text AS verzoek_type,
+        verzoek.verwerk_status
+    FROM {verzoek_table} AS verzoek
+    INNER JOIN {verzoek_type_table} AS verzoek_type
+        ON verzoek_type.id = verzoek.verzoek_type_id
+    WHERE verzoek.id IN ({queryset})
+) AS tile
+WHERE tile.geom IS NOT NULL
+"""
+
+
+def tile_exists(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2**z and 0 <= y < 2**z
+
+
+def tile_bounds(z: int, x: int, y: int) -> Polygon:
+    """
+    Return the bounds of a (Web Mercator) tile in WGS 84 coordinates.
+    """
+    n = 2**z
+
+    def lat(tile_y):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    bounds = Polygon.from_bbox(
+        (x / n * 360 - 180, lat(y + 1), (x + 1) / n * 360 - 180, lat(y))
+    )
+    bounds.srid = 4326
+    return bounds
+
+
+def tiles_for_extent(extent: tuple[float, float, float, float], z: int):
+    """
+    Return the ranges of the x and y tile coordinates covering a WGS 84 extent.
+    """
+    n = 2**z
+    min_lon, min_lat, max_lon, max_lat = extent
+
+    def tile_x(lon):
+        return min(max(int((lon + 180) / 360 * n), 0), n - 1)
+
+    def tile_y(lat):
+        # clip to the latitudes covered by Web Mercator
+        lat = math.radians(min(max(lat, -85.0511), 85.0511))
+        y = (1 - math.asinh(math.tan(lat)) / math.pi) / 2 * n
+        return min(max(int(y), 0), n - 1)
+
+    return (
+        range(tile_x(min_lon), tile_x(max_lon) + 1),
+        range(tile_y(max_lat), tile_y(min_lat) + 1),
+    )
+
+
+def _zoom_version_key(z: int) -> str:
+    return f"verzoeken:tiles:version:{z}"
+
+
+def _tile_version_key(z: int, x: int, y: int) -> str:
+    return f"verzoeken:tiles:version:{z}/{x}/{y}"
+
+
+def get_tile_cache_key(z: int, x: int, y: int, filters: dict[str, str]) -> str:
+    """
+    Return the cache key of a tile, which changes when the tile is invalidated.
+    """
+    versions = cache.get_many([_zoom_version_key(z), _tile_version_key(z, x, y)])
+    filters_hash = hashlib.sha256(
+        "&".join(f"{key}={value}" for key, value in sorted(filters.items())).encode()
+    ).hexdigest()
+    return ":".join(
+        [
+            f"verzoeken:tiles:{z}/{x}/{y}",
+            str(versions.get(_zoom_version_key(z), 0)),
+            str(versions.get(_tile_version_key(z, x, y), 0)),
+            filters_hash,
+        ]
+    )
+
+
+def _tiles_for_extents(extents, z: int) -> set[tuple[int, int]] | None:
+    tiles = set()
+    for extent in extents:
+        xs, ys = tiles_for_extent(extent, z)
+        if len(tiles) + len(xs) * len(ys) > MAX_INVALIDATED_TILES_PER_ZOOM:
+            return None
+        tiles.update((x, y) for x in xs for y in ys)
+    return tiles
+
+
+def _version_keys(geometries: Iterable[GEOSGeometry | None]) -> Iterator[str]:
+    extents = [geometry.extent for geometry in geometries if geometry]
+    if not extents:
+        return
+
+    for z in range(settings.VERZOEKEN_TILE_CACHE_MAX_ZOOM + 1):
+        tiles = _tiles_for_extents(extents, z)
+        if tiles is None:
+            yield _zoom_version_key(z)
+        else:
+            yield from (_tile_version_key(z, x, y) for x, y in tiles)
+
+
+def _replace_versions(keys: Iterable[str]) -> None:
+    # a new random version instead of an increment, so all keys are replaced in a
+    # single round trip without reading them first
+    versions = dict.fromkeys(keys, uuid.uuid4().hex)
+    if versions:
+        cache.set_many(versions, timeout=None)
+
+
+def invalidate_tiles(geometries: Iterable[GEOSGeometry | None]) -> None:
+    """
+    Invalidate the cached tiles that contain any of the geometries.
+    """
+    _replace_versions(_version_keys(geometries))
+
+
+def invalidate_all_tiles() -> None:
+    """
+    Invalidate all cached tiles.
+    """
+    _replace_versions(
+        _zoom_version_key(z) for z in range(settings.VERZOEKEN_TILE_CACHE_MAX_ZOOM + 1)
+    )
+
+
+def render_tile(queryset: QuerySet, z: int, x: int, y: int) -> bytes:
+    """
+    Render the geometries of the verzoeken in the queryset that are in a tile.
+    """
+    queryset = (
+        queryset.filter(geometrie__bboverlaps=tile_bounds(z, x, y))
+        .order_by()
+        .values("pk")
+    )
+    sql, params = queryset.query.sql_with_params()
+    tile_sql = TILE_SQL.format(
+        verzoek_table=connection.ops.quote_name(Verzoek._meta.db_table),
+        verzoek_type_table=connection.ops.quote_name(VerzoekType._meta.db_table),
+        queryset=sql,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(tile_sql, [MVT_LAYER_NAME, z, x, y, *params])
+        (tile,) = cursor.fetchone()
+
+    return bytes(tile) if tile else b""
+
+
+def get_tile(
+    queryset: QuerySet, z: int, x: int, y: int, filters: dict[str, str]
+) -> bytes:
+    """
+    Return the rendered tile from the cache, or render and cache it.
+    """
+    if z > settings.VERZOEKEN_TILE_CACHE_MAX_ZOOM:
+        return render_tile(queryset, z, x, y)
+
+    cache_key = get_tile_cache_key(z, x, y, filters)
+    tile = cache.get(cache_key)
+    if tile is None:
+        tile = render_tile(queryset, z, x, y)
+        cache.set(cache_key, tile, timeout=settings.VERZOEKEN_TILE_CACHE_TIMEOUT)
+    else:
+        logger.debug("verzoeken_tile_cache_hit", z=z, x=x, y=y)
+    return tile
@@ -1,6 +1,9 @@
+import copy
 import os
 
 os.environ["_USE_STRUCTLOG"] = "True"
+from django.core.exceptions import ImproperlyConfigured
+
 from celery.schedules import crontab
 from maykin_common.config import (
     DocumentationParams,
@@ -28,6 +31,7 @@ INSTALLED_APPS = INSTALLED_APPS + [
     # Project applications.
     "openvtb.accounts",
     "openvtb.utils",
+    "openvtb.cloudevents",
     "openvtb.components.taken",
     "openvtb.components.verzoeken",
     "openvtb.components.berichten",
@@ -35,7 +39,12 @@ INSTALLED_APPS = INSTALLED_APPS + [
     "localflavor",
 ]
 
-MIDDLEWARE += ["openvtb.utils.middleware.APIVersionHeaderMiddleware"]
+MIDDLEWARE += [
+    "openvtb.utils.middleware.APIVersionHeaderMiddleware",
+    "openvtb.utils.middleware.ReplicaRoutingMiddleware",
+    # must be last, to only limit the queries of the views
+    "openvtb.utils.middleware.QueryBudgetMiddleware",
+]
 
 #
 # SECURITY settings
@@ -76,6 +85,168 @@ ADMIN_INDEX_DISPLAY_DROP_DOWN_MENU_CONDITION_FUNCTION = (
 #
 DATABASES["default"]["ENGINE"] = "django.contrib.gis.db.backends.postgis"
 
+#
+# Connection pool, per process type
+#
+DB_POOL_ROLE = config(
+    "DB_POOL_ROLE",
+    default="web",
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "The type of the process: ``web``, ``worker`` or ``beat``. The connection pool of the process "
+            "is configured with the ``DB_POOL_<ROLE>_*`` variables of its type. Set by the start scripts "
+            "of the containers."
+        ),
+    ),
+)
+DB_POOL_ROLES = {}
+for role in ("web", "worker", "beat"):
+    DB_POOL_ROLES[role] = {
+        "min_size": config(
+            f"DB_POOL_{role.upper()}_MIN_SIZE",
+            default=str(DB_POOL_MIN_SIZE),
+            cast=int,
+            documentation=DocumentationParams(
+                group="Database",
+                help_text=f"The minimum size of the connection pool of a ``{role}`` process. Defaults to ``DB_POOL_MIN_SIZE``.",
+                auto_display_default=False,
+            ),
+        ),
+        "max_size": config(
+            f"DB_POOL_{role.upper()}_MAX_SIZE",
+            default=str(DB_POOL_MAX_SIZE),
+            cast=lambda x: int(x) if x != "None" else None,
+            documentation=DocumentationParams(
+                group="Database",
+                help_text=f"The maximum size of the connection pool of a ``{role}`` process. Defaults to ``DB_POOL_MAX_SIZE``.",
+                auto_display_default=False,
+            ),
+        ),
+        "timeout": config(
+            f"DB_POOL_{role.upper()}_TIMEOUT",
+            default=str(DB_POOL_TIMEOUT),
+            cast=int,
+            documentation=DocumentationParams(
+                group="Database",
+                help_text=(
+                    f"The maximum time in seconds that a ``{role}`` process waits for a connection from the pool. "
+                    "Defaults to ``DB_POOL_TIMEOUT``."
+                ),
+                auto_display_default=False,
+            ),
+        ),
+        "max_lifetime": config(
+            f"DB_POOL_{role.upper()}_MAX_LIFETIME",
+            default=str(DB_POOL_MAX_LIFETIME),
+            cast=int,
+            documentation=DocumentationParams(
+                group="Database",
+                help_text=(
+                    f"The maximum lifetime in seconds of a connection in the pool of a ``{role}`` process. "
+                    "Defaults to ``DB_POOL_MAX_LIFETIME``."
+                ),
+                auto_display_default=False,
+            ),
+        ),
+    }
+
+if DB_POOL_ROLE not in DB_POOL_ROLES:
+    raise ImproperlyConfigured(
+        f"DB_POOL_ROLE must be one of {', '.join(DB_POOL_ROLES)}, not {DB_POOL_ROLE!r}."
+    )
+
+if DB_POOL_ENABLED:
+    DATABASES["default"]["OPTIONS"]["pool"].update(DB_POOL_ROLES[DB_POOL_ROLE])
+
+#
+# Prepared statements
+#
+DB_SERVER_SIDE_BINDING = config(
+    "DB_SERVER_SIDE_BINDING",
+    default=False,
+    cast=bool,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "If ``True``, the query parameters are bound by the database server instead of by psycopg, so queries "
+            "which are executed ``DB_PREPARE_THRESHOLD`` times on a connection are prepared and reused. "
+            "This is most effective with connection pooling, because the prepared statements live as long as "
+            "the connection. Do not enable this behind PgBouncer in transaction mode."
+        ),
+    ),
+)
+DB_PREPARE_THRESHOLD = config(
+    "DB_PREPARE_THRESHOLD",
+    default=5,
+    cast=int,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "Number of times a query is executed on a connection before it is prepared, "
+            "if ``DB_SERVER_SIDE_BINDING`` is ``True``."
+        ),
+    ),
+)
+
+if DB_SERVER_SIDE_BINDING:
+    DATABASES["default"].setdefault("OPTIONS", {}).update(
+        {
+            "server_side_binding": True,
+            "prepare_threshold": DB_PREPARE_THRESHOLD,
+        }
+    )
+
+#
+# Read replicas
+#
+DB_REPLICA_HOSTS = config(
+    "DB_REPLICA_HOSTS",
+    default="",
+    split=True,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "Comma-separated list of ``host`` or ``host:port`` of read replicas of the database. "
+            "Read-only API requests are served from a replica, unless the client made a write in the last "
+            "``DB_REPLICA_STICKY_SECONDS`` seconds or the replica lags more than ``DB_REPLICA_MAX_LAG`` seconds."
+        ),
+    ),
+)
+DB_REPLICA_MAX_LAG = config(
+    "DB_REPLICA_MAX_LAG",
+    default=5.0,
+    cast=float,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text="Maximum replication lag, in seconds, of a read replica. Lagging replicas are not used.",
+    ),
+)
+DB_REPLICA_STICKY_SECONDS = config(
+    "DB_REPLICA_STICKY_SECONDS",
+    default=10,
+    cast=int,
+    documentation=DocumentationParams(
+        group="Database",
+        help_text=(
+            "Number of seconds after a write during which the requests with the same ``Authorization`` header "
+            "are served from the primary database, so a client reads its own writes."
+        ),
+    ),
+)
+
+for index, host in enumerate(DB_REPLICA_HOSTS):
+    replica_host, _, replica_port = host.partition(":")
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "HOST": replica_host,
+        "PORT": int(replica_port) if replica_port else DATABASES["default"]["PORT"],
+        "OPTIONS": copy.deepcopy(DATABASES["default"].get("OPTIONS", {})),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["openvtb.utils.db_routing.ReplicaRouter"]
+
 #
 # Geospatial libraries
 #
@@ -200,6 +371,19 @@ EVENTS_TAKEN_JOB_HOUR = config(
     ),
 )
 
+EVENTS_DUE_JOB_INTERVAL = config(
+    "EVENTS_DUE_JOB_INTERVAL",
+    default=30,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text=(
+            "Interval in seconds for the job which sends the planned Taken and Berichten CloudEvents "
+            "once they are due. Each run only reads the events that are due, so it can run frequently. "
+            "The hourly jobs remain as a safety net for events that were not planned."
+        ),
+    ),
+)
+
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 CELERY_BEAT_SCHEDULE = {
     "send-berichten-events": {
@@ -216,6 +400,19 @@ CELERY_BEAT_SCHEDULE = {
             hour=f"*/{EVENTS_TAKEN_JOB_HOUR}",
         ),
     },
+    "send-due-berichten-events": {
+        "task": "openvtb.components.berichten.tasks.send_due_berichten_events",
+        "schedule": EVENTS_DUE_JOB_INTERVAL,
+    },
+    "send-due-taken-events": {
+        "task": "openvtb.components.taken.tasks.send_due_taak_events",
+        "schedule": EVENTS_DUE_JOB_INTERVAL,
+    },
+    # sends the buffered CloudEvents which were not sent after the linger time
+    "send-cloudevent-batches": {
+        "task": "openvtb.cloudevents.tasks.send_cloudevent_batches",
+        "schedule": 60,
+    },
 }
 
 ####################
@@ -235,6 +432,105 @@ ENABLE_CLOUD_EVENTS = config(
         help_text="Indicates whether or not cloud events should be sent to the configured endpoint for specific operations via the API",
     ),
 )
+CLOUDEVENTS_BATCH_SIZE = config(
+    "CLOUDEVENTS_BATCH_SIZE",
+    default=0,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum number of cloud events sent in one request, using the batched content mode "
+            "(``application/cloudevents-batch+json``). If ``0`` or ``1``, every cloud event is sent in a "
+            "separate request. If the receiver does not support batches, the events are sent one by one."
+        ),
+    ),
+)
+CLOUDEVENTS_BATCH_LINGER = config(
+    "CLOUDEVENTS_BATCH_LINGER",
+    default=1.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Number of seconds a cloud event is held back to be sent in a batch with other cloud events, "
+            "if ``CLOUDEVENTS_BATCH_SIZE`` is larger than ``1``."
+        ),
+    ),
+)
+CLOUDEVENTS_DELIVERY_WORKER = config(
+    "CLOUDEVENTS_DELIVERY_WORKER",
+    default=False,
+    cast=bool,
+    documentation=DocumentationParams(
+        help_text=(
+            "If ``True``, cloud events are sent by the delivery worker (``manage.py deliver_cloudevents``), "
+            "which sends them concurrently over pooled connections, instead of by a Celery task per event."
+        ),
+    ),
+)
+CLOUDEVENTS_DELIVERY_CONCURRENCY = config(
+    "CLOUDEVENTS_DELIVERY_CONCURRENCY",
+    default=10,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text="Maximum number of concurrent requests of the delivery worker to the receiver of the cloud events.",
+    ),
+)
+CLOUDEVENTS_DELIVERY_RATE_LIMIT = config(
+    "CLOUDEVENTS_DELIVERY_RATE_LIMIT",
+    default=0.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum number of requests per second of the delivery worker to the receiver of the cloud events. "
+            "If ``0``, the number of requests is not limited."
+        ),
+    ),
+)
+CLOUDEVENTS_DELIVERY_TIMEOUT = config(
+    "CLOUDEVENTS_DELIVERY_TIMEOUT",
+    default=10.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text="Timeout in seconds of the requests of the delivery worker.",
+    ),
+)
+CLOUDEVENTS_DELIVERY_MAX_ATTEMPTS = config(
+    "CLOUDEVENTS_DELIVERY_MAX_ATTEMPTS",
+    default=5,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text="Number of attempts of the delivery worker to send a cloud event, before it gives up.",
+    ),
+)
+CLOUDEVENTS_CIRCUIT_BREAKER_THRESHOLD = config(
+    "CLOUDEVENTS_CIRCUIT_BREAKER_THRESHOLD",
+    default=5,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text=(
+            "Number of consecutive failed requests after which the delivery worker stops sending cloud events "
+            "to the receiver for ``CLOUDEVENTS_CIRCUIT_BREAKER_COOLDOWN`` seconds."
+        ),
+    ),
+)
+CLOUDEVENTS_CIRCUIT_BREAKER_COOLDOWN = config(
+    "CLOUDEVENTS_CIRCUIT_BREAKER_COOLDOWN",
+    default=30.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text="Number of seconds the delivery worker waits before it retries a failing receiver.",
+    ),
+)
+CLOUDEVENTS_REPLAY_RATE = config(
+    "CLOUDEVENTS_REPLAY_RATE",
+    default=10.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum number of failed cloud events per second that are sent again when the dead letters "
+            "are replayed, so a receiver which just recovered is not flooded."
+        ),
+    ),
+)
 
 #
 # URN settings
@@ -256,3 +552,176 @@ TAKEN_DEFAULT_REMINDER_IN_DAYS = config(
         ),
     ),
 )
+TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION = config(
+    "TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION",
+    default=False,
+    cast=bool,
+    documentation=DocumentationParams(
+        help_text=(
+            "If ``True``, the ``formulierDefinitie`` of a formuliertaak is stored once per distinct definition "
+            "and referenced from the taak, instead of being stored in the ``details`` of every taak. "
+            "The API representation of the taken does not change."
+        ),
+    ),
+)
+TAKEN_ONTVANGEN_GEGEVENS_REJECT_UNKNOWN_KEYS = config(
+    "TAKEN_ONTVANGEN_GEGEVENS_REJECT_UNKNOWN_KEYS",
+    default=False,
+    cast=bool,
+    documentation=DocumentationParams(
+        help_text=(
+            "If ``True``, the ``ontvangenGegevens`` of a formuliertaak may only contain the keys of the "
+            "components in its ``formulierDefinitie``. The values of known keys are always validated."
+        ),
+    ),
+)
+BERICHTEN_ARCHIVE_AFTER_DAYS = config(
+    "BERICHTEN_ARCHIVE_AFTER_DAYS",
+    default=90,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text=(
+            "Number of days after their publication that berichten are moved to the archive "
+            "by ``manage.py archive_berichten``. The archived berichten remain available in the API."
+        ),
+    ),
+)
+
+#
+# JSON schema validation
+#
+JSON_SCHEMA_COLLECT_ALL_ERRORS = config(
+    "JSON_SCHEMA_COLLECT_ALL_ERRORS",
+    default=False,
+    cast=bool,
+    documentation=DocumentationParams(
+        help_text=(
+            "If ``True``, all JSON schema errors of a payload (for example the ``details`` of a taak "
+            "or the ``aanvraagGegevens`` of a verzoek) are returned in one response, instead of only the first one."
+        ),
+    ),
+)
+JSON_SCHEMA_ERROR_LOG_SAMPLE_RATE = config(
+    "JSON_SCHEMA_ERROR_LOG_SAMPLE_RATE",
+    default=1.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Fraction (between ``0`` and ``1``) of the JSON schema validation failures that is logged. "
+            "Lower this value to limit the logging overhead when clients send many invalid payloads."
+        ),
+    ),
+)
+
+#
+# API query limits
+#
+API_STATEMENT_TIMEOUT_LIST = config(
+    "API_STATEMENT_TIMEOUT_LIST",
+    default=5.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum duration in seconds of a single database query of an API list request. "
+            "A request with a slower query is cancelled with a ``503`` response. If ``0``, there is no limit."
+        ),
+    ),
+)
+API_STATEMENT_TIMEOUT_DETAIL = config(
+    "API_STATEMENT_TIMEOUT_DETAIL",
+    default=2.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum duration in seconds of a single database query of the other API requests, "
+            "e.g. to read a single resource. If ``0``, there is no limit."
+        ),
+    ),
+)
+API_STATEMENT_TIMEOUT_WRITE = config(
+    "API_STATEMENT_TIMEOUT_WRITE",
+    default=5.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum duration in seconds of a single database query of an API request which creates, "
+            "updates or deletes a resource. If ``0``, there is no limit."
+        ),
+    ),
+)
+API_STATEMENT_TIMEOUT_EXPORT = config(
+    "API_STATEMENT_TIMEOUT_EXPORT",
+    default=30.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum duration in seconds of a single database query of the API requests which export "
+            "many resources at once, like the vector tiles of the verzoeken. If ``0``, there is no limit."
+        ),
+    ),
+)
+API_STATEMENT_TIMEOUTS = {
+    "list": API_STATEMENT_TIMEOUT_LIST,
+    "detail": API_STATEMENT_TIMEOUT_DETAIL,
+    "write": API_STATEMENT_TIMEOUT_WRITE,
+    "export": API_STATEMENT_TIMEOUT_EXPORT,
+}
+API_QUERY_BUDGET_COUNT = config(
+    "API_QUERY_BUDGET_COUNT",
+    default=50,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text=(
+            "Number of database queries an API request can make before it is logged as exceeding its budget. "
+            "If ``0``, the number of queries is not checked."
+        ),
+    ),
+)
+API_QUERY_BUDGET_DURATION = config(
+    "API_QUERY_BUDGET_DURATION",
+    default=1.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Total duration in seconds of the database queries of an API request before it is logged as "
+            "exceeding its budget. If ``0``, the duration is not checked."
+        ),
+    ),
+)
+API_QUERY_BUDGET_STRICT = config(
+    "API_QUERY_BUDGET_STRICT",
+    default=False,
+    cast=bool,
+    documentation=DocumentationParams(
+        help_text=(
+            "If ``True``, an API request which exceeds its query budget is stopped with a ``503`` response, "
+            "instead of only being logged."
+        ),
+    ),
+)
+
+#
+# Verzoeken vector tiles
+#
+VERZOEKEN_TILE_CACHE_TIMEOUT = config(
+    "VERZOEKEN_TILE_CACHE_TIMEOUT",
+    default=60 * 60,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text=(
+            "Number of seconds a rendered vector tile of the verzoeken is cached. "
+            "Cached tiles are invalidated when a verzoek in the tile is changed."
+        ),
+    ),
+)
+VERZOEKEN_TILE_CACHE_MAX_ZOOM = config(
+    "VERZOEKEN_TILE_CACHE_MAX_ZOOM",
+    default=16,
+    cast=int,
+    documentation=DocumentationParams(
+        help_text=(
+            "Highest zoom level for which vector tiles of the verzoeken are cached. "
+            "Tiles with a higher zoom level are rendered on every request."
+        ),
+    ),
+)
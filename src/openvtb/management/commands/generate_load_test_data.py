@@ -0,0 +1,432 @@
+import itertools
+import math
+import random
+import uuid
+from datetime import date, datetime, timedelta
+from functools import cached_property
+
+from django.conf import settings
+from django.contrib.gis.geos import LineString, Point, Polygon
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from openvtb.components.berichten.models import Bericht, GeplandePublicatie
+from openvtb.components.constants import HandelingsPerspectiefEnum
+from openvtb.components.taken.constants import SoortTaak, StatusTaak
+from openvtb.components.taken.models import (
+    ExterneTaak,
+    FormulierDefinitie,
+    GeplandTaakEvent,
+)
+from openvtb.components.taken.scheduling import get_due_datetime, get_due_events
+from openvtb.components.verzoeken.constants import (
+    VerwerkStatus,
+    VerzoekTypeVersionStatus,
+)
+from openvtb.components.verzoeken.models import (
+    Bijlage,
+    Verzoek,
+    VerzoekType,
+    VerzoekTypeVersion,
+)
+from openvtb.components.verzoeken.tiles import invalidate_all_tiles
+
+LOAD_TEST_VERZOEKTYPE = "load-test"
+ONTVANGER_URN = "urn:nld:brp:bsn:{:09d}"
+
+# (value, weight) pairs, roughly matching the production distribution
+TAAK_SOORTEN = (
+    (SoortTaak.FORMULIERTAAK, 60),
+    (SoortTaak.BETAALTAAK, 25),
+    (SoortTaak.URLTAAK, 15),
+)
+TAAK_STATUSSEN = (
+    (StatusTaak.VERWERKT, 55),
+    (StatusTaak.OPEN, 20),
+    (StatusTaak.NIET_UITGEVOERD, 10),
+    (StatusTaak.UITGEVOERD, 10),
+    (StatusTaak.AFGEBROKEN, 5),
+)
+GEOMETRIE_TYPEN = (
+    ("point", 70),
+    ("polygon", 25),
+    ("linestring", 5),
+)
+
+AANVRAAG_GEGEVENS_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "Load test",
+    "type": "object",
+    "properties": {
+        "omschrijving": {"type": "string"},
+        "adres": {"type": "object"},
+        "regels": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "volgnummer": {"type": "integer"},
+                    "code": {"type": "string"},
+                    "toelichting": {"type": "string"},
+                },
+                "required": ["volgnummer", "code"],
+            },
+        },
+    },
+    "required": ["omschrijving", "regels"],
+}
+
+
+def weighted(choices: tuple[tuple[str, int], ...]) -> tuple[list[str], list[int]]:
+    values, weights = zip(*choices, strict=True)
+    return list(values), list(itertools.accumulate(weights))
+
+
+def formulier_definitie(number_of_components: int) -> dict:
+    components = [
+        {
+            "label": f"Veld {index}",
+            "key": f"veld{index}",
+            "type": ("textfield", "number", "date", "select")[index % 4],
+            "input": True,
+            "tableView": True,
+        }
+        for index in range(number_of_components)
+    ]
+    components.append({"type": "button", "label": "Submit", "key": "submit"})
+    return {"display": "form", "components": components}
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate large synthetic datasets (taken, verzoeken and berichten) with "
+        "realistic distributions, intended for load and performance testing. "
+        "Do NOT run this against a production database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--taken",
+            type=int,
+            default=1_000_000,
+            help="Number of ExterneTaak records to create.",
+        )
+        parser.add_argument(
+            "--verzoeken",
+            type=int,
+            default=100_000,
+            help="Number of Verzoek records to create.",
+        )
+        parser.add_argument(
+            "--berichten",
+            type=int,
+            default=1_000_000,
+            help="Number of Bericht records to create.",
+        )
+        parser.add_argument(
+            "--ontvangers",
+            type=int,
+            default=50_000,
+            help=(
+                "Number of distinct ontvangers/initiators. URNs are generated as "
+                f"'{ONTVANGER_URN.format(0)}' and onwards, so load test scenarios "
+                "can pick existing ones."
+            ),
+        )
+        parser.add_argument(
+            "--aanvraag-gegevens-size",
+            type=int,
+            default=200,
+            help="Number of 'regels' in the aanvraagGegevens of every verzoek.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5_000,
+            help="Number of records created per bulk insert.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Seed for the random generator, for reproducible datasets.",
+        )
+
+    def handle(self, **options):
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.today = date.today()
+        # skewed distribution: a few ontvangers have many taken/berichten
+        self.ontvanger_weights = list(
+            itertools.accumulate(
+                1 / (index + 1) for index in range(options["ontvangers"])
+            )
+        )
+        self.ontvangers = [
+            ONTVANGER_URN.format(index) for index in range(options["ontvangers"])
+        ]
+        self.geometrie_typen, self.geometrie_weights = weighted(GEOMETRIE_TYPEN)
+
+        # bulk_create skips the post_save signals, so the planned events and
+        # publications are created with the records
+        self.generate(
+            "taken",
+            options["taken"],
+            self.build_externe_taken,
+            ExterneTaak,
+            after_insert=self.plan_taak_events,
+        )
+        self.generate(
+            "verzoeken",
+            options["verzoeken"],
+            lambda size: self.build_verzoeken(size, options["aanvraag_gegevens_size"]),
+            Verzoek,
+            after_insert=self.create_bijlagen,
+        )
+        # bulk_create also skips the signals that invalidate the cached vector tiles
+        invalidate_all_tiles()
+        self.generate(
+            "berichten",
+            options["berichten"],
+            self.build_berichten,
+            Bericht,
+            after_insert=self.plan_publicaties,
+        )
+
+    def generate(self, name, total, build_batch, model, after_insert=None):
+        created = 0
+        while created < total:
+            size = min(self.batch_size, total - created)
+            with transaction.atomic():
+                objs = model.objects.bulk_create(build_batch(size))
+                if after_insert:
+                    after_insert(objs)
+            created += size
+            self.stdout.write(f"{name}: {created}/{total}")
+
+        self.stdout.write(self.style.SUCCESS(f"Created {total} {name}"))
+
+    def pick_ontvanger(self) -> str:
+        return self.random.choices(self.ontvangers, cum_weights=self.ontvanger_weights)[
+            0
+        ]
+
+    def is_gerelateerd_aan(self) -> list[dict]:
+        return [
+            {
+                "urn": f"urn:nld:gemeenteutrecht:zaak:zaaknummer:{self.random.randint(0, 999_999):06d}"
+            }
+            for _ in range(self.random.choices((0, 1, 2), weights=(30, 60, 10))[0])
+        ]
+
+    def taak_details(self, taak_soort: str) -> dict:
+        match taak_soort:
+            case SoortTaak.BETAALTAAK:
+                return {
+                    "bedrag": f"{self.random.uniform(1, 2500):.2f}",
+                    "valuta": "EUR",
+                    "transactieomschrijving": "Leges",
+                    "doelrekening": {
+                        "naam": "Gemeente",
+                        "iban": "NL12BANK34567890",
+                    },
+                }
+            case SoortTaak.URLTAAK:
+                return {
+                    "uitvraagLink": f"https://example.com/uitvraag/{uuid.uuid4()}",
+                    "voorinvullenGegevens": {"naam": "Jan"},
+                }
+            case _:
+                details = {
+                    "voorinvullenGegevens": {"veld0": "Test"},
+                    "ontvangenGegevens": {},
+                }
+                # like ``ExterneTaak.save``, the shared definition is stored once
+                if not settings.TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION:
+                    details["formulierDefinitie"] = self.formulier_definitie
+                return details
+
+    @cached_property
+    def formulier_definitie(self) -> dict:
+        return formulier_definitie(25)
+
+    @cached_property
+    def shared_formulier_definitie(self) -> FormulierDefinitie:
+        definitie, _ = FormulierDefinitie.objects.get_or_create(
+            hash=FormulierDefinitie.get_hash(self.formulier_definitie),
+            defaults={"definitie": self.formulier_definitie},
+        )
+        return definitie
+
+    def build_externe_taken(self, size: int) -> list[ExterneTaak]:
+        soorten, soorten_weights = weighted(TAAK_SOORTEN)
+        statussen, statussen_weights = weighted(TAAK_STATUSSEN)
+
+        taken = []
+        for _ in range(size):
+            taak_soort = self.random.choices(soorten, cum_weights=soorten_weights)[0]
+            status = self.random.choices(statussen, cum_weights=statussen_weights)[0]
+            startdatum = self.today - timedelta(days=self.random.randint(0, 730))
+            einddatum = startdatum + timedelta(days=self.random.randint(7, 60))
+            datum_herinnering = einddatum - timedelta(
+                days=settings.TAKEN_DEFAULT_REMINDER_IN_DAYS
+            )
+            taken.append(
+                ExterneTaak(
+                    titel=f"Taak {taak_soort}",
+                    status=status,
+                    taak_soort=taak_soort,
+                    startdatum=startdatum,
+                    einddatum_handelings_termijn=einddatum,
+                    datum_herinnering=datum_herinnering,
+                    is_herinnering_verzonden=datum_herinnering < self.today,
+                    is_handelings_termijn_verzonden=einddatum < self.today,
+                    handelings_perspectief=HandelingsPerspectiefEnum.INFORMATIE_GEVEN,
+                    is_toegewezen_aan=self.pick_ontvanger(),
+                    is_gerelateerd_aan=self.is_gerelateerd_aan(),
+                    details=self.taak_details(taak_soort),
+                    formulier_definitie=(
+                        self.shared_formulier_definitie
+                        if settings.TAKEN_FORMULIER_DEFINITIE_DEDUPLICATION
+                        and taak_soort == SoortTaak.FORMULIERTAAK
+                        else None
+                    ),
+                )
+            )
+        return taken
+
+    def plan_taak_events(self, taken: list[ExterneTaak]) -> None:
+        GeplandTaakEvent.objects.bulk_create(
+            GeplandTaakEvent(taak=taak, soort=soort, gepland_op=get_due_datetime(due))
+            for taak in taken
+            for soort, due in get_due_events(taak).items()
+        )
+
+    @cached_property
+    def verzoek_type_version(self) -> VerzoekTypeVersion:
+        verzoek_type, _ = VerzoekType.objects.get_or_create(naam=LOAD_TEST_VERZOEKTYPE)
+        version, _ = VerzoekTypeVersion.objects.get_or_create(
+            verzoek_type=verzoek_type,
+            versie=1,
+            defaults={
+                "aanvraag_gegevens_schema": AANVRAAG_GEGEVENS_SCHEMA,
+                "status": VerzoekTypeVersionStatus.PUBLISHED,
+            },
+        )
+        return version
+
+    def geometrie(self):
+        kind = self.random.choices(
+            self.geometrie_typen, cum_weights=self.geometrie_weights
+        )[0]
+        x, y = self.random.uniform(4.0, 7.0), self.random.uniform(51.0, 53.3)
+        match kind:
+            case "point":
+                return Point(x, y, srid=4326)
+            case "linestring":
+                # route-like line with many vertices
+                return LineString(
+                    [(x + step * 0.001, y + step * 0.0005) for step in range(100)],
+                    srid=4326,
+                )
+            case _:
+                # parcel-like polygon with many vertices
+                ring = [
+                    (
+                        x + 0.002 * math.cos(2 * math.pi * step / 64),
+                        y + 0.001 * math.sin(2 * math.pi * step / 64),
+                    )
+                    for step in range(64)
+                ]
+                return Polygon([*ring, ring[0]], srid=4326)
+
+    def aanvraag_gegevens(self, size: int) -> dict:
+        return {
+            "omschrijving": "Melding openbare ruimte",
+            "adres": {
+                "woonplaats": "Utrecht",
+                "postcode": "3511 AB",
+                "huisnummer": str(self.random.randint(1, 300)),
+            },
+            "regels": [
+                {
+                    "volgnummer": index,
+                    "code": f"CODE-{self.random.randint(0, 9999):04d}",
+                    "toelichting": "Lorem ipsum dolor sit amet " * 3,
+                }
+                for index in range(size)
+            ],
+        }
+
+    def build_verzoeken(self, size: int, aanvraag_gegevens_size: int) -> list[Verzoek]:
+        version = self.verzoek_type_version
+        return [
+            Verzoek(
+                verzoek_type=version.verzoek_type,
+                versie=version.versie,
+                geometrie=self.geometrie(),
+                aanvraag_gegevens=self.aanvraag_gegevens(aanvraag_gegevens_size),
+                initiator=self.pick_ontvanger(),
+                is_gerelateerd_aan=self.is_gerelateerd_aan(),
+                kanaal="webformulier",
+                verwerk_status=self.random.choices(
+                    (VerwerkStatus.VERWERKT, VerwerkStatus.GEREGISTREERD),
+                    weights=(80, 20),
+                )[0],
+            )
+            for _ in range(size)
+        ]
+
+    def create_bijlagen(self, verzoeken: list[Verzoek]) -> None:
+        Bijlage.objects.bulk_create(
+            Bijlage(
+                verzoek=verzoek,
+                informatie_object=f"urn:nld:gemeenteutrecht:informatieobject:uuid:{uuid.uuid4()}",
+            )
+            for verzoek in verzoeken
+            for _ in range(self.random.choices((0, 1, 3), weights=(50, 35, 15))[0])
+        )
+
+    def build_berichten(self, size: int) -> list[Bericht]:
+        now = timezone.now()
+        berichten = []
+        for _ in range(size):
+            # ~5% of the berichten is scheduled to be published in the future
+            if self.random.random() < 0.05:
+                publicatiedatum = now + timedelta(
+                    minutes=self.random.randint(1, 10_080)
+                )
+            else:
+                publicatiedatum = now - timedelta(
+                    minutes=self.random.randint(0, 1_051_200)
+                )
+            is_gepubliceerd = publicatiedatum <= now
+            geopend_op: datetime | None = None
+            if is_gepubliceerd and self.random.random() < 0.6:
+                geopend_op = min(
+                    now, publicatiedatum + timedelta(hours=self.random.randint(1, 240))
+                )
+
+            berichten.append(
+                Bericht(
+                    onderwerp="Uw aanvraag",
+                    bericht_tekst="Lorem ipsum dolor sit amet. "
+                    * self.random.randint(1, 40),
+                    publicatiedatum=publicatiedatum,
+                    is_gepubliceerd=is_gepubliceerd,
+                    ontvanger=self.pick_ontvanger(),
+                    geopend_op=geopend_op,
+                    mijn_overheid_berichtenbox=self.random.random() < 0.3,
+                    is_gerelateerd_aan=self.is_gerelateerd_aan(),
+                    einddatum_handelings_termijn=publicatiedatum + timedelta(days=30),
+                )
+            )
+        return berichten
+
+    def plan_publicaties(self, berichten: list[Bericht]) -> None:
+        GeplandePublicatie.objects.bulk_create(
+            GeplandePublicatie(bericht=bericht, gepland_op=bericht.publicatiedatum)
+            for bericht in berichten
+            if not bericht.is_gepubliceerd and bericht.publicatiedatum
+        )
@@ -0,0 +1,82 @@
+"""
+Shared harness of the benchmarks, which compares the measured results with the
+results recorded in a ``benchmark_results.json`` next to the benchmarks.
+
+The benchmarks are skipped unless ``RUN_BENCHMARKS=1`` is set. A benchmark fails
+when it is more than ``BENCHMARK_TOLERANCE`` (default ``0.5``, i.e. 50%) worse
+than the recorded result, or when it has no recorded result. With
+``UPDATE_BENCHMARK_RESULTS=1`` the results are recorded instead.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+def _is_enabled(name: str) -> bool:
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+
+UPDATE_RESULTS = _is_enabled("UPDATE_BENCHMARK_RESULTS")
+RUN_BENCHMARKS = UPDATE_RESULTS or _is_enabled("RUN_BENCHMARKS")
+TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.5"))
+
+
+def load_results(benchmark_file: Path) -> dict[str, dict[str, float]]:
+    if not benchmark_file.exists():
+        return {}
+    return json.loads(benchmark_file.read_text())
+
+
+class BenchmarkMixin:
+    """
+    Collect the results of the benchmarks of a test case, and record them in
+    ``benchmark_file`` after the test case if ``UPDATE_BENCHMARK_RESULTS`` is set.
+    """
+
+    benchmark_file: Path
+    results: dict[str, dict[str, float]]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.results = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        if UPDATE_RESULTS and cls.results:
+            results = {**load_results(cls.benchmark_file), **cls.results}
+            cls.benchmark_file.write_text(
+                json.dumps(results, indent=4, sort_keys=True) + "\n"
+            )
+        super().tearDownClass()
+
+    def assertRecordedResult(
+        self,
+        name: str,
+        result: dict[str, float],
+        key: str,
+        higher_is_better: bool = False,
+    ) -> None:
+        """
+        Assert that ``result[key]`` is not worse than the recorded result of the
+        benchmark ``name``, within the tolerance.
+        """
+        self.results[name] = result
+        if UPDATE_RESULTS:
+            return
+
+        recorded = load_results(self.benchmark_file).get(name)
+        if recorded is None:
+            self.fail(
+                f"No recorded result for benchmark {name} in "
+                f"{self.benchmark_file.name}, record it with UPDATE_BENCHMARK_RESULTS=1"
+            )
+
+        message = f"Benchmark {name} regressed: {result} (recorded: {recorded})"
+        if higher_is_better:
+            self.assertGreaterEqual(
+                result[key], recorded[key] * (1 - TOLERANCE), message
+            )
+        else:
+            self.assertLessEqual(result[key], recorded[key] * (1 + TOLERANCE), message)
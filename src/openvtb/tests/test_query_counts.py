@@ -0,0 +1,213 @@
+"""
+Query-count regression tests for the API endpoints.
+
+Every list and detail endpoint is requested with a growing data set (page sizes
+1, 10 and 100). The number of queries on top of the "empty" response (an empty
+list or a 404 detail) must not depend on the number of returned objects, which
+guards against N+1 regressions in serializers and querysets.
+
+The measured numbers are compared with the baseline table in
+``query_count_baseline.json``. When a change intentionally alters the number of
+queries, regenerate the table with::
+
+    UPDATE_QUERY_COUNT_BASELINE=1 python src/manage.py test openvtb.tests.test_query_counts
+"""
+
+import json
+import os
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+from django.db import connection
+from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openvtb.components.berichten.tests.factories import BerichtFactory
+from openvtb.components.taken.tests.factories import ExterneTaakFactory
+from openvtb.components.verzoeken.tests.factories import (
+    VerzoekFactory,
+    VerzoekTypeFactory,
+    VerzoekTypeVersionFactory,
+)
+from openvtb.utils.api_testcase import APITestCase
+
+BASELINE_FILE = Path(__file__).parent / "query_count_baseline.json"
+PAGE_SIZES = (1, 10, 100)
+UPDATE_BASELINE = os.getenv("UPDATE_QUERY_COUNT_BASELINE", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+def load_baseline() -> dict[str, dict[str, dict[str, int]]]:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def write_baseline(endpoint: str, counts: dict[str, dict[str, int]]) -> None:
+    baseline = load_baseline()
+    baseline[endpoint] = counts
+    BASELINE_FILE.write_text(json.dumps(baseline, indent=4, sort_keys=True) + "\n")
+
+
+class QueryCountTests(APITestCase):
+    def _count_queries(self, url: str, expected_status: int, **params) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, expected_status, url)
+        return len(context.captured_queries)
+
+    def assertQueryCounts(
+        self,
+        endpoint: str,
+        list_url: str,
+        missing_detail_url: str,
+        get_detail_url: Callable[[Model], str],
+        create_batch: Callable[[int], list[Model]],
+    ) -> None:
+        """
+        Assert that the number of queries for the list and detail calls of
+        ``endpoint`` is constant for every page size and within the baseline.
+        """
+        # warm up any cached configuration so it is not counted as overhead
+        self.client.get(list_url)
+
+        empty_list = self._count_queries(list_url, status.HTTP_200_OK)
+        missing_detail = self._count_queries(
+            missing_detail_url, status.HTTP_404_NOT_FOUND
+        )
+
+        counts = {"list": {}, "detail": {}}
+        objects = []
+        for page_size in PAGE_SIZES:
+            objects += create_batch(page_size - len(objects))
+
+            counts["list"][str(page_size)] = (
+                self._count_queries(list_url, status.HTTP_200_OK, pageSize=page_size)
+                - empty_list
+            )
+            counts["detail"][str(page_size)] = (
+                self._count_queries(get_detail_url(objects[-1]), status.HTTP_200_OK)
+                - missing_detail
+            )
+
+        for action, action_counts in counts.items():
+            with self.subTest(endpoint=endpoint, action=action):
+                self.assertEqual(
+                    len(set(action_counts.values())),
+                    1,
+                    f"Query count of {endpoint} {action} grows with the page size: "
+                    f"{action_counts}",
+                )
+
+        if UPDATE_BASELINE:
+            write_baseline(endpoint, counts)
+            return
+
+        baseline = load_baseline().get(endpoint)
+        self.assertIsNotNone(
+            baseline, f"No query count baseline registered for {endpoint}"
+        )
+        for action, action_counts in counts.items():
+            for page_size, count in action_counts.items():
+                with self.subTest(endpoint=endpoint, action=action, size=page_size):
+                    self.assertLessEqual(count, baseline[action][page_size])
+
+    def _assert_externetaak_query_counts(self, endpoint: str, trait: str) -> None:
+        self.assertQueryCounts(
+            endpoint,
+            list_url=reverse(f"{endpoint}-list"),
+            missing_detail_url=reverse(
+                f"{endpoint}-detail", kwargs={"uuid": uuid.uuid4()}
+            ),
+            get_detail_url=lambda obj: reverse(
+                f"{endpoint}-detail", kwargs={"uuid": obj.uuid}
+            ),
+            create_batch=lambda size: ExterneTaakFactory.create_batch(
+                size, **{trait: True}
+            ),
+        )
+
+    def test_externetaken(self):
+        self._assert_externetaak_query_counts("taken:externetaak", "urltaak")
+
+    def test_betaaltaken(self):
+        self._assert_externetaak_query_counts("taken:betaaltaak", "betaaltaak")
+
+    def test_urltaken(self):
+        self._assert_externetaak_query_counts("taken:urltaak", "urltaak")
+
+    def test_formuliertaken(self):
+        self._assert_externetaak_query_counts("taken:formuliertaak", "formuliertaak")
+
+    def test_berichten(self):
+        self.assertQueryCounts(
+            "berichten:bericht",
+            list_url=reverse("berichten:bericht-list"),
+            missing_detail_url=reverse(
+                "berichten:bericht-detail", kwargs={"uuid": uuid.uuid4()}
+            ),
+            get_detail_url=lambda obj: reverse(
+                "berichten:bericht-detail", kwargs={"uuid": obj.uuid}
+            ),
+            create_batch=lambda size: BerichtFactory.create_batch(
+                size, create_bijlage=True
+            ),
+        )
+
+    def test_verzoeken(self):
+        self.assertQueryCounts(
+            "verzoeken:verzoek",
+            list_url=reverse("verzoeken:verzoek-list"),
+            missing_detail_url=reverse(
+                "verzoeken:verzoek-detail", kwargs={"uuid": uuid.uuid4()}
+            ),
+            get_detail_url=lambda obj: reverse(
+                "verzoeken:verzoek-detail", kwargs={"uuid": obj.uuid}
+            ),
+            create_batch=lambda size: VerzoekFactory.create_batch(
+                size, create_bijlage=True, create_details=True
+            ),
+        )
+
+    def test_verzoektypen(self):
+        self.assertQueryCounts(
+            "verzoeken:verzoektype",
+            list_url=reverse("verzoeken:verzoektype-list"),
+            missing_detail_url=reverse(
+                "verzoeken:verzoektype-detail", kwargs={"uuid": uuid.uuid4()}
+            ),
+            get_detail_url=lambda obj: reverse(
+                "verzoeken:verzoektype-detail", kwargs={"uuid": obj.uuid}
+            ),
+            create_batch=lambda size: VerzoekTypeFactory.create_batch(
+                size, create_versie=True
+            ),
+        )
+
+    def test_verzoektype_versies(self):
+        verzoektype = VerzoekTypeFactory.create()
+        url_kwargs = {"verzoektype_uuid": verzoektype.uuid}
+
+        self.assertQueryCounts(
+            "verzoeken:verzoektypeversion",
+            list_url=reverse("verzoeken:verzoektypeversion-list", kwargs=url_kwargs),
+            missing_detail_url=reverse(
+                "verzoeken:verzoektypeversion-detail",
+                kwargs={**url_kwargs, "verzoektype_versie": 999},
+            ),
+            get_detail_url=lambda obj: reverse(
+                "verzoeken:verzoektypeversion-detail",
+                kwargs={**url_kwargs, "verzoektype_versie": obj.versie},
+            ),
+            create_batch=lambda size: VerzoekTypeVersionFactory.create_batch(
+                size, verzoek_type=verzoektype, create_bijlagetype=True
+            ),
+        )
@@ -69,6 +69,10 @@ urlpatterns = [
         "berichten/api/",
         include("openvtb.components.berichten.api.urls"),
     ),
+    path(
+        "cloudevents/api/",
+        include("openvtb.cloudevents.api.urls"),
+    ),
     path("", include("maykin_common.health_checks.urls")),
     # Simply show the master template.
     path("", TemplateView.as_view(template_name="main.html"), name="root"),
@@ -1,7 +1,118 @@
+from dataclasses import dataclass
+
+from django.utils.translation import gettext_lazy as _
+
 from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_QUERY_PARAM = "fields"
+EXCLUDE_QUERY_PARAM = "exclude"
 
 
 class CamelToUnderscoreMixin:
     def to_representation(self, instance):
         instance = {camel_to_underscore(k): v for k, v in instance.items()}
         return super().to_representation(instance)
+
+
+@dataclass(frozen=True)
+class SparseFieldset:
+    include: frozenset[str] | None
+    exclude: frozenset[str]
+
+    def __contains__(self, field_name: str) -> bool:
+        if self.include is not None and field_name not in self.include:
+            return False
+        return field_name not in self.exclude
+
+
+def _parse_field_names(value: str) -> frozenset[str]:
+    return frozenset(
+        camel_to_underscore(name.strip(), no_underscore_before_number=True)
+        for name in value.split(",")
+        if name.strip()
+    )
+
+
+def get_sparse_fieldset(request) -> SparseFieldset | None:
+    """
+    Return the fields requested with the ``fields`` and ``exclude`` query parameters.
+
+    Only read requests can select fields, the response of a write request always
+    contains the complete resource.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+
+    fields = request.query_params.get(FIELDS_QUERY_PARAM)
+    exclude = request.query_params.get(EXCLUDE_QUERY_PARAM)
+    if not fields and not exclude:
+        return None
+
+    return SparseFieldset(
+        include=_parse_field_names(fields) if fields else None,
+        exclude=_parse_field_names(exclude or ""),
+    )
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Leave out the fields that are not requested with the ``fields`` and ``exclude``
+    query parameters.
+
+    The columns of the model fields in ``deferrable_fields`` are not fetched from
+    the database if the field is left out, see ``SparseFieldsViewSetMixin``.
+    """
+
+    deferrable_fields: tuple[str, ...] = ()
+
+    @property
+    def _is_root(self) -> bool:
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        fieldset = get_sparse_fieldset(self.context.get("request"))
+        if fieldset is None or not self._is_root:
+            return fields
+
+        unknown = (fieldset.include or frozenset()) | fieldset.exclude
+        unknown -= fields.keys()
+        if unknown:
+            raise serializers.ValidationError(
+                {
+                    FIELDS_QUERY_PARAM: _("Onbekende velden: {fields}.").format(
+                        fields=", ".join(sorted(unknown))
+                    )
+                },
+                code="unknown-fields",
+            )
+
+        return {name: field for name, field in fields.items() if name in fieldset}
+
+
+class SparseFieldsViewSetMixin:
+    """
+    Defer the columns of the fields that are left out with the ``fields`` and
+    ``exclude`` query parameters, so large values are not fetched.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        fieldset = get_sparse_fieldset(self.request)
+        if fieldset is None:
+            return queryset
+
+        serializer_class = self.get_serializer_class()
+        deferred = [
+            field_name
+            for field_name in getattr(serializer_class, "deferrable_fields", ())
+            if field_name not in fieldset
+        ]
+        return queryset.defer(*deferred) if deferred else queryset
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 from rest_framework.serializers import ModelSerializer
 
@@ -14,3 +15,8 @@ class UtilsConfig(AppConfig):
 
         field_mapping = ModelSerializer.serializer_field_mapping
         field_mapping[URNField] = URNSerializerField
+
+        if settings.DB_POOL_ENABLED:
+            from .db_pool import register_pool_metrics
+
+            register_pool_metrics()
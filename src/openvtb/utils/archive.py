@@ -0,0 +1,182 @@
+"""
+Archival of the finished rows of the tables which are partitioned on
+``gearchiveerd``.
+
+A row is archived by setting ``gearchiveerd``, which makes Postgres move it from the
+hot partition (``<table>_hot``) to the archive partition (``<table>_archief``). The
+rows are moved in small batches, each in its own transaction, so the API is not
+blocked by the archival.
+"""
+
+import time
+from collections.abc import Callable
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection, transaction
+from django.db.models import QuerySet
+
+import structlog
+from psycopg.errors import SerializationFailure
+
+from .db import claim
+
+logger = structlog.stdlib.get_logger(__name__)
+
+ARCHIVE_BATCH_SIZE = 1000
+# number of attempts of a save whose row is moved to another partition meanwhile
+SAVE_ATTEMPTS = 3
+
+
+def _is_moved_to_other_partition(exc: OperationalError) -> bool:
+    return isinstance(
+        exc.__cause__, SerializationFailure
+    ) and "moved to another partition" in str(exc)
+
+
+def retry_moved_row(func: Callable, *args, **kwargs):
+    """
+    Call ``func``, which updates a row of a partitioned table, in a savepoint and
+    call it again if the row was moved to another partition by a concurrent
+    transaction, e.g. because it was archived.
+    """
+    for attempt in range(1, SAVE_ATTEMPTS + 1):
+        try:
+            with transaction.atomic():
+                return func(*args, **kwargs)
+        except OperationalError as exc:
+            if attempt == SAVE_ATTEMPTS or not _is_moved_to_other_partition(exc):
+                raise
+            logger.info("row_moved_to_other_partition", attempt=attempt)
+
+
+class ArchivableModelMixin:
+    """
+    Save the rows of a table which is partitioned on ``gearchiveerd``.
+
+    ``gearchiveerd`` is only set by the archival, so saving an instance which was
+    loaded before its row was archived does not move the row back. A row is only
+    moved back to the hot partition when one of the ``archive_fields`` is saved and
+    the instance is no longer :meth:`is_archivable`, e.g. a taak which is opened
+    again.
+    """
+
+    archive_fields: frozenset[str] = frozenset()
+
+    def is_archivable(self) -> bool:
+        raise NotImplementedError
+
+    def _get_update_fields(self, update_fields) -> set[str]:
+        if update_fields is None:
+            # the fields which are saved without ``update_fields``
+            update_fields = {
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname in self.__dict__
+            }
+        update_fields = set(update_fields) - {"gearchiveerd"}
+        if update_fields & self.archive_fields and not self.is_archivable():
+            self.gearchiveerd = False
+            update_fields.add("gearchiveerd")
+        return update_fields
+
+    def save(self, *args, **kwargs):
+        if self._state.adding or kwargs.get("force_insert"):
+            super().save(*args, **kwargs)
+            return
+
+        kwargs["update_fields"] = self._get_update_fields(kwargs.get("update_fields"))
+        retry_moved_row(super().save, *args, **kwargs)
+
+
+def archive(
+    queryset: QuerySet, batch_size: int = ARCHIVE_BATCH_SIZE, pause: float = 0.0
+) -> int:
+    """
+    Move the rows of the queryset to the archive partition, in batches of
+    ``batch_size`` rows with ``pause`` seconds in between, and return the number of
+    archived rows.
+    """
+    archived = 0
+    while True:
+        ids = claim(queryset.filter(gearchiveerd=False), batch_size, gearchiveerd=True)
+        archived += len(ids)
+        if len(ids) < batch_size:
+            return archived
+        if pause:
+            time.sleep(pause)
+
+
+def compact_hot_partition(table: str, reindex: bool = False) -> None:
+    """
+    Vacuum the hot partition of the table, so the space of the moved rows is reused,
+    and optionally rebuild its indexes, so they shrink to the size of the remaining
+    rows. Both can not run in a transaction.
+    """
+    partition = connection.ops.quote_name(f"{table}_hot")
+    with connection.cursor() as cursor:
+        cursor.execute(f"VACUUM (ANALYZE) {partition}")
+        if reindex:
+            cursor.execute(f"REINDEX TABLE CONCURRENTLY {partition}")
+
+
+class BaseArchiveCommand(BaseCommand):
+    """
+    Archive the rows of ``get_queryset()``, see :func:`archive`.
+    """
+
+    name_plural: str
+
+    def get_queryset(self, **options) -> QuerySet:
+        raise NotImplementedError
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ARCHIVE_BATCH_SIZE,
+            help="Number of rows that are moved in one transaction.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Number of seconds to wait between the batches.",
+        )
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="Vacuum the hot partition after the archival.",
+        )
+        parser.add_argument(
+            "--reindex",
+            action="store_true",
+            help="Rebuild the indexes of the hot partition after the archival.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only show the number of rows that would be archived.",
+        )
+
+    def handle(self, **options):
+        queryset = self.get_queryset(**options).filter(gearchiveerd=False)
+
+        if options["dry_run"]:
+            self.stdout.write(
+                f"{queryset.count()} {self.name_plural} would be archived."
+            )
+            return
+
+        archived = archive(
+            queryset, batch_size=options["batch_size"], pause=options["pause"]
+        )
+        logger.info("archived", table=queryset.model._meta.db_table, count=archived)
+
+        if options["vacuum"] or options["reindex"]:
+            compact_hot_partition(
+                queryset.model._meta.db_table, reindex=options["reindex"]
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Archived {archived} {self.name_plural}.")
+        )
@@ -2,9 +2,32 @@ from django.conf import settings
 from django.db import transaction
 
 from notifications_api_common.cloudevents import (
+    construct_cloudevent,
     process_cloudevent as _process_cloudevent,
 )
 
+from openvtb.cloudevents.batch import buffer_cloudevent, is_buffering_enabled
+from openvtb.cloudevents.dead_letters import store_dead_letters
+
+
+def _send_cloudevent(
+    type_event: str,
+    subject: str | None = None,
+    dataref: str | None = None,
+    data: dict | None = None,
+):
+    try:
+        if is_buffering_enabled():
+            buffer_cloudevent(type_event, subject, dataref, data)
+        else:
+            _process_cloudevent(type_event, subject, dataref, data)
+    except Exception as exc:
+        # e.g. the broker is unavailable, keep the event to replay it later
+        store_dead_letters(
+            [construct_cloudevent(type_event, subject, dataref, data)],
+            f"{type(exc).__name__}: {exc}",
+        )
+
 
 def process_cloudevent(
     type_event: str,
@@ -14,5 +37,5 @@ def process_cloudevent(
 ):
     if settings.ENABLE_CLOUD_EVENTS:
         transaction.on_commit(
-            lambda: _process_cloudevent(type_event, subject, dataref, data)
+            lambda: _send_cloudevent(type_event, subject, dataref, data)
         )
@@ -0,0 +1,48 @@
+from django.db import connections, transaction
+from django.db.models import QuerySet
+
+CLAIM_SQL = """
+UPDATE {table} SET {assignments}
+WHERE {pk} IN ({queryset})
+RETURNING {pk}
+"""
+
+
+def claim(queryset: QuerySet, limit: int, **values) -> list:
+    """
+    Update at most ``limit`` rows of the queryset, which are not locked by another
+    transaction, with ``values`` in a single ``UPDATE ... RETURNING`` statement, and
+    return the primary keys of the updated rows, in order.
+
+    The filters of the queryset should exclude the rows which are updated, so a row
+    is only claimed once, also by concurrent transactions.
+    """
+    model = queryset.model
+    connection = connections[queryset.db]
+    quote_name = connection.ops.quote_name
+
+    assignments, params = [], []
+    for name, value in values.items():
+        field = model._meta.get_field(name)
+        assignments.append(f"{quote_name(field.column)} = %s")
+        params.append(field.get_db_prep_save(value, connection))
+
+    with transaction.atomic(using=queryset.db):
+        sql, queryset_params = (
+            queryset.order_by("pk")
+            .select_for_update(skip_locked=True)
+            .values("pk")[:limit]
+            .query.get_compiler(using=queryset.db)
+            .as_sql()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                CLAIM_SQL.format(
+                    table=quote_name(model._meta.db_table),
+                    assignments=", ".join(assignments),
+                    pk=quote_name(model._meta.pk.column),
+                    queryset=sql,
+                ),
+                [*params, *queryset_params],
+            )
+            return sorted(pk for (pk,) in cursor.fetchall())
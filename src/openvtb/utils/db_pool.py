@@ -0,0 +1,104 @@
+"""
+OpenTelemetry metrics of the database connection pools.
+
+The metrics are read from the statistics of the psycopg pools when they are exported,
+so they do not add work to the queries. A pool only exists once the process made its
+first connection to the database.
+"""
+
+from collections.abc import Callable, Iterable
+
+from django.db.backends.postgresql.base import DatabaseWrapper
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+POOL_NAME = "db.client.connection.pool.name"
+CONNECTION_STATE = "db.client.connection.state"
+
+
+def get_pool_stats() -> dict[str, dict[str, int]]:
+    """
+    Return the statistics of the connection pool of every database alias.
+
+    The pools are shared by the connections of all threads of the process. The counters
+    are cumulative, and statistics which are ``0`` can be missing.
+    """
+    return {
+        alias: pool.get_stats()
+        for alias, pool in list(DatabaseWrapper._connection_pools.items())
+    }
+
+
+def _used(stats: dict[str, int]) -> int:
+    return stats.get("pool_size", 0) - stats.get("pool_available", 0)
+
+
+def _saturation(stats: dict[str, int]) -> float:
+    pool_max = stats.get("pool_max", 0)
+    return _used(stats) / pool_max if pool_max else 0.0
+
+
+def _observe(
+    value: Callable[[dict[str, int]], float], **attributes: str
+) -> Callable[[CallbackOptions], Iterable[Observation]]:
+    def callback(options: CallbackOptions) -> Iterable[Observation]:
+        return [
+            Observation(value(stats), {POOL_NAME: alias, **attributes})
+            for alias, stats in get_pool_stats().items()
+        ]
+
+    return callback
+
+
+def register_pool_metrics() -> None:
+    meter = metrics.get_meter(__name__)
+
+    meter.create_observable_up_down_counter(
+        "db.client.connection.count",
+        callbacks=[
+            _observe(_used, **{CONNECTION_STATE: "used"}),
+            _observe(
+                lambda stats: stats.get("pool_available", 0),
+                **{CONNECTION_STATE: "idle"},
+            ),
+        ],
+        unit="{connection}",
+        description="The number of connections in the pool, by state.",
+    )
+    meter.create_observable_up_down_counter(
+        "db.client.connection.max",
+        callbacks=[_observe(lambda stats: stats.get("pool_max", 0))],
+        unit="{connection}",
+        description="The maximum number of connections in the pool.",
+    )
+    meter.create_observable_up_down_counter(
+        "db.client.connection.pending_requests",
+        callbacks=[_observe(lambda stats: stats.get("requests_waiting", 0))],
+        unit="{request}",
+        description="The number of requests waiting for a connection.",
+    )
+    meter.create_observable_gauge(
+        "db.client.connection.saturation",
+        callbacks=[_observe(_saturation)],
+        unit="1",
+        description="The fraction of the maximum number of connections that is used.",
+    )
+    meter.create_observable_counter(
+        "db.client.connection.checkouts",
+        callbacks=[_observe(lambda stats: stats.get("requests_num", 0))],
+        unit="{request}",
+        description="The number of connections taken from the pool.",
+    )
+    meter.create_observable_counter(
+        "db.client.connection.wait_time",
+        callbacks=[_observe(lambda stats: stats.get("requests_wait_ms", 0) / 1000)],
+        unit="s",
+        description="The total time spent waiting for a connection from the pool.",
+    )
+    meter.create_observable_counter(
+        "db.client.connection.timeouts",
+        callbacks=[_observe(lambda stats: stats.get("requests_errors", 0))],
+        unit="{request}",
+        description="The number of requests which did not get a connection in time.",
+    )
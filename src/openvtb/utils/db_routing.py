@@ -0,0 +1,131 @@
+"""
+Routing of read queries to the read replicas of the database.
+
+Only the queries in a :func:`read_from_replica` block are sent to a replica, e.g.
+the queries of read-only API requests (see ``ReplicaRoutingMiddleware``) or of
+exports. All other queries, and all writes, use the primary (``default``)
+database. A replica which lags more than ``DB_REPLICA_MAX_LAG`` seconds, or
+can not be reached, is not used until its lag is checked again.
+"""
+
+import hashlib
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# the number of seconds the lag of a replica is reused
+LAG_CHECK_INTERVAL = 5
+
+# the lag is 0 if the replica replayed everything it received
+LAG_SQL = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+STICKY_CACHE_KEY = "db-routing:sticky:{client}"
+
+_read_from_replica: ContextVar[bool] = ContextVar("read_from_replica", default=False)
+
+# alias -> (lag, checked at)
+_replica_lags: dict[str, tuple[float, float]] = {}
+
+
+@contextmanager
+def read_from_replica(enabled: bool = True) -> Iterator[None]:
+    """
+    Send the read queries in this block to a replica, if one is available.
+    """
+    token = _read_from_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+def get_replica_aliases() -> list[str]:
+    return [alias for alias in settings.DATABASES if alias.startswith("replica_")]
+
+
+def get_replica_lag(alias: str) -> float:
+    """
+    Return the replication lag of a replica in seconds, checked at most every
+    ``LAG_CHECK_INTERVAL`` seconds.
+    """
+    now = time.monotonic()
+    lag, checked_at = _replica_lags.get(alias, (0.0, -LAG_CHECK_INTERVAL))
+    if now - checked_at < LAG_CHECK_INTERVAL:
+        return lag
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_SQL)
+            (lag,) = cursor.fetchone()
+            lag = float(lag)
+    except DatabaseError:
+        logger.warning("db_replica_unavailable", alias=alias, exc_info=True)
+        lag = float("inf")
+
+    if lag > settings.DB_REPLICA_MAX_LAG:
+        logger.warning("db_replica_lagging", alias=alias, lag=lag)
+    _replica_lags[alias] = (lag, now)
+    return lag
+
+
+def get_available_replica() -> str | None:
+    replicas = [
+        alias
+        for alias in get_replica_aliases()
+        if get_replica_lag(alias) <= settings.DB_REPLICA_MAX_LAG
+    ]
+    return random.choice(replicas) if replicas else None
+
+
+def _get_sticky_cache_key(client: str) -> str:
+    digest = hashlib.sha256(client.encode()).hexdigest()
+    return STICKY_CACHE_KEY.format(client=digest)
+
+
+def mark_client_wrote(client: str) -> None:
+    """
+    Read from the primary for the client, for ``DB_REPLICA_STICKY_SECONDS``
+    seconds, so it reads its own write.
+    """
+    cache.set(
+        _get_sticky_cache_key(client), True, timeout=settings.DB_REPLICA_STICKY_SECONDS
+    )
+
+
+def client_recently_wrote(client: str) -> bool:
+    return bool(cache.get(_get_sticky_cache_key(client)))
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints) -> str | None:
+        if not _read_from_replica.get():
+            return None
+        # the reads in a transaction see the writes of the transaction
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return get_available_replica()
+
+    def db_for_write(self, model, **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # the replicas contain the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
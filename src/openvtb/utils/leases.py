@@ -0,0 +1,105 @@
+"""
+Leases, to run a periodic job only once at a time.
+
+A run of a job holds the lease of the job for ``duration`` seconds, and renews it
+every time it saves its progress (a checkpoint). Another run of the job, from an
+overlapping schedule or another beat instance, does not start while the lease is
+held. When a run crashes, its lease expires and the next run resumes from the last
+checkpoint, instead of starting all over.
+"""
+
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+import structlog
+
+from .models import JobLease
+
+logger = structlog.stdlib.get_logger(__name__)
+
+DEFAULT_LEASE_SECONDS = 5 * 60
+
+
+class LeaseLost(Exception):
+    """
+    The lease expired, and was taken over by another run.
+    """
+
+
+class Lease:
+    def __init__(self, name: str, duration: int = DEFAULT_LEASE_SECONDS):
+        self.name = name
+        self.duration = timedelta(seconds=duration)
+        self.owner = uuid.uuid4().hex
+        self.checkpoint: dict = {}
+
+    def _owned(self):
+        return JobLease.objects.filter(name=self.name, owner=self.owner)
+
+    def acquire(self) -> bool:
+        now = timezone.now()
+        JobLease.objects.get_or_create(name=self.name)
+        # a single statement, so concurrent runs can not both acquire the lease
+        acquired = (
+            JobLease.objects.filter(name=self.name)
+            .filter(Q(expires_at__isnull=True) | Q(expires_at__lte=now))
+            .update(owner=self.owner, expires_at=now + self.duration)
+        )
+        if acquired:
+            self.checkpoint = self._owned().values_list("checkpoint", flat=True).get()
+        return bool(acquired)
+
+    def save_checkpoint(self, **checkpoint) -> None:
+        """
+        Save the progress of the run, and renew the lease.
+        """
+        self.checkpoint = {**self.checkpoint, **checkpoint}
+        renewed = self._owned().update(
+            checkpoint=self.checkpoint, expires_at=timezone.now() + self.duration
+        )
+        if not renewed:
+            raise LeaseLost(self.name)
+
+    def release(self, finished: bool) -> None:
+        """
+        Release the lease. The checkpoint is kept if the run did not finish, so the
+        next run resumes from it.
+        """
+        values = {"owner": "", "expires_at": None}
+        if finished:
+            values["checkpoint"] = {}
+        self._owned().update(**values)
+
+
+@contextmanager
+def job_lease(
+    name: str, duration: int = DEFAULT_LEASE_SECONDS
+) -> Iterator[Lease | None]:
+    """
+    Hold the lease of a job while the block runs, or give ``None`` if another run
+    holds it.
+    """
+    lease = Lease(name, duration)
+    if not lease.acquire():
+        logger.info("job_already_running", job=name)
+        yield None
+        return
+
+    if lease.checkpoint:
+        logger.info("job_resumed", job=name, checkpoint=lease.checkpoint)
+
+    try:
+        yield lease
+    except LeaseLost:
+        logger.warning("job_lease_lost", job=name)
+        raise
+    except BaseException:
+        lease.release(finished=False)
+        raise
+    else:
+        lease.release(finished=True)
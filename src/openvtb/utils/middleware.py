@@ -1,5 +1,9 @@
+from contextlib import ExitStack
+
 from django.conf import settings
+from django.db import connections
 
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from vng_api_common.middleware import (
@@ -7,6 +11,14 @@ from vng_api_common.middleware import (
     APIVersionHeaderMiddleware as _APIVersionHeaderMiddleware,
 )
 
+from .db_routing import (
+    client_recently_wrote,
+    get_replica_aliases,
+    mark_client_wrote,
+    read_from_replica,
+)
+from .query_budget import QueryBudget, get_statement_timeout
+
 
 def get_version_mapping() -> dict[str, str]:
     apis = (
@@ -52,3 +64,66 @@ class APIVersionHeaderMiddleware(_APIVersionHeaderMiddleware):
             if path.startswith(prefix):
                 return version
         return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve the read-only requests of API clients from a read replica, except for
+    the requests of a client which made a write in the last
+    ``DB_REPLICA_STICKY_SECONDS`` seconds. The client is identified by its
+    ``Authorization`` header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        client = request.headers.get("Authorization")
+        if not client or not get_replica_aliases():
+            return self.get_response(request)
+
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            mark_client_wrote(client)
+            return response
+
+        with read_from_replica(not client_recently_wrote(client)):
+            return self.get_response(request)
+
+
+class QueryBudgetMiddleware:
+    """
+    Limit the database queries of the API requests, see
+    :mod:`openvtb.utils.query_budget`.
+
+    This must be the last middleware, so only the queries of the view are limited.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        budget = request._query_budget = QueryBudget()
+        try:
+            with ExitStack() as stack:
+                for alias in settings.DATABASES:
+                    stack.enter_context(connections[alias].execute_wrapper(budget))
+                return self.get_response(request)
+        finally:
+            budget.finish(connections)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # only the views of the API
+        view_class = getattr(view_func, "cls", None)
+        if view_class is None:
+            return
+
+        method = request.method.lower()
+        actions = getattr(view_func, "actions", None) or {}
+        action = actions.get("get" if method == "head" else method)
+
+        request._query_budget.start(
+            view=f"{view_class.__name__}.{action or method}",
+            statement_timeout=get_statement_timeout(view_class, action),
+            connections=connections,
+        )
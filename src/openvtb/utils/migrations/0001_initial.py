@@ -0,0 +1,63 @@
+# Generated by Django 5.2.15 on 2026-10-19 15:10
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="JobLease",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=100, unique=True, verbose_name="name"),
+                ),
+                (
+                    "owner",
+                    models.CharField(
+                        blank=True,
+                        help_text="Identifier of the run which holds the lease.",
+                        max_length=32,
+                        verbose_name="owner",
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The lease can be taken over by another run after this moment.",
+                        null=True,
+                        verbose_name="expires at",
+                    ),
+                ),
+                (
+                    "checkpoint",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The progress of the last run, from which an unfinished run is resumed.",
+                        verbose_name="checkpoint",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "job lease",
+                "verbose_name_plural": "job leases",
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class JobLease(models.Model):
+    """
+    The lease of a periodic job, so only one run of the job is executed at a time,
+    with the progress of the run.
+    """
+
+    name = models.CharField(
+        _("name"),
+        max_length=100,
+        unique=True,
+    )
+    owner = models.CharField(
+        _("owner"),
+        max_length=32,
+        blank=True,
+        help_text=_("Identifier of the run which holds the lease."),
+    )
+    expires_at = models.DateTimeField(
+        _("expires at"),
+        null=True,
+        blank=True,
+        help_text=_("The lease can be taken over by another run after this moment."),
+    )
+    checkpoint = models.JSONField(
+        _("checkpoint"),
+        default=dict,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        help_text=_(
+            "The progress of the last run, from which an unfinished run is resumed."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("job lease")
+        verbose_name_plural = _("job leases")
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,185 @@
+"""
+Limits on the database queries of an API request.
+
+Every query of an API request runs with a Postgres ``statement_timeout``, which
+depends on the action of the viewset: ``list``, ``write`` (``create``, ``update``,
+``partial_update`` and ``destroy``), ``export`` or ``detail`` (all other actions). A
+viewset can change the timeout of an action with ``statement_timeouts``, which maps
+the action to one of these kinds, or to a number of seconds::
+
+    class VerzoekViewSet(viewsets.ModelViewSet):
+        statement_timeouts = {"tiles": "export"}
+
+A request also has a budget for the number and the total duration of its queries. A
+request which exceeds the budget is logged, or stopped if ``API_QUERY_BUDGET_STRICT``
+is ``True``. A slow or pathological query can then no longer hold a connection of the
+pool for long, at the expense of the other requests.
+"""
+
+import time
+from collections.abc import Callable
+
+from django.conf import settings
+from django.db import OperationalError
+from django.utils.translation import gettext_lazy as _
+
+import structlog
+from psycopg.errors import QueryCanceled
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class QueryTimeout(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _(
+        "De aanvraag duurde te lang. Verfijn de filters of vraag een kleinere pagina op."
+    )
+    default_code = "query-timeout"
+
+
+class QueryBudgetExceeded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _(
+        "De aanvraag vraagt te veel van de database. Verfijn de filters of vraag een "
+        "kleinere pagina op."
+    )
+    default_code = "query-budget-exceeded"
+
+
+WRITE_ACTIONS = {"create", "update", "partial_update", "destroy"}
+
+
+def get_statement_timeout(view_class: type, action: str | None) -> float:
+    if action == "list":
+        default = "list"
+    elif action in WRITE_ACTIONS:
+        default = "write"
+    else:
+        default = "detail"
+    timeout = getattr(view_class, "statement_timeouts", {}).get(action, default)
+    if isinstance(timeout, str):
+        return settings.API_STATEMENT_TIMEOUTS[timeout]
+    return timeout
+
+
+class QueryBudget:
+    """
+    Database execute wrapper which counts and times the queries of a request, and sets
+    the ``statement_timeout`` of every connection before its queries.
+
+    The limits only apply once :meth:`start` is called for the view of the request.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0.0
+        self.view = ""
+        self.statement_timeout = 0.0
+        self.max_queries = 0
+        self.max_duration = 0.0
+        self.strict = False
+        self.exceeded = False
+        # the aliases of the connections with a statement timeout, and of those with
+        # the timeout set for the session
+        self.timed_out_aliases: set[str] = set()
+        self.session_aliases: set[str] = set()
+
+    def start(self, view: str, statement_timeout: float, connections) -> None:
+        self.view = view
+        self.statement_timeout = statement_timeout
+        self.max_queries = settings.API_QUERY_BUDGET_COUNT
+        self.max_duration = settings.API_QUERY_BUDGET_DURATION
+        self.strict = settings.API_QUERY_BUDGET_STRICT
+
+        # set the timeout of the open connections before the view starts a
+        # transaction, so it does not have to be set for every query
+        for connection in connections.all(initialized_only=True):
+            if connection.connection is not None:
+                self._set_statement_timeout(connection)
+
+    def _is_over(self) -> bool:
+        return bool(
+            (self.max_queries and self.queries > self.max_queries)
+            or (self.max_duration and self.duration > self.max_duration)
+        )
+
+    def _log_exceeded(self) -> None:
+        self.exceeded = True
+        logger.warning(
+            "query_budget_exceeded",
+            view=self.view,
+            queries=self.queries,
+            duration=round(self.duration, 3),
+            strict=self.strict,
+        )
+
+    def _check(self) -> None:
+        if not self.exceeded:
+            if not self._is_over():
+                return
+            self._log_exceeded()
+        if self.strict:
+            raise QueryBudgetExceeded()
+
+    def _set_statement_timeout(self, connection) -> None:
+        if not self.statement_timeout or connection.alias in self.session_aliases:
+            return
+
+        self.timed_out_aliases.add(connection.alias)
+        # a timeout set in a transaction is reverted by a rollback, so it is set for
+        # every query in a transaction, until it is set outside of one
+        if connection.get_autocommit():
+            self.session_aliases.add(connection.alias)
+            statement = "SET"
+        else:
+            statement = "SET LOCAL"
+        # outside of the execute wrappers, so it is not counted
+        connection.connection.execute(
+            f"{statement} statement_timeout = {int(self.statement_timeout * 1000)}"
+        )
+
+    def __call__(self, execute: Callable, sql, params, many, context):
+        connection = context["connection"]
+        self._set_statement_timeout(connection)
+
+        self.queries += 1
+        if self.view:
+            self._check()
+
+        start = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        except OperationalError as exc:
+            if isinstance(exc.__cause__, QueryCanceled):
+                logger.warning(
+                    "query_timeout",
+                    view=self.view,
+                    alias=connection.alias,
+                    statement_timeout=self.statement_timeout,
+                )
+                raise QueryTimeout() from exc
+            raise
+        finally:
+            self.duration += time.monotonic() - start
+
+    def finish(self, connections) -> None:
+        """
+        Log the request if its last queries exceeded the budget, and reset the statement
+        timeout of the connections, which are reused by other requests and tasks.
+        """
+        if self.view and not self.exceeded and self._is_over():
+            self._log_exceeded()
+
+        for alias in self.timed_out_aliases:
+            connection = connections[alias]
+            if connection.connection is None:
+                continue
+            try:
+                connection.connection.execute("RESET statement_timeout")
+            except Exception:
+                # the connection is broken, and will not be reused
+                logger.warning(
+                    "statement_timeout_reset_failed", alias=alias, exc_info=True
+                )
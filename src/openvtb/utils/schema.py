@@ -7,6 +7,12 @@ from drf_spectacular.utils import OpenApiParameter
 from rest_framework import serializers
 from vng_api_common.constants import VERSION_HEADER
 
+from .api_mixins import (
+    EXCLUDE_QUERY_PARAM,
+    FIELDS_QUERY_PARAM,
+    SparseFieldsViewSetMixin,
+)
+
 
 class AutoSchema(_AutoSchema):
     def get_response_serializers(
@@ -22,7 +28,33 @@ class AutoSchema(_AutoSchema):
         params = super().get_override_parameters()
         version_headers = self.get_version_headers()
 
-        return params + version_headers
+        return params + version_headers + self.get_sparse_fields_parameters()
+
+    def get_sparse_fields_parameters(self) -> list[OpenApiParameter]:
+        if not isinstance(self.view, SparseFieldsViewSetMixin) or getattr(
+            self.view, "action", None
+        ) not in ("list", "retrieve"):
+            return []
+
+        return [
+            OpenApiParameter(
+                name=FIELDS_QUERY_PARAM,
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description=_(
+                    "Komma-gescheiden lijst van de velden die teruggegeven worden, "
+                    "bijvoorbeeld `uuid,url`. Andere velden worden weggelaten."
+                ),
+            ),
+            OpenApiParameter(
+                name=EXCLUDE_QUERY_PARAM,
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description=_(
+                    "Komma-gescheiden lijst van de velden die weggelaten worden."
+                ),
+            ),
+        ]
 
     def get_version_headers(self) -> list[OpenApiParameter]:
         return [
@@ -17,6 +17,8 @@ from rest_framework.utils.field_mapping import (
     get_url_kwargs,
 )
 
+from openvtb.utils.api_mixins import SparseFieldsSerializerMixin
+from openvtb.utils.urn import InvalidURN, parse_urn
 from openvtb.utils.validators import URNValidator, validate_iban
 
 URNSchema = {
@@ -44,8 +46,7 @@ class URNRelatedField(RelatedField):
 
     """
 
-    URN_PATTERN = re.compile(r"^urn:([^:]+):([^:]+):(.+)$")
-    UUID_REGEX = (
+    UUID_REGEX = re.compile(
         "([0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12})"
     )
 
@@ -165,15 +166,19 @@ class URNRelatedField(RelatedField):
         if not data.startswith("urn:"):
             self.fail("no_match")
 
-        match = self.URN_PATTERN.match(data)
-        if not match:
+        try:
+            urn = parse_urn(data)
+        except InvalidURN:
             self.fail("incorrect_match")
 
-        urn_component, urn_resource, urn_identifier = match.groups()
+        # urn:<namespace>:<resource>:<identifier>
+        urn_resource, separator, urn_identifier = urn.nss.partition(":")
+        if not (urn_resource and separator and urn_identifier):
+            self.fail("incorrect_match")
 
         lookup_value = self.lookup_field
         if self.lookup_field == "uuid":
-            uuid_match = re.search(self.UUID_REGEX, urn_identifier)
+            uuid_match = self.UUID_REGEX.search(urn_identifier)
             if not uuid_match:
                 self.fail("incorrect_match")
             lookup_value = uuid_match.group(1)
@@ -209,7 +214,7 @@ class URNIdentityField(URNRelatedField):
         return False
 
 
-class URNModelSerializer(serializers.ModelSerializer):
+class URNModelSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     serializer_related_field = URNIdentityField
     urn_field_name = "urn"
 
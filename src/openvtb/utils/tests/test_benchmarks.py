@@ -0,0 +1,203 @@
+"""
+Microbenchmarks for the validation helpers that run on every write.
+
+The benchmarks are timing based, so they are skipped in the regular test run.
+Run them with::
+
+    RUN_BENCHMARKS=1 python src/manage.py test openvtb.utils.tests.test_benchmarks
+
+Every benchmark is compared with the results recorded in
+``benchmark_results.json``, see :mod:`openvtb.tests.benchmarks`. Record new
+results on the reference machine, and commit them so the difference shows up in
+review, with::
+
+    UPDATE_BENCHMARK_RESULTS=1 \\
+        python src/manage.py test openvtb.utils.tests.test_benchmarks
+"""
+
+import statistics
+import timeit
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from unittest import skipUnless
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+
+from jsonschema import FormatError
+from rest_framework.exceptions import ValidationError as DRFValidationError
+
+from openvtb.components.taken.constants import SoortTaak
+from openvtb.components.taken.schemas import (
+    FORMULIER_DEFINITIE_SCHEMA,
+    SOORTTAAK_SCHEMA_MAPPING,
+)
+from openvtb.tests.benchmarks import RUN_BENCHMARKS, BenchmarkMixin
+from openvtb.utils.validators import (
+    URNValidator,
+    is_valid_decimal,
+    is_valid_email,
+    is_valid_iban,
+    validate_jsonschema,
+)
+
+from .test_serializers import ModelVTB, QuerySetVTB, SerializerVTB
+
+REPEAT = 5
+
+URN = "urn:nld:brp:bsn:111222333"
+URN_LONG = (
+    "urn:nld:gemeenteutrecht:informatieobject:"
+    + "/".join(f"deel-{index}%20{index}" for index in range(100))
+    + "?+resolver=a?=query/b#fragment"
+)
+# a valid prefix of considerable length followed by a single invalid character
+URN_INVALID = "urn:nld:" + "a:" * 1000 + " "
+
+BETAALTAAK_DETAILS = {
+    "bedrag": "1500.50",
+    "valuta": "EUR",
+    "transactieomschrijving": "Leges vergunning",
+    "doelrekening": {"naam": "Gemeente Utrecht", "iban": "NL18BANK23481326"},
+}
+FORMULIER_DEFINITIE = {
+    "display": "form",
+    "components": [
+        {
+            "label": f"Veld {index}",
+            "key": f"veld{index}",
+            "type": "select",
+            "data": {
+                "values": [
+                    {"label": f"Optie {value}", "value": f"optie{value}"}
+                    for value in range(10)
+                ]
+            },
+        }
+        for index in range(50)
+    ],
+}
+
+
+def measure(func: Callable[[], object]) -> dict[str, float]:
+    """
+    Return the best and median time of a single call of ``func`` in microseconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = [
+        total / number * 1_000_000
+        for total in timer.repeat(repeat=REPEAT, number=number)
+    ]
+    return {
+        "min": round(min(timings), 3),
+        "median": round(statistics.median(timings), 3),
+    }
+
+
+def raises(func: Callable[[], object], *exceptions: type[Exception]):
+    def wrapper():
+        try:
+            func()
+        except exceptions:
+            pass
+
+    return wrapper
+
+
+@skipUnless(RUN_BENCHMARKS, "Set RUN_BENCHMARKS=1 to run the benchmarks")
+class ValidatorBenchmarks(BenchmarkMixin, SimpleTestCase):
+    benchmark_file = Path(__file__).parent / "benchmark_results.json"
+
+    def assertBenchmark(self, name: str, func: Callable[[], object]) -> None:
+        self.assertRecordedResult(name, measure(func), "min")
+
+    def test_urn_validator(self):
+        validator = URNValidator()
+
+        with self.subTest("short"):
+            self.assertBenchmark("urn_validator.short", lambda: validator(URN))
+        with self.subTest("long"):
+            self.assertBenchmark("urn_validator.long", lambda: validator(URN_LONG))
+        with self.subTest("invalid"):
+            self.assertBenchmark(
+                "urn_validator.invalid",
+                raises(lambda: validator(URN_INVALID), ValidationError),
+            )
+
+    def test_is_valid_iban(self):
+        self.assertBenchmark("is_valid_iban", lambda: is_valid_iban("NL18BANK23481326"))
+
+    def test_is_valid_email(self):
+        self.assertBenchmark(
+            "is_valid_email", lambda: is_valid_email("jan.jansen@example.com")
+        )
+
+    def test_is_valid_decimal(self):
+        with self.subTest("valid"):
+            self.assertBenchmark(
+                "is_valid_decimal.valid", lambda: is_valid_decimal("1500.50")
+            )
+        with self.subTest("invalid"):
+            self.assertBenchmark(
+                "is_valid_decimal.invalid",
+                raises(lambda: is_valid_decimal("1500.505"), FormatError),
+            )
+
+    def test_validate_jsonschema(self):
+        betaal_schema = SOORTTAAK_SCHEMA_MAPPING[SoortTaak.BETAALTAAK]
+
+        with self.subTest("betaaltaak details"):
+            self.assertBenchmark(
+                "validate_jsonschema.betaaltaak",
+                lambda: validate_jsonschema(
+                    BETAALTAAK_DETAILS, betaal_schema, label="details"
+                ),
+            )
+        with self.subTest("betaaltaak details invalid"):
+            invalid_details = {
+                **BETAALTAAK_DETAILS,
+                "doelrekening": {"iban": "invalid"},
+            }
+            self.assertBenchmark(
+                "validate_jsonschema.betaaltaak_invalid",
+                raises(
+                    lambda: validate_jsonschema(
+                        invalid_details, betaal_schema, label="details"
+                    ),
+                    ValidationError,
+                ),
+            )
+        with self.subTest("formulierDefinitie"):
+            self.assertBenchmark(
+                "validate_jsonschema.formulier_definitie",
+                lambda: validate_jsonschema(
+                    FORMULIER_DEFINITIE,
+                    FORMULIER_DEFINITIE_SCHEMA,
+                    label="formulierDefinitie",
+                ),
+            )
+
+    def test_urn_related_field(self):
+        obj = ModelVTB(uuid=uuid.uuid4())
+        field = SerializerVTB(instance=obj, context={"request": None}).fields["urn"]
+        field.get_queryset = lambda: QuerySetVTB([obj], lookup_field="uuid")
+
+        with self.subTest("to_internal_value"):
+            self.assertBenchmark(
+                "urn_related_field.to_internal_value",
+                lambda: field.to_internal_value(f"urn:maykin:vtb:test:{obj.uuid}"),
+            )
+        with self.subTest("to_internal_value invalid"):
+            self.assertBenchmark(
+                "urn_related_field.to_internal_value_invalid",
+                raises(
+                    lambda: field.to_internal_value("urn:maykin:vtb:test:1234"),
+                    DRFValidationError,
+                ),
+            )
+        with self.subTest("get_urn"):
+            self.assertBenchmark(
+                "urn_related_field.get_urn", lambda: field.get_urn(obj)
+            )
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from ..db_pool import POOL_NAME, _observe, _saturation, _used, get_pool_stats
+
+
+class FakePool:
+    def __init__(self, **stats):
+        self.stats = stats
+
+    def get_stats(self):
+        return self.stats
+
+
+@patch(
+    "openvtb.utils.db_pool.DatabaseWrapper._connection_pools",
+    {
+        "default": FakePool(
+            pool_max=10, pool_size=8, pool_available=3, requests_wait_ms=1500
+        ),
+        "replica_0": FakePool(pool_max=4),
+    },
+)
+class PoolMetricsTestCase(SimpleTestCase):
+    def test_get_pool_stats(self):
+        stats = get_pool_stats()
+
+        self.assertEqual(stats["default"]["pool_size"], 8)
+        self.assertEqual(stats["replica_0"], {"pool_max": 4})
+
+    def test_used_connections(self):
+        observations = _observe(_used)(None)
+
+        self.assertEqual(
+            [(o.value, o.attributes[POOL_NAME]) for o in observations],
+            [(5, "default"), (0, "replica_0")],
+        )
+
+    def test_saturation(self):
+        observations = _observe(_saturation)(None)
+
+        self.assertEqual([o.value for o in observations], [0.5, 0.0])
+
+    def test_missing_stats_and_attributes(self):
+        observations = _observe(
+            lambda stats: stats.get("requests_wait_ms", 0) / 1000, state="used"
+        )(None)
+
+        self.assertEqual([o.value for o in observations], [1.5, 0])
+        self.assertEqual(observations[0].attributes["state"], "used")
+
+    def test_no_max_size(self):
+        self.assertEqual(_saturation({"pool_size": 4, "pool_available": 0}), 0.0)
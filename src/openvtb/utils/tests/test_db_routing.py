@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from ..db_routing import ReplicaRouter, _read_from_replica, read_from_replica
+from ..middleware import ReplicaRoutingMiddleware
+
+
+@patch("openvtb.utils.db_routing.get_replica_aliases", lambda: ["replica_0"])
+@patch("openvtb.utils.db_routing.get_replica_lag", return_value=0)
+class ReplicaRouterTestCase(SimpleTestCase):
+    router = ReplicaRouter()
+
+    def test_read_from_primary(self, mock_lag):
+        self.assertIsNone(self.router.db_for_read(None))
+        self.assertEqual(self.router.db_for_write(None), "default")
+
+    def test_read_from_replica(self, mock_lag):
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_read(None), "replica_0")
+            self.assertEqual(self.router.db_for_write(None), "default")
+
+    def test_replica_lagging(self, mock_lag):
+        mock_lag.return_value = 60
+
+        with read_from_replica():
+            self.assertIsNone(self.router.db_for_read(None))
+
+
+@patch("openvtb.utils.middleware.get_replica_aliases", lambda: ["replica_0"])
+class ReplicaRoutingMiddlewareTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.read_from_replica = []
+
+        def get_response(request):
+            self.read_from_replica.append(_read_from_replica.get())
+            return HttpResponse()
+
+        self.middleware = ReplicaRoutingMiddleware(get_response)
+        self.factory = RequestFactory()
+
+    def test_read_only_requests(self):
+        self.middleware(self.factory.get("/", headers={"Authorization": "Token 1"}))
+        # not an API client
+        self.middleware(self.factory.get("/"))
+
+        self.assertEqual(self.read_from_replica, [True, False])
+
+    def test_read_your_writes(self):
+        self.middleware(self.factory.post("/", headers={"Authorization": "Token 1"}))
+        self.middleware(self.factory.get("/", headers={"Authorization": "Token 1"}))
+        self.middleware(self.factory.get("/", headers={"Authorization": "Token 2"}))
+
+        self.assertEqual(self.read_from_replica, [False, False, True])
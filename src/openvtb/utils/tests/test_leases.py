@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from freezegun import freeze_time
+
+from ..leases import Lease, LeaseLost, job_lease
+from ..models import JobLease
+
+
+class JobLeaseTestCase(TestCase):
+    def test_single_run(self):
+        with job_lease("job") as lease:
+            self.assertIsNotNone(lease)
+
+            with job_lease("job") as other_lease:
+                self.assertIsNone(other_lease)
+
+        with job_lease("job") as lease:
+            self.assertIsNotNone(lease)
+
+    def test_resume_from_checkpoint(self):
+        with self.assertRaises(ValueError):
+            with job_lease("job") as lease:
+                lease.save_checkpoint(last_id=10)
+                raise ValueError
+
+        with job_lease("job") as lease:
+            self.assertEqual(lease.checkpoint, {"last_id": 10})
+
+        # a finished run starts all over again
+        with job_lease("job") as lease:
+            self.assertEqual(lease.checkpoint, {})
+
+    def test_crashed_run(self):
+        crashed = Lease("job", duration=60)
+        self.assertTrue(crashed.acquire())
+        crashed.save_checkpoint(last_id=10)
+
+        with job_lease("job") as lease:
+            self.assertIsNone(lease)
+
+        with freeze_time(timezone.now() + timedelta(seconds=61)):
+            with job_lease("job") as lease:
+                self.assertEqual(lease.checkpoint, {"last_id": 10})
+
+                with self.assertRaises(LeaseLost):
+                    crashed.save_checkpoint(last_id=20)
+
+        self.assertEqual(JobLease.objects.get().checkpoint, {})
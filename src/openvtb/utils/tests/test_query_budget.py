@@ -0,0 +1,104 @@
+from django.db import connection, connections, transaction
+from django.test import override_settings
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from openvtb.components.taken.tests.factories import ExterneTaakFactory
+from openvtb.components.verzoeken.api.viewsets import VerzoekViewSet
+from openvtb.utils.api_testcase import APITestCase
+
+from ..query_budget import QueryBudget, get_statement_timeout
+
+
+def get_statement_timeout_setting() -> str:
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW statement_timeout")
+        return cursor.fetchone()[0]
+
+
+@override_settings(
+    API_STATEMENT_TIMEOUTS={"list": 5.0, "detail": 2.0, "write": 3.0, "export": 30.0},
+)
+class StatementTimeoutTests(APITestCase):
+    def test_statement_timeout_per_action(self):
+        self.assertEqual(get_statement_timeout(VerzoekViewSet, "list"), 5.0)
+        self.assertEqual(get_statement_timeout(VerzoekViewSet, "retrieve"), 2.0)
+        self.assertEqual(get_statement_timeout(VerzoekViewSet, "create"), 3.0)
+        self.assertEqual(get_statement_timeout(VerzoekViewSet, "update"), 3.0)
+        self.assertEqual(get_statement_timeout(VerzoekViewSet, "partial_update"), 3.0)
+        self.assertEqual(get_statement_timeout(VerzoekViewSet, "destroy"), 3.0)
+        self.assertEqual(get_statement_timeout(VerzoekViewSet, "tiles"), 30.0)
+
+    def test_statement_timeout_is_reset(self):
+        before = get_statement_timeout_setting()
+
+        response = self.client.get(reverse("taken:externetaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(get_statement_timeout_setting(), before)
+
+    def test_statement_timeout_after_rollback(self):
+        budget = QueryBudget()
+        budget.start("test", 2.0, connections)
+        try:
+            with connection.execute_wrapper(budget):
+                with self.assertRaises(ValueError), transaction.atomic():
+                    self.assertEqual(get_statement_timeout_setting(), "2s")
+                    raise ValueError()
+
+                # the rollback reverted the timeout, so it is set again
+                self.assertEqual(get_statement_timeout_setting(), "2s")
+        finally:
+            budget.finish(connections)
+
+    @override_settings(
+        API_STATEMENT_TIMEOUTS={
+            "list": 0.01,
+            "detail": 2.0,
+            "write": 3.0,
+            "export": 30.0,
+        }
+    )
+    def test_statement_timeout_exceeded(self):
+        def slow_query(execute, sql, params, many, context):
+            execute("SELECT pg_sleep(0.1)", None, False, context)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(slow_query):
+            response = self.client.get(reverse("taken:externetaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.json()["code"], "query-timeout")
+
+
+class QueryBudgetTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        ExterneTaakFactory.create_batch(2, betaaltaak=True)
+
+    @override_settings(API_QUERY_BUDGET_COUNT=1, API_QUERY_BUDGET_STRICT=False)
+    def test_budget_exceeded_is_logged(self):
+        with self.assertLogs("openvtb.utils.query_budget", "WARNING") as logs:
+            response = self.client.get(reverse("taken:externetaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("query_budget_exceeded", logs.output[0])
+        self.assertIn("ExterneTaakViewSet.list", logs.output[0])
+
+    @override_settings(API_QUERY_BUDGET_COUNT=1, API_QUERY_BUDGET_STRICT=True)
+    def test_budget_exceeded_strict(self):
+        response = self.client.get(reverse("taken:externetaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.json()["code"], "query-budget-exceeded")
+
+    @override_settings(
+        API_QUERY_BUDGET_COUNT=100,
+        API_QUERY_BUDGET_DURATION=0,
+        API_QUERY_BUDGET_STRICT=True,
+    )
+    def test_within_budget(self):
+        response = self.client.get(reverse("taken:externetaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
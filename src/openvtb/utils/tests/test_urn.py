@@ -0,0 +1,110 @@
+import re
+
+from django.test import SimpleTestCase
+
+from hypothesis import given, settings, strategies as st
+
+from openvtb.utils.urn import URN, InvalidURN, parse_urn
+
+# The regular expression that was used by ``URNValidator`` before the parser was
+# introduced, used as reference implementation of RFC 8141.
+HEXDIG = r"[0-9A-Fa-f]"
+ALPHANUM = r"[A-Za-z0-9]"
+PCHAR = rf"(?:{ALPHANUM}|[-._~]|%{HEXDIG}{HEXDIG}|[!$&'()*+,;=]|[:@])"
+NID = rf"{ALPHANUM}(?:{ALPHANUM}|-){{0,30}}{ALPHANUM}"
+NSS = rf"{PCHAR}(?:{PCHAR}|/)*"
+RQ_COMPONENTS = rf"(?:\?\+{PCHAR}(?:{PCHAR}|/|\?)*)?(?:\?={PCHAR}(?:{PCHAR}|/|\?)*)?"
+F_COMPONENT = rf"{PCHAR}(?:{PCHAR}|/|\?)*"
+REFERENCE_PATTERN = re.compile(rf"urn:{NID}:{NSS}{RQ_COMPONENTS}(?:#{F_COMPONENT})?")
+
+# characters with a meaning in the URN syntax, and some that are never allowed
+URN_ALPHABET = st.sampled_from(list("aZ09-._~!$&'()*+,;=:@/?#%Fg \n^"))
+urn_like = st.one_of(
+    st.text(URN_ALPHABET, max_size=50).map(lambda value: f"urn:{value}"),
+    st.text(URN_ALPHABET, max_size=50).map(lambda value: f"urn:nid:{value}"),
+    st.text(max_size=50),
+)
+
+
+def is_valid(value: str) -> bool:
+    try:
+        parse_urn(value)
+    except InvalidURN:
+        return False
+    return True
+
+
+class ParseURNPropertyTests(SimpleTestCase):
+    @settings(max_examples=2000)
+    @given(urn_like)
+    def test_equivalent_to_reference_pattern(self, value):
+        # ``fullmatch`` is used, because ``$`` also matches before a trailing
+        # newline, which is not a valid URN
+        self.assertEqual(
+            is_valid(value), bool(REFERENCE_PATTERN.fullmatch(value)), repr(value)
+        )
+
+    @settings(max_examples=500)
+    @given(st.from_regex(REFERENCE_PATTERN, fullmatch=True))
+    def test_valid_urns_roundtrip(self, value):
+        urn = parse_urn(value)
+
+        roundtrip = urn.assigned_name
+        if urn.r_component is not None:
+            roundtrip += f"?+{urn.r_component}"
+        if urn.q_component is not None:
+            roundtrip += f"?={urn.q_component}"
+        if urn.f_component is not None:
+            roundtrip += f"#{urn.f_component}"
+        self.assertEqual(roundtrip, value)
+
+
+class ParseURNTests(SimpleTestCase):
+    def test_parse_assigned_name(self):
+        self.assertEqual(
+            parse_urn("urn:maykin:abc:ztc:zaak:d42613cd-ee22-4455-808c-c19c7b8442a1"),
+            URN(nid="maykin", nss="abc:ztc:zaak:d42613cd-ee22-4455-808c-c19c7b8442a1"),
+        )
+
+    def test_parse_components(self):
+        self.assertEqual(
+            parse_urn("urn:example:document/123?+revision1?=query?a#section2"),
+            URN(
+                nid="example",
+                nss="document/123",
+                r_component="revision1",
+                q_component="query?a",
+                f_component="section2",
+            ),
+        )
+        self.assertEqual(
+            parse_urn("urn:example:document/123?=query"),
+            URN(nid="example", nss="document/123", q_component="query"),
+        )
+
+    def test_invalid(self):
+        invalid_urns = [
+            "",
+            "urn",
+            "URN:isbn:123",
+            "urn:isbn:123\n",
+            "urn:isbn:123#",
+            "urn:isbn:123#a#b",
+            "urn:isbn:123?",
+            "urn:isbn:123?+",
+            "urn:isbn:123?-abc",
+            "urn:isbn:%4",
+            "urn:isbn:/123",
+        ]
+        for urn in invalid_urns:
+            with self.subTest(urn=urn), self.assertRaises(InvalidURN):
+                parse_urn(urn)
+
+    def test_long_invalid_input(self):
+        # inputs like this caused excessive backtracking with the regex
+        value = "urn:nid:" + "a:" * 50_000 + " "
+
+        with self.assertRaises(InvalidURN):
+            parse_urn(value)
+
+        self.assertTrue(is_valid(value[:-1]))
@@ -1,11 +1,17 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils.translation import gettext as _
 
 from jsonschema import FormatError
 
+from openvtb.components.taken.constants import SoortTaak
+from openvtb.components.taken.schemas import SOORTTAAK_SCHEMA_MAPPING
 from openvtb.utils.validators import (
     URNValidator,
+    _compiled_schemas,
+    compile_jsonschema,
     is_valid_color,
     is_valid_decimal,
     is_valid_email,
@@ -468,3 +474,195 @@ class JSONSchemaFormatTests(TestCase):
         validate_jsonschema(
             {"uuid": "123e4567-e89b-12d3-a456-426614174000"}, SCHEMA_ALL_FORMATS
         )
+
+
+class CompiledJSONSchemaTests(TestCase):
+    schema = compile_jsonschema(
+        {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {
+                "bedrag": {"type": "string", "format": "decimal"},
+                "valuta": {"type": "string", "default": "EUR", "enum": ["EUR"]},
+                "doelrekening": {
+                    "type": "object",
+                    "properties": {"iban": {"type": "string", "format": "iban"}},
+                    "required": ["iban"],
+                },
+                "regels": {"type": "array", "items": {"type": "integer"}},
+            },
+            "required": ["bedrag"],
+        }
+    )
+
+    def test_valid(self):
+        instance = {"bedrag": "10.50", "doelrekening": {"iban": "NL12BANK34567890"}}
+
+        validate_jsonschema(instance, self.schema)
+
+        # defaults are not applied to the instance
+        self.assertEqual(
+            instance, {"bedrag": "10.50", "doelrekening": {"iban": "NL12BANK34567890"}}
+        )
+
+    def test_same_errors_as_not_compiled(self):
+        invalid_instances = [
+            {},
+            {"bedrag": 10},
+            {"bedrag": "10.505"},
+            {"bedrag": "10", "valuta": "USD"},
+            {"bedrag": "10", "doelrekening": {}},
+            {"bedrag": "10", "doelrekening": {"iban": "invalid"}},
+            {"bedrag": "10", "regels": [1, 2, "3"]},
+            {"bedrag": "10", "extra": True},
+        ]
+        for instance in invalid_instances:
+            with self.subTest(instance=instance):
+                with self.assertRaises(ValidationError) as compiled_error:
+                    validate_jsonschema(instance, self.schema, label="details")
+                with (
+                    patch.dict(_compiled_schemas, clear=True),
+                    self.assertRaises(ValidationError) as error,
+                ):
+                    validate_jsonschema(instance, self.schema, label="details")
+
+                self.assertEqual(
+                    compiled_error.exception.message_dict, error.exception.message_dict
+                )
+
+    def test_schema_changed_after_compiling(self):
+        schema = compile_jsonschema(
+            {"type": "object", "properties": {"naam": {"type": "string"}}}
+        )
+        schema["required"] = ["naam"]
+
+        with self.assertRaises(ValidationError) as error:
+            validate_jsonschema({}, schema, label="details")
+
+        self.assertEqual(
+            error.exception.message_dict,
+            {"details": ["'naam' is a required property"]},
+        )
+
+    def test_draft_202012_keywords_not_compiled(self):
+        schemas = {
+            "prefixItems": {
+                "type": "array",
+                "prefixItems": [{"type": "string"}, {"type": "integer"}],
+            },
+            "unevaluatedProperties": {
+                "type": "object",
+                "allOf": [{"properties": {"naam": {"type": "string"}}}],
+                "unevaluatedProperties": False,
+            },
+            "$ref with siblings": {
+                "$defs": {"regel": {"type": "array"}},
+                "$ref": "#/$defs/regel",
+                "maxItems": 1,
+            },
+        }
+        invalid_instances = {
+            "prefixItems": ["naam", "1"],
+            "unevaluatedProperties": {"naam": "test", "extra": True},
+            "$ref with siblings": ["a", "b"],
+        }
+        for keyword, schema in schemas.items():
+            with self.subTest(keyword=keyword):
+                compile_jsonschema(schema)
+
+                with self.assertRaises(ValidationError):
+                    validate_jsonschema(invalid_instances[keyword], schema)
+
+    def test_betaaltaak_error_path(self):
+        details = {
+            "bedrag": "10",
+            "valuta": "EUR",
+            "transactieomschrijving": "test",
+            "doelrekening": {"iban": "invalid"},
+        }
+
+        with self.assertRaises(ValidationError) as error:
+            validate_jsonschema(
+                details,
+                SOORTTAAK_SCHEMA_MAPPING[SoortTaak.BETAALTAAK],
+                label="details",
+            )
+
+        self.assertEqual(
+            error.exception.message_dict,
+            {"details.doelrekening.iban": ["'invalid' is not a valid IBAN"]},
+        )
+
+
+ERRORS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "naam": {"type": "string"},
+        "regels": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"bedrag": {"type": "string", "format": "decimal"}},
+            },
+        },
+    },
+    "required": ["naam"],
+}
+ERRORS_INSTANCE = {"regels": [{"bedrag": "1.005"}, {"bedrag": 10}]}
+
+
+class ValidateJSONSchemaErrorsTests(TestCase):
+    def test_first_error_only(self):
+        with self.assertRaises(ValidationError) as error:
+            validate_jsonschema(ERRORS_INSTANCE, ERRORS_SCHEMA, label="gegevens")
+
+        self.assertEqual(len(error.exception.message_dict), 1)
+
+    def test_all_errors(self):
+        with self.assertRaises(ValidationError) as error:
+            validate_jsonschema(
+                ERRORS_INSTANCE, ERRORS_SCHEMA, label="gegevens", all_errors=True
+            )
+
+        self.assertEqual(
+            error.exception.message_dict,
+            {
+                "gegevens": ["'naam' is a required property"],
+                "gegevens.regels.0.bedrag": ["'1.005' has more than 2 decimal places"],
+                "gegevens.regels.1.bedrag": ["10 is not of type 'string'"],
+            },
+        )
+
+    @override_settings(JSON_SCHEMA_COLLECT_ALL_ERRORS=True)
+    def test_all_errors_setting(self):
+        with self.assertRaises(ValidationError) as error:
+            validate_jsonschema(ERRORS_INSTANCE, ERRORS_SCHEMA, label="gegevens")
+
+        self.assertEqual(len(error.exception.message_dict), 3)
+
+    @patch("openvtb.utils.validators.logger")
+    def test_logging(self, mock_logger):
+        with self.assertRaises(ValidationError):
+            validate_jsonschema(
+                ERRORS_INSTANCE, ERRORS_SCHEMA, label="gegevens", all_errors=True
+            )
+
+        mock_logger.exception.assert_not_called()
+        mock_logger.info.assert_called_once_with(
+            "json_schema_validation_failed",
+            label="gegevens",
+            error_paths=[
+                "gegevens.regels.0.bedrag",
+                "gegevens.regels.1.bedrag",
+                "gegevens",
+            ],
+            sample_rate=1.0,
+        )
+
+    @override_settings(JSON_SCHEMA_ERROR_LOG_SAMPLE_RATE=0)
+    @patch("openvtb.utils.validators.logger")
+    def test_logging_sampled(self, mock_logger):
+        with self.assertRaises(ValidationError):
+            validate_jsonschema(ERRORS_INSTANCE, ERRORS_SCHEMA, label="gegevens")
+
+        mock_logger.info.assert_not_called()
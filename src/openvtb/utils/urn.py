@@ -0,0 +1,101 @@
+import re
+from dataclasses import dataclass
+
+# RFC 3986 ``pchar`` without the percent-encoded triplets
+_PCHAR = r"A-Za-z0-9\-._~!$&'()*+,;=:@"
+_PCT_ENCODED = r"%[0-9A-Fa-f]{2}"
+
+# Every alternative starts with a different character, so matching these
+# patterns never backtracks and runs in linear time.
+NID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9-]{0,30}[A-Za-z0-9]")
+NSS_PATTERN = re.compile(
+    rf"(?:[{_PCHAR}]|{_PCT_ENCODED})(?:[{_PCHAR}/]|{_PCT_ENCODED})*"
+)
+COMPONENT_PATTERN = re.compile(
+    rf"(?:[{_PCHAR}]|{_PCT_ENCODED})(?:[{_PCHAR}/?]|{_PCT_ENCODED})*"
+)
+
+
+class InvalidURN(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class URN:
+    """
+    A URN split into its RFC 8141 parts.
+
+    ``urn:<nid>:<nss>[?+<r_component>][?=<q_component>][#<f_component>]``
+    """
+
+    nid: str
+    nss: str
+    r_component: str | None = None
+    q_component: str | None = None
+    f_component: str | None = None
+
+    @property
+    def assigned_name(self) -> str:
+        return f"urn:{self.nid}:{self.nss}"
+
+
+def parse_urn(value: str) -> URN:
+    """
+    Parse a URN according to the syntax of RFC 8141 in a single pass.
+
+    The string is split on the delimiters (``:``, ``?``, ``#``) first, after
+    which every part is matched against a pattern that cannot backtrack, so the
+    parsing time is linear in the length of the input.
+
+    Args:
+        value (str): The URN to parse.
+
+    Raises:
+        InvalidURN: If the value is not a valid URN.
+
+    Returns:
+        URN: The parsed URN.
+    """
+    if not value.startswith("urn:"):
+        raise InvalidURN("URN must start with 'urn:'")
+
+    nid, separator, rest = value[4:].partition(":")
+    if not separator or not NID_PATTERN.fullmatch(nid):
+        raise InvalidURN("Invalid NID")
+
+    # "#" is not allowed in any of the components, so the first one starts the
+    # f-component
+    rest, has_f_component, f_component = rest.partition("#")
+    if has_f_component and not COMPONENT_PATTERN.fullmatch(f_component):
+        raise InvalidURN("Invalid f-component")
+
+    # "?" is not allowed in the NSS, so the first one starts the r/q-components
+    nss, has_rq_components, rq_components = rest.partition("?")
+    if not NSS_PATTERN.fullmatch(nss):
+        raise InvalidURN("Invalid NSS")
+
+    r_component = q_component = None
+    if has_rq_components:
+        if rq_components.startswith("+"):
+            r_component = rq_components[1:]
+            if not COMPONENT_PATTERN.fullmatch(r_component):
+                raise InvalidURN("Invalid r-component")
+            # "?=" is also allowed inside an r-component, so the first occurrence
+            # only starts the q-component if a valid q-component follows
+            head, separator, tail = r_component.partition("?=")
+            if separator and COMPONENT_PATTERN.fullmatch(tail):
+                r_component, q_component = head, tail
+        elif rq_components.startswith("="):
+            q_component = rq_components[1:]
+            if not COMPONENT_PATTERN.fullmatch(q_component):
+                raise InvalidURN("Invalid q-component")
+        else:
+            raise InvalidURN("'?' must be followed by '+' or '='")
+
+    return URN(
+        nid=nid,
+        nss=nss,
+        r_component=r_component,
+        q_component=q_component,
+        f_component=f_component if has_f_component else None,
+    )
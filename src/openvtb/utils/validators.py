@@ -1,14 +1,24 @@
+import hashlib
+import json
+import random
 import re
+from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
+from itertools import islice
 from typing import Any
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator
 from django.utils.deconstruct import deconstructible
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
+import fastjsonschema
 import structlog
 import webcolors
 from jsonschema import (
@@ -22,9 +32,37 @@ from rest_framework import serializers
 from openvtb.utils.api_utils import get_from_serializer_data_or_instance
 
 from .typing import JSONObject
+from .urn import InvalidURN, parse_urn
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# maximum number of errors reported by ``validate_jsonschema`` with ``all_errors``
+MAX_JSONSCHEMA_ERRORS = 100
+
+# static JSON schemas compiled by ``compile_jsonschema``, by ``get_schema_hash``
+_compiled_schemas: dict[
+    str, tuple[Callable[[JSONObject], None] | None, Draft202012Validator]
+] = {}
+
+# keywords that ``fastjsonschema`` (up to draft 7) does not support, schemas using
+# them are always validated with ``jsonschema``
+DRAFT_202012_KEYWORDS = frozenset(
+    {
+        "$anchor",
+        "$dynamicAnchor",
+        "$dynamicRef",
+        "$recursiveAnchor",
+        "$recursiveRef",
+        "dependentRequired",
+        "dependentSchemas",
+        "maxContains",
+        "minContains",
+        "prefixItems",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    }
+)
+
 FORBIDDEN_PREFIXES = (
     "0800",
     "0900",
@@ -104,33 +142,131 @@ def is_valid_iban(value: str) -> bool:
     return True
 
 
+def get_schema_hash(schema: JSONObject) -> str:
+    normalized = json.dumps(
+        schema, sort_keys=True, separators=(",", ":"), cls=DjangoJSONEncoder
+    )
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def uses_draft_202012_keywords(schema: Any) -> bool:
+    """
+    Check if the schema uses keywords that only exist since draft 2019-09, or a
+    ``$ref`` next to other keywords (which are ignored before draft 2019-09).
+    """
+    if isinstance(schema, list):
+        return any(uses_draft_202012_keywords(item) for item in schema)
+    if not isinstance(schema, dict):
+        return False
+    if not DRAFT_202012_KEYWORDS.isdisjoint(schema):
+        return True
+    if "$ref" in schema and schema.keys() - {"$ref", "$schema", "$id"}:
+        return True
+    return any(uses_draft_202012_keywords(value) for value in schema.values())
+
+
+def compile_jsonschema(schema: JSONObject) -> JSONObject:
+    """
+    Compile a static JSON schema into a specialized validation function, which is
+    used by ``validate_jsonschema`` for this schema from then on.
+
+    Schemas using keywords that the compiler does not support (see
+    ``DRAFT_202012_KEYWORDS``) are not compiled, only their ``jsonschema``
+    validator is kept.
+
+    Only use this for schemas that are defined at import time: the compiled
+    function is kept for the lifetime of the process.
+
+    Args:
+        schema (JSONObject): The JSON Schema to compile.
+
+    Returns:
+        JSONObject: The schema itself.
+    """
+    validate = None
+    if not uses_draft_202012_keywords(schema):
+        formats = {
+            name: partial(draft202012_format_checker.conforms, format=name)
+            for name in draft202012_format_checker.checkers
+        }
+        validate = fastjsonschema.compile(schema, formats=formats, use_default=False)
+
+    _compiled_schemas[get_schema_hash(schema)] = (
+        validate,
+        Draft202012Validator(schema, format_checker=draft202012_format_checker),
+    )
+    return schema
+
+
+def get_error_path(error: JSONValidationError, label: str) -> str:
+    """
+    Return the path of a JSON schema error as a dotted string, prefixed with
+    ``label`` (e.g. ``details.doelrekening.iban``).
+    """
+    path_list = [str(part) for part in error.absolute_path]
+    if label not in path_list:
+        path_list.insert(0, label)
+    return ".".join(path_list)
+
+
 def validate_jsonschema(
-    instance: JSONObject, schema: JSONObject, label: str = "instance"
+    instance: JSONObject,
+    schema: JSONObject,
+    label: str = "instance",
+    all_errors: bool | None = None,
 ) -> None:
     """
     Validator for JSONField with appropriate JSON schema.
 
+    Schemas compiled with ``compile_jsonschema`` are checked with the compiled
+    function first. Only if that fails, the instance is validated again with
+    ``jsonschema`` to report the same error (message and path) as for any other
+    schema.
+
     Args:
         instance (JSONObject): The JSON object to validate.
         schema (JSONObject): The JSON Schema to validate against.
         label (str): A label representing the root key of the instance (used in error paths).
+        all_errors (bool | None): Report all errors (up to ``MAX_JSONSCHEMA_ERRORS``)
+            instead of only the first one. Defaults to the
+            ``JSON_SCHEMA_COLLECT_ALL_ERRORS`` setting.
 
     Raises:
         ValueError: Raises a dictionary mapping the error path to the validation message.
     """
-    try:
+    if compiled := _compiled_schemas.get(get_schema_hash(schema)):
+        validate, validator = compiled
+        if validate is not None:
+            try:
+                validate(instance)
+                return
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+    else:
         validator = Draft202012Validator(
             schema, format_checker=draft202012_format_checker
         )
-        validator.validate(instance)
-    except JSONValidationError as json_error:
-        logger.exception("validate_jsonschema failed: JSON not valid")
-        path_list = [str(err) for err in getattr(json_error, "absolute_path", [])]
-        if label not in path_list:
-            path_list.insert(0, label)
-        path = ".".join(path_list)
 
-        raise ValidationError({path: json_error.message})
+    if all_errors is None:
+        all_errors = settings.JSON_SCHEMA_COLLECT_ALL_ERRORS
+    max_errors = MAX_JSONSCHEMA_ERRORS if all_errors else 1
+
+    errors: dict[str, list[str]] = defaultdict(list)
+    for error in islice(validator.iter_errors(instance), max_errors):
+        errors[get_error_path(error, label)].append(error.message)
+
+    if not errors:
+        return
+
+    if random.random() < settings.JSON_SCHEMA_ERROR_LOG_SAMPLE_RATE:
+        logger.info(
+            "json_schema_validation_failed",
+            label=label,
+            error_paths=list(errors),
+            sample_rate=settings.JSON_SCHEMA_ERROR_LOG_SAMPLE_RATE,
+        )
+
+    raise ValidationError(dict(errors))
 
 
 def validate_charfield_entry(value: str, allow_apostrophe: bool = False) -> str:
@@ -278,7 +414,7 @@ validate_iban = CustomRegexValidator(
 
 
 @deconstructible
-class URNValidator(RegexValidator):
+class URNValidator:
     """
     The basic syntax for a URN is defined using the
     Augmented Backus-Naur Form (ABNF) as specified in [RFC5234].
@@ -318,27 +454,10 @@ class URNValidator(RegexValidator):
     error by URN-specific parsers and other processors.
 
     https://datatracker.ietf.org/doc/html/rfc8141
-    """
-
-    HEXDIG = r"[0-9A-Fa-f]"
-    ALPHANUM = r"[A-Za-z0-9]"
-    pchar = rf"(?:{ALPHANUM}|[-._~]|%{HEXDIG}{HEXDIG}|[!$&'()*+,;=]|[:@])"
 
-    # assigned-name
-    NID = rf"{ALPHANUM}(?:{ALPHANUM}|-){{0,30}}{ALPHANUM}"
-    NSS = rf"{pchar}(?:{pchar}|/)*"
-    assigned_name = rf"urn:{NID}:{NSS}"
-
-    # optional r/q components
-    rq_components = (
-        rf"(?:\?\+{pchar}(?:{pchar}|/|\?)*)?(?:\?={pchar}(?:{pchar}|/|\?)*)?"
-    )
-
-    # optional f-component
-    f_component = rf"{pchar}(?:{pchar}|/|\?)*"
-
-    # complete URN regex (RFC 8141)
-    urn_pattern = rf"^{assigned_name}{rq_components}(?:#{f_component})?$"
+    The URN is validated with :func:`openvtb.utils.urn.parse_urn`, which runs in
+    linear time, instead of a (backtracking) regular expression.
+    """
 
     message = (
         "Enter a valid URN. Correct format: 'urn:<namespace>:<resource>' "
@@ -346,9 +465,15 @@ class URNValidator(RegexValidator):
     )
     code = "invalid_urn"
 
-    def __init__(self):
-        super().__init__(
-            regex=re.compile(self.urn_pattern),
-            message=self.message,
-            code=self.code,
+    def __call__(self, value: Any) -> None:
+        try:
+            parse_urn(force_str(value))
+        except InvalidURN:
+            raise ValidationError(self.message, code=self.code, params={"value": value})
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, URNValidator)
+            and self.message == other.message
+            and self.code == other.code
         )